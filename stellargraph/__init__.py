@@ -26,6 +26,8 @@ __all__ = [
     "utils",
     "StellarDiGraph",
     "StellarGraph",
+    "IndexedArray",
+    "QuantisedArray",
     "__version__",
 ]
 
@@ -38,6 +40,8 @@ from stellargraph import mapper, layer, utils
 # Top-level imports
 from stellargraph.core.graph import StellarGraph, StellarDiGraph
 from stellargraph.core.schema import GraphSchema
+from stellargraph.core.indexed_array import IndexedArray
+from stellargraph.core.quantised_array import QuantisedArray
 from stellargraph.utils.calibration import TemperatureCalibration, IsotonicCalibration
 from stellargraph.utils.calibration import (
     plot_reliability_diagram,
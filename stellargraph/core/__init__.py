@@ -21,3 +21,6 @@ This contains the core objects used by the StellarGraph library.
 
 from .graph import *
 from .schema import *
+from .indexed_array import *
+from .quantised_array import *
+from .feature_store import *
@@ -0,0 +1,1224 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright 2020 Data61, CSIRO
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Compact, array-based storage for the nodes and edges of a graph.
+
+Elements are identified by their "iloc": their integer position in the storage. The external IDs
+(the arbitrary hashable node IDs a user supplies) are translated to and from ilocs in bulk by
+:class:`ExternalIdIndex`.
+"""
+__all__ = [
+    "ExternalIdIndex",
+    "NodeData",
+    "EdgeData",
+    "EdgeTypeAdjacency",
+    "gather_rows",
+]
+
+import numpy as np
+import pandas as pd
+import scipy.sparse as sps
+
+from .quantised_array import QuantisedArray
+from .schema import EdgeType, GraphSchema
+
+
+def _smallest_index_dtype(size):
+    """
+    The smallest signed integer dtype that can hold every iloc of a collection with ``size``
+    elements, along with the -1 sentinel used for "missing".
+    """
+    return np.int32 if size < np.iinfo(np.int32).max else np.int64
+
+
+def _as_id_array(ids):
+    """
+    Convert an arbitrary collection of IDs to a NumPy array, to avoid pandas doing slower
+    per-element inference. Numeric IDs become a numeric array; anything else (strings, tuples,
+    mixtures) is kept as Python objects, so that, for instance, 1 and "1" remain distinct.
+    """
+    ids = list(ids)
+    try:
+        arr = np.asarray(ids)
+        if arr.ndim == 1 and arr.dtype.kind in "iufb":
+            return arr
+    except ValueError:
+        # ragged sequences, like tuples of different lengths
+        pass
+
+    arr = np.empty(len(ids), dtype=object)
+    arr[:] = ids
+    return arr
+
+
+def gather_rows(array, rows):
+    """
+    Select the given rows of a 2D feature array, where a row equal to ``len(array)`` (one past
+    the end) selects a row of zeros, which is used for missing (``None``) nodes.
+
+    Memory-mapped arrays are never read in full by this: only the selected rows are copied, and
+    selecting every row in order returns the array itself.
+
+    Args:
+        array (numpy.ndarray or scipy.sparse.csr_matrix): the features, one row per node
+        rows (array of int): the rows to select
+
+    Returns:
+        A 2D NumPy array (or a SciPy CSR matrix, for sparse features) with one row for each of
+        ``rows``.
+    """
+    rows = np.asarray(rows, dtype=np.int64)
+    num_rows = array.shape[0]
+
+    if (
+        isinstance(array, np.memmap)
+        and len(rows) == num_rows
+        and np.array_equal(rows, np.arange(num_rows))
+    ):
+        return array
+
+    is_none = rows == num_rows
+    if not is_none.any():
+        return array[rows]
+
+    if sps.issparse(array):
+        if num_rows == 0:
+            return sps.csr_matrix((len(rows), array.shape[1]), dtype=array.dtype)
+        # zero the rows by scaling, rather than assigning into the sparse structure
+        selected = array[np.where(is_none, 0, rows)]
+        return sps.diags((~is_none).astype(array.dtype)) @ selected
+
+    if num_rows == 0:
+        return np.zeros((len(rows),) + array.shape[1:], dtype=array.dtype)
+
+    result = array[np.where(is_none, 0, rows)]
+    result[is_none] = 0
+    return result
+
+
+def _index_array(indices, size):
+    """
+    Convert a collection of integer node indices (ilocs), where some may be ``None``, to an
+    array of ilocs where both ``None`` and any index outside ``[0, size)`` become -1.
+
+    Returns:
+        A tuple of the array of ilocs, and a boolean mask of which elements were ``None``.
+    """
+    if isinstance(indices, np.ndarray) and indices.dtype.kind in "iu":
+        ilocs = indices.astype(np.int64)
+        is_none = np.zeros(len(ilocs), dtype=bool)
+    else:
+        is_none = np.array([i is None for i in indices], dtype=bool)
+        ilocs = np.array([-1 if i is None else i for i in indices], dtype=np.int64)
+
+    ilocs[(ilocs < 0) | (ilocs >= size)] = -1
+    return ilocs, is_none
+
+
+def _type_codes(values, default):
+    """
+    Factorize the (possibly missing) type of each element into integer codes, with the types
+    sorted for determinism.
+    """
+    values = pd.Series(np.asarray(values, dtype=object)).fillna(default)
+    codes, uniques = pd.factorize(values, sort=False)
+    if len(uniques) == 0:
+        return np.empty(0, dtype=np.int32), []
+
+    order = sorted(range(len(uniques)), key=lambda i: str(uniques[i]))
+    renumber = np.empty(len(uniques), dtype=np.int32)
+    renumber[order] = np.arange(len(uniques), dtype=np.int32)
+    return renumber[codes], [uniques[i] for i in order]
+
+
+def _ids_to_array(ids):
+    """
+    Convert an array of IDs to one that can be saved with ``numpy.save``, preferring a native
+    (non-pickled) dtype.
+    """
+    if ids.dtype == object and all(isinstance(i, str) for i in ids):
+        return ids.astype(str)
+    return ids
+
+
+class ExternalIdIndex:
+    """
+    A bidirectional mapping between external IDs and contiguous integer ilocs.
+
+    Args:
+        ids (iterable): the external IDs, in iloc order; these must be unique.
+    """
+
+    def __init__(self, ids):
+        self._index = pd.Index(ids)
+        if not self._index.is_unique:
+            duplicated = self._index[self._index.duplicated()].unique()
+            raise ValueError(
+                f"expected IDs to appear once, found some that appeared more: {list(duplicated)}"
+            )
+        self.dtype = _smallest_index_dtype(len(self._index))
+
+    def __len__(self):
+        return len(self._index)
+
+    @property
+    def pandas_index(self):
+        """
+        The external IDs as a ``pandas.Index``, in iloc order.
+        """
+        return self._index
+
+    def contains_external(self, id):
+        """
+        Whether the external ID ``id`` is in this index.
+        """
+        return id in self._index
+
+    def to_iloc(self, ids, strict=False):
+        """
+        Convert external IDs to ilocs, in bulk.
+
+        Args:
+            ids (iterable): the external IDs to convert
+            strict (bool): if True, raise a KeyError if any of the IDs are unknown, otherwise
+                unknown IDs are mapped to -1.
+
+        Returns:
+            A NumPy array of ilocs, one per ID.
+        """
+        if not isinstance(ids, (np.ndarray, pd.Index)):
+            ids = _as_id_array(ids)
+        if len(ids) == 0:
+            return np.empty(0, dtype=self.dtype)
+
+        ilocs = self._index.get_indexer(ids).astype(self.dtype, copy=False)
+        if strict:
+            missing = ilocs < 0
+            if missing.any():
+                unknown = list(np.asarray(ids, dtype=object)[missing])
+                raise KeyError(f"unknown IDs: {unknown}")
+        return ilocs
+
+    def to_single_iloc(self, id):
+        """
+        Convert a single external ID to its iloc, or -1 if it is unknown.
+
+        This avoids the overhead of the bulk :meth:`to_iloc` for lookups of one ID at a time.
+        """
+        try:
+            return self._index.get_loc(id)
+        except (KeyError, TypeError):
+            return -1
+
+    def from_iloc(self, ilocs, strict=False):
+        """
+        Convert ilocs to external IDs, in bulk.
+
+        Args:
+            ilocs (array of int): the ilocs to convert
+            strict (bool): if True, raise an IndexError if any of the ilocs are outside
+                ``[0, len(self))``, rather than relying on NumPy's indexing (where, for
+                instance, -1 is the last element).
+
+        Returns:
+            A NumPy array of external IDs, one per iloc.
+        """
+        ilocs = np.asarray(ilocs)
+        if len(ilocs) == 0:
+            # an empty list would otherwise be a float array, which can't be used for indexing
+            ilocs = ilocs.astype(np.int64)
+
+        if strict:
+            invalid = (ilocs < 0) | (ilocs >= len(self._index))
+            if invalid.any():
+                raise IndexError(
+                    f"expected node indices in the range [0, {len(self._index)}), found: {list(ilocs[invalid])}"
+                )
+        return self._index.values[ilocs]
+
+
+class NodeData:
+    """
+    The nodes of a graph, along with their types and features.
+
+    Args:
+        ids (ExternalIdIndex): the node IDs
+        type_codes (array of int): the type of each node, as an index into ``types``
+        types (list): the node type names
+        features (dict): a dictionary of node type -> 2D NumPy array, where each array has one
+            row per feature vector; these may be memory-mapped, and are only read with
+            :func:`gather_rows`
+        feature_rows (array of int): the row of each node in the feature array for its type,
+            or -1 if the node has no features
+
+    Graphs built from DataFrames or NetworkX store the nodes grouped contiguously by type, in
+    the order of ``types``. In that case, the nodes of each type are a range of ilocs (see
+    :meth:`type_ranges`), and usually the feature row of a node is just its offset into that
+    range (see :meth:`feature_row_offset`), so the type and feature row of a node can be found
+    by comparing and subtracting, rather than by looking up ``type_codes`` and
+    ``feature_rows``.
+    """
+
+    def __init__(self, ids, type_codes, types, features, feature_rows):
+        self.ids = ids
+        self.type_codes = np.asarray(type_codes)
+        self.types = list(types)
+        self.features = features
+        self.feature_rows = np.asarray(feature_rows)
+
+        self._type_index = {ty: code for code, ty in enumerate(self.types)}
+
+        # computed on first use, so that memory-mapped arrays aren't read when loading
+        self._type_ranges = None
+        self._feature_row_offsets = None
+
+    def __len__(self):
+        return len(self.ids)
+
+    def type_code(self, node_type):
+        """
+        The integer code for ``node_type``, or None if there's no such type.
+        """
+        return self._type_index.get(node_type)
+
+    def type_of_iloc(self, ilocs):
+        """
+        The type names of the nodes at the given ilocs, as a NumPy array.
+        """
+        return np.asarray(self.types, dtype=object)[self.type_codes[ilocs]]
+
+    def type_ranges(self):
+        """
+        If the nodes are grouped contiguously by type, in the order of ``types``, the offsets of
+        each type's range of ilocs: the nodes of type code ``c`` are the ilocs
+        ``offsets[c]:offsets[c + 1]``. Otherwise (for instance, after adding nodes of a type
+        that isn't the last one), None.
+        """
+        if self._type_ranges is None:
+            codes = self.type_codes
+            if len(codes) > 0 and (codes[1:] < codes[:-1]).any():
+                self._type_ranges = False
+            else:
+                self._type_ranges = _csr_offsets(codes, len(self.types))
+
+        return self._type_ranges if self._type_ranges is not False else None
+
+    def feature_row_offset(self, type_code):
+        """
+        If the nodes are grouped by type (see :meth:`type_ranges`), and the node with iloc ``i``
+        of type code ``type_code`` has feature row ``i - offset`` for every node of that type,
+        the ``offset``. Otherwise, None.
+        """
+        ranges = self.type_ranges()
+        if ranges is None:
+            return None
+
+        if self._feature_row_offsets is None:
+            self._feature_row_offsets = {}
+            for code, node_type in enumerate(self.types):
+                start, end = ranges[code], ranges[code + 1]
+                if node_type in self.features and np.array_equal(
+                    self.feature_rows[start:end], np.arange(end - start)
+                ):
+                    self._feature_row_offsets[code] = start
+
+        return self._feature_row_offsets.get(type_code)
+
+    def codes_of_ilocs(self, ilocs):
+        """
+        The unique type codes of the nodes at the given (valid) ilocs, sorted.
+        """
+        ranges = self.type_ranges()
+        if ranges is None:
+            return np.unique(self.type_codes[ilocs])
+
+        # the nodes are all of one type if their ilocs are all in the same range, which can be
+        # checked with just the smallest and largest
+        ilocs = np.asarray(ilocs)
+        if len(ilocs) == 0:
+            return np.empty(0, dtype=self.type_codes.dtype)
+        bounds = np.searchsorted(ranges, [ilocs.min(), ilocs.max()], side="right") - 1
+        if bounds[0] == bounds[1]:
+            return bounds[:1]
+        return np.unique(self.type_codes[ilocs])
+
+
+class EdgeData:
+    """
+    The edges of a graph, stored as parallel arrays along with compressed sparse row (CSR) and
+    compressed sparse column (CSC) indices for fast in- and out-neighbour lookups.
+
+    Each edge is identified by its position in the ``sources``/``targets`` arrays.
+
+    Args:
+        sources (array of int): the source node iloc of each edge
+        targets (array of int): the target node iloc of each edge
+        type_codes (array of int): the type of each edge, as an index into ``types``
+        types (list): the edge type names
+        weights (array of float, optional): the weight of each edge
+        number_of_nodes (int): the number of nodes in the graph
+        csr_indices (tuple of arrays, optional): the ``(out_offsets, out_edges, in_offsets,
+            in_edges)`` computed previously for these edges (for instance, when loading a saved
+            graph); if not specified, these are computed from ``sources`` and ``targets``.
+        features (dict, optional): a dictionary of edge type -> 2D NumPy array of edge features,
+            like the node features of :class:`NodeData`
+        feature_rows (array of int, optional): the row of each edge in the feature array for
+            its type, or -1 if the edge has no features; this should be specified if and only if
+            there are ``features``.
+    """
+
+    def __init__(
+        self,
+        sources,
+        targets,
+        type_codes,
+        types,
+        weights,
+        number_of_nodes,
+        csr_indices=None,
+        features=None,
+        feature_rows=None,
+    ):
+        self.sources = np.asarray(sources)
+        self.targets = np.asarray(targets)
+        self.type_codes = np.asarray(type_codes)
+        self.types = list(types)
+        self.weights = None if weights is None else np.asarray(weights)
+        self.features = {} if features is None else features
+        self.feature_rows = None if feature_rows is None else np.asarray(feature_rows)
+
+        self._type_index = {ty: code for code, ty in enumerate(self.types)}
+
+        self.number_of_nodes = number_of_nodes
+        if csr_indices is None:
+            self.out_offsets, self.out_edges = _csr_index(self.sources, number_of_nodes)
+            self.in_offsets, self.in_edges = _csr_index(self.targets, number_of_nodes)
+        else:
+            (
+                self.out_offsets,
+                self.out_edges,
+                self.in_offsets,
+                self.in_edges,
+            ) = csr_indices
+
+        # indices grouped by (node, edge type), built on first use
+        self._typed_indices = {}
+
+    def __len__(self):
+        return len(self.sources)
+
+    def type_code(self, edge_type):
+        """
+        The integer code for ``edge_type``, or None if there's no such type.
+        """
+        return self._type_index.get(edge_type)
+
+    def _typed_index(self, direction):
+        """
+        The edges of each node sorted by type code, along with those type codes, so that the
+        edges of a single node and type are a contiguous run within the node's slice of the
+        usual CSR offsets (found with a binary search). This takes two arrays the size of the
+        number of edges, and no more offsets, however many types there are.
+        """
+        index = self._typed_indices.get(direction)
+        if index is None:
+            keys = self.sources if direction == "out" else self.targets
+            # sort by node and then by type, keeping ties in order of edge iloc, like the
+            # untyped index
+            edges = np.lexsort((self.type_codes, keys)).astype(
+                _smallest_index_dtype(len(keys)), copy=False
+            )
+            index = (edges, self.type_codes[edges])
+            self._typed_indices[direction] = index
+        return index
+
+    def _edge_ilocs(self, node_iloc, type_codes, direction):
+        if direction == "out":
+            offsets, edges = self.out_offsets, self.out_edges
+        else:
+            offsets, edges = self.in_offsets, self.in_edges
+        start, end = offsets[node_iloc], offsets[node_iloc + 1]
+        if type_codes is None:
+            return edges[start:end]
+
+        typed_edges, typed_codes = self._typed_index(direction)
+        node_codes = typed_codes[start:end]
+        slices = [
+            typed_edges[start + lo : start + hi]
+            for lo, hi in zip(
+                np.searchsorted(node_codes, type_codes, side="left"),
+                np.searchsorted(node_codes, type_codes, side="right"),
+            )
+        ]
+        if len(slices) == 1:
+            return slices[0]
+        if len(slices) == 0:
+            return edges[:0]
+        # the edges of several types are in order of edge iloc, like without filtering
+        return np.sort(np.concatenate(slices))
+
+    def out_edge_ilocs(self, node_iloc, type_codes=None):
+        """
+        The edges with ``node_iloc`` as their source.
+
+        Args:
+            node_iloc (int): the source node
+            type_codes (list of int, optional): if specified, only edges with one of these types
+                are included, in the same order as without this filter.
+        """
+        return self._edge_ilocs(node_iloc, type_codes, "out")
+
+    def in_edge_ilocs(self, node_iloc, type_codes=None):
+        """
+        The edges with ``node_iloc`` as their target.
+
+        Args:
+            node_iloc (int): the target node
+            type_codes (list of int, optional): if specified, only edges with one of these types
+                are included, in the same order as without this filter.
+        """
+        return self._edge_ilocs(node_iloc, type_codes, "in")
+
+    def type_codes_of(self, edge_types):
+        """
+        The sorted unique integer codes of the known types among ``edge_types``.
+        """
+        codes = {self._type_index.get(et) for et in edge_types}
+        codes.discard(None)
+        return sorted(codes)
+
+    def append(
+        self,
+        sources,
+        targets,
+        type_values,
+        weights,
+        number_of_nodes,
+        default_type,
+        feature_chunks=None,
+    ):
+        """
+        Create a new EdgeData with some edges added after the existing ones, which keep their
+        ilocs. The CSR indices are extended by inserting the new edges, rather than re-sorting
+        every edge.
+
+        Args:
+            sources (array of int): the source node iloc of each new edge
+            targets (array of int): the target node iloc of each new edge
+            type_values (array): the type of each new edge, where missing types are
+                ``default_type``
+            weights (array of float, optional): the weight of each new edge; if either the
+                existing or new edges have weights and the other doesn't, the missing weights are
+                NaN
+            number_of_nodes (int): the number of nodes in the graph, which may have increased
+            default_type (hashable): the type of new edges without one
+            feature_chunks (list, optional): the features of the new edges, as for
+                :func:`_group_features`; the features of each type are added after the existing
+                ones of that type, which must have the same size
+
+        Returns:
+            A new EdgeData.
+        """
+        sources = np.asarray(sources)
+        targets = np.asarray(targets)
+        new_codes, types, remap = _extend_type_codes(
+            self.types, type_values, default_type
+        )
+
+        if self.weights is None and weights is None:
+            all_weights = None
+        else:
+
+            def weights_or_nan(w, size):
+                return np.full(size, np.nan) if w is None else np.asarray(w)
+
+            all_weights = np.concatenate(
+                [
+                    weights_or_nan(self.weights, len(self)),
+                    weights_or_nan(weights, len(sources)),
+                ]
+            )
+
+        first = len(self)
+        out_offsets, out_edges = _csr_append(
+            self.out_offsets, self.out_edges, sources, first, number_of_nodes
+        )
+        in_offsets, in_edges = _csr_append(
+            self.in_offsets, self.in_edges, targets, first, number_of_nodes
+        )
+
+        features, feature_rows = _append_features(
+            self.features,
+            self.feature_rows,
+            len(self),
+            *_group_features(feature_chunks or [], new_codes, types, "edges"),
+            new_codes,
+            types,
+        )
+
+        dtype = _smallest_index_dtype(number_of_nodes)
+        return EdgeData(
+            np.concatenate([self.sources, sources]).astype(dtype, copy=False),
+            np.concatenate([self.targets, targets]).astype(dtype, copy=False),
+            np.concatenate([remap[self.type_codes], new_codes]),
+            types,
+            all_weights,
+            number_of_nodes,
+            csr_indices=(out_offsets, out_edges, in_offsets, in_edges),
+            features=features,
+            feature_rows=feature_rows,
+        )
+
+    def remove(self, keep):
+        """
+        Create a new EdgeData with only some of the edges, which are renumbered to be contiguous
+        in their existing order. The CSR indices are filtered rather than rebuilt.
+
+        Args:
+            keep (array of bool): whether each edge is kept
+
+        Returns:
+            A new EdgeData.
+        """
+        out_offsets, out_edges = _csr_remove(
+            self.out_offsets, self.out_edges, self.sources, keep
+        )
+        in_offsets, in_edges = _csr_remove(
+            self.in_offsets, self.in_edges, self.targets, keep
+        )
+        features, feature_rows = self.select_features(np.flatnonzero(keep))
+        return EdgeData(
+            self.sources[keep],
+            self.targets[keep],
+            self.type_codes[keep],
+            self.types,
+            None if self.weights is None else self.weights[keep],
+            self.number_of_nodes,
+            csr_indices=(out_offsets, out_edges, in_offsets, in_edges),
+            features=features,
+            feature_rows=feature_rows,
+        )
+
+    def select_features(self, edge_ilocs):
+        """
+        The features of some of the edges, as the ``features`` and ``feature_rows`` arguments
+        for a new EdgeData containing only those edges (in the order given).
+        """
+        if self.feature_rows is None:
+            return {}, None
+        return _select_features(
+            self.features, self.feature_rows, self.type_codes, self.types, edge_ilocs
+        )
+
+    def induced_edges(self, node_ilocs):
+        """
+        The edges with both endpoints among ``node_ilocs``, found by slicing the out-edge CSR
+        index of those nodes, so this takes time proportional to the number of their out-edges
+        rather than the number of edges in the graph.
+
+        Args:
+            node_ilocs (array of int): the unique ilocs of the selected nodes
+
+        Returns:
+            A tuple of the edge ilocs, and the positions of their sources and targets within
+            ``node_ilocs``.
+        """
+        node_ilocs = np.asarray(node_ilocs, dtype=np.int64)
+        order = np.argsort(node_ilocs, kind="stable")
+        sorted_ilocs = node_ilocs[order]
+        if np.any(sorted_ilocs[1:] == sorted_ilocs[:-1]):
+            raise ValueError("nodes: expected unique nodes, found duplicates")
+
+        starts = self.out_offsets[node_ilocs]
+        counts = self.out_offsets[node_ilocs + 1] - starts
+        edge_ilocs = self.out_edges[_ranges(starts, counts)]
+        local_sources = np.repeat(np.arange(len(node_ilocs)), counts)
+
+        if len(sorted_ilocs) == 0:
+            return edge_ilocs, local_sources, local_sources
+
+        # find each target among the selected nodes, dropping the edges that leave the selection
+        targets = self.targets[edge_ilocs]
+        positions = np.minimum(
+            np.searchsorted(sorted_ilocs, targets), len(sorted_ilocs) - 1
+        )
+        inside = sorted_ilocs[positions] == targets
+        return (
+            edge_ilocs[inside],
+            local_sources[inside],
+            order[positions[inside]],
+        )
+
+    def neighbour_ilocs(self, node_ilocs):
+        """
+        The in- and out-neighbours of every one of ``node_ilocs``, gathered by slicing the CSR
+        indices for all of them at once.
+
+        Returns:
+            A tuple of the position within ``node_ilocs`` of the node that each neighbour belongs
+            to, and the neighbour ilocs.
+        """
+        node_ilocs = np.asarray(node_ilocs, dtype=np.int64)
+        positions = np.arange(len(node_ilocs))
+
+        def gather(offsets, edges, others):
+            starts = offsets[node_ilocs]
+            counts = offsets[node_ilocs + 1] - starts
+            return (
+                np.repeat(positions, counts),
+                others[edges[_ranges(starts, counts)]],
+            )
+
+        out_owners, out_neighbours = gather(
+            self.out_offsets, self.out_edges, self.targets
+        )
+        in_owners, in_neighbours = gather(self.in_offsets, self.in_edges, self.sources)
+        return (
+            np.concatenate([out_owners, in_owners]),
+            np.concatenate([out_neighbours, in_neighbours]),
+        )
+
+    def degrees(self, direction="both", type_codes=None, weights=None):
+        """
+        The (weighted) degree of every node, as an array indexed by node iloc.
+
+        Args:
+            direction (str): count edges with the node as their target (``"in"``), as their
+                source (``"out"``) or either (``"both"``, where a self loop counts twice)
+            type_codes (list of int, optional): if specified, only count edges with one of
+                these types
+            weights (array of float, optional): if specified, sum the weight of each edge
+                rather than counting them
+
+        Returns:
+            A NumPy array with one element per node: integers if ``weights`` is None, floats
+            otherwise.
+        """
+        if direction == "both":
+            return self.degrees("in", type_codes, weights) + self.degrees(
+                "out", type_codes, weights
+            )
+
+        keys = self.targets if direction == "in" else self.sources
+        if type_codes is None and weights is None:
+            offsets = self.in_offsets if direction == "in" else self.out_offsets
+            return np.diff(offsets)
+
+        if type_codes is not None:
+            selected = np.isin(self.type_codes, type_codes)
+            keys = keys[selected]
+            if weights is not None:
+                weights = weights[selected]
+
+        return np.bincount(keys, weights=weights, minlength=self.number_of_nodes)
+
+    def weights_or_ones(self, dtype="float32"):
+        """
+        The weight of each edge, treating an unweighted graph as having a weight of 1 everywhere.
+        """
+        if self.weights is None:
+            return np.ones(len(self), dtype=dtype)
+        return self.weights.astype(dtype, copy=False)
+
+
+class EdgeTypeAdjacency:
+    """
+    The neighbours of every node along the edges of a single edge type triple (source node
+    type, relation, target node type), stored as CSR offsets and neighbour arrays.
+
+    Indexing with a node ID returns the list of neighbour IDs, in the order the neighbours
+    appear in the graph's nodes, or ``[None]`` if there are none (or the ID is unknown), so that
+    sampling from it always yields something.
+
+    Args:
+        ids (ExternalIdIndex): the node IDs
+        offsets (array of int): the offsets into ``neighbours`` for each node iloc, with one more
+            element than there are nodes
+        neighbours (array of int): the neighbour ilocs, grouped by node
+    """
+
+    def __init__(self, ids, offsets, neighbours):
+        self.ids = ids
+        self.offsets = offsets
+        self.neighbours = neighbours
+
+    def __len__(self):
+        return len(self.neighbours)
+
+    def neighbour_ilocs(self, node_iloc):
+        """
+        The ilocs of the neighbours of ``node_iloc``.
+        """
+        return self.neighbours[self.offsets[node_iloc] : self.offsets[node_iloc + 1]]
+
+    def __getitem__(self, node):
+        iloc = self.ids.to_single_iloc(node)
+        if iloc < 0:
+            return [None]
+
+        neighbours = self.ids.from_iloc(self.neighbour_ilocs(iloc)).tolist()
+        return neighbours or [None]
+
+
+def typed_adjacency(ids, node_type_codes, node_types, edges, is_directed, edge_types):
+    """
+    Build an :class:`EdgeTypeAdjacency` for each of ``edge_types``.
+
+    Args:
+        ids (ExternalIdIndex): the node IDs
+        node_type_codes (array of int): the type of each node, as an index into ``node_types``
+        node_types (list): the node type names
+        edges (EdgeData): the edges
+        is_directed (bool): if False, every edge can be traversed in both directions
+        edge_types (iterable of EdgeType): the edge type triples to index
+
+    Returns:
+        A dictionary of edge type triple -> EdgeTypeAdjacency.
+    """
+    sources = edges.sources
+    targets = edges.targets
+    type_codes = edges.type_codes
+    if not is_directed:
+        # every edge can be traversed in both directions, but self loops only once
+        not_loop = sources != targets
+        sources, targets = (
+            np.concatenate([sources, targets[not_loop]]),
+            np.concatenate([targets, sources[not_loop]]),
+        )
+        type_codes = np.concatenate([type_codes, type_codes[not_loop]])
+
+    node_type_codes = np.asarray(node_type_codes)
+    source_types = node_type_codes[sources]
+    target_types = node_type_codes[targets]
+    node_type_index = {ty: code for code, ty in enumerate(node_types)}
+
+    adj = {}
+    for et in edge_types:
+        mask = (
+            (source_types == node_type_index.get(et.n1, -1))
+            & (type_codes == _code_or_missing(edges.type_code(et.rel)))
+            & (target_types == node_type_index.get(et.n2, -1))
+        )
+        et_sources = sources[mask]
+        et_targets = targets[mask]
+
+        # order by source, and then by target to make sampling deterministic
+        order = np.lexsort((et_targets, et_sources))
+        offsets = _csr_offsets(et_sources, len(ids))
+        adj[et] = EdgeTypeAdjacency(ids, offsets, et_targets[order])
+
+    return adj
+
+
+def neighbour_index(sources, targets, number_of_nodes, is_directed):
+    """
+    The neighbours of every node as a CSR index, matching ``StellarGraph.neighbors``: each edge
+    makes its endpoints neighbours of each other (in both directions, even in a directed graph),
+    and self loops are counted once in undirected graphs.
+
+    Args:
+        sources (array of int): the source node iloc of each edge
+        targets (array of int): the target node iloc of each edge
+        number_of_nodes (int): the number of nodes
+        is_directed (bool): whether the graph is directed
+
+    Returns:
+        A tuple of the offsets, the neighbour ilocs and the edge iloc connecting each neighbour,
+        such that the neighbours of node ``i`` are ``neighbours[offsets[i]:offsets[i + 1]]``.
+    """
+    sources = np.asarray(sources)
+    targets = np.asarray(targets)
+    edge_ilocs = np.arange(len(sources))
+    if is_directed:
+        reverse = slice(None)
+    else:
+        reverse = sources != targets
+
+    keys = np.concatenate([sources, targets[reverse]])
+    others = np.concatenate([targets, sources[reverse]])
+    edge_ilocs = np.concatenate([edge_ilocs, edge_ilocs[reverse]])
+
+    order = np.argsort(keys, kind="stable")
+    neighbours = others[order].astype(_smallest_index_dtype(number_of_nodes))
+    return _csr_offsets(keys, number_of_nodes), neighbours, edge_ilocs[order]
+
+
+def _code_or_missing(code):
+    return -1 if code is None else code
+
+
+def _csr_index(keys, number_of_nodes):
+    """
+    Group the edges by their (source or target) node iloc ``keys``: returns the offsets array
+    (length ``number_of_nodes + 1``) and the edge ilocs, sorted stably by key, such that the edges
+    of node ``i`` are ``edges[offsets[i]:offsets[i + 1]]``.
+    """
+    dtype = _smallest_index_dtype(len(keys))
+    edges = np.argsort(keys, kind="stable").astype(dtype, copy=False)
+    return _csr_offsets(keys, number_of_nodes), edges
+
+
+def _select_features(features, feature_rows, type_codes, types, ilocs):
+    """
+    Slice per-type feature arrays (like :class:`NodeData`'s) down to only the rows of the elements
+    at ``ilocs``, which are renumbered ``0, 1, ...`` in that order.
+
+    Returns:
+        A tuple of the new dictionary of type -> features and the new feature rows.
+    """
+    sub_codes = type_codes[ilocs]
+    parent_rows = feature_rows[ilocs]
+
+    new_features = {}
+    new_rows = np.full(len(sub_codes), -1, dtype=np.int64)
+    for ty, array in features.items():
+        has_row = (sub_codes == types.index(ty)) & (parent_rows >= 0)
+        new_rows[has_row] = np.arange(has_row.sum())
+        if isinstance(array, QuantisedArray):
+            # stay at the reduced precision
+            new_features[ty] = array.select(parent_rows[has_row])
+        else:
+            new_features[ty] = gather_rows(array, parent_rows[has_row])
+
+    return new_features, new_rows
+
+
+def _concat_features(arrays):
+    """
+    Concatenate feature arrays, where the result has the type (and precision) of the first one.
+    """
+    first, *rest = arrays
+    if isinstance(first, QuantisedArray):
+        return first.append([a.toarray() if sps.issparse(a) else a for a in rest])
+
+    rest = [a[:] if isinstance(a, QuantisedArray) else a for a in rest]
+    if sps.issparse(first):
+        return sps.vstack([first] + rest, format="csr", dtype=first.dtype)
+
+    rest = [a.toarray() if sps.issparse(a) else a for a in rest]
+    return np.concatenate([first] + [a.astype(first.dtype, copy=False) for a in rest])
+
+
+def _compress_features(features, storage, node_types=None):
+    """
+    A copy of the ``features`` dictionary with the arrays of ``node_types`` (default: all)
+    converted to :class:`QuantisedArray` with the given ``storage``.
+    """
+    if node_types is None:
+        node_types = features.keys()
+
+    missing = [nt for nt in node_types if nt not in features]
+    if missing:
+        raise ValueError(
+            f"node_types: expected node types with features, found some without: {missing}"
+        )
+    sparse = [nt for nt in node_types if sps.issparse(features[nt])]
+    if sparse:
+        raise ValueError(
+            f"node_types: expected node types with dense features, found some with sparse features: {sparse}"
+        )
+
+    compressed = dict(features)
+    for nt in node_types:
+        compressed[nt] = QuantisedArray.from_array(features[nt], storage)
+    return compressed
+
+
+def _group_features(chunks, type_codes, types, name):
+    """
+    Arrange features given for consecutive chunks of elements into one array per type.
+
+    Args:
+        chunks (list): a ``(number of elements, 2D array or None)`` pair for each chunk, in the
+            order of ``type_codes``
+        type_codes (array of int): the type of every element
+        types (list): the type names
+        name (str): the name of the elements, for error messages
+
+    Returns:
+        A tuple of a dictionary of type -> features and the feature row of each element (-1 for
+        elements without features), or ``({}, None)`` if no chunk has features.
+    """
+    if all(values is None for _, values in chunks):
+        return {}, None
+
+    sizes = [size for size, _ in chunks]
+    has_features = np.repeat([values is not None for _, values in chunks], sizes)
+    starts = np.cumsum([0] + sizes)
+
+    features = {}
+    rows = np.full(len(type_codes), -1, dtype=np.int64)
+    for code in np.unique(type_codes[has_features]):
+        parts = [
+            values[type_codes[start : start + size] == code]
+            for (size, values), start in zip(chunks, starts)
+            if values is not None
+        ]
+        widths = {part.shape[1] for part in parts if len(part) > 0}
+        if len(widths) > 1:
+            raise ValueError(
+                f"{name}: expected features of the same size for every element of type {types[code]!r}, found sizes: {sorted(widths)}"
+            )
+
+        ilocs = np.flatnonzero((type_codes == code) & has_features)
+        rows[ilocs] = np.arange(len(ilocs))
+        features[types[code]] = np.concatenate([p for p in parts if len(p) > 0])
+
+    return features, rows
+
+
+def _append_features(
+    features, feature_rows, size, new_features, new_rows, new_codes, types
+):
+    """
+    Merge the features of new elements (from :func:`_group_features`) after ``size`` existing
+    elements with ``features`` and ``feature_rows``.
+    """
+    if feature_rows is None and new_rows is None:
+        return features, None
+
+    if feature_rows is None:
+        feature_rows = np.full(size, -1, dtype=np.int64)
+    if new_rows is None:
+        new_rows = np.full(len(new_codes), -1, dtype=np.int64)
+    else:
+        new_rows = new_rows.copy()
+
+    merged = dict(features)
+    for ty, values in new_features.items():
+        existing = merged.get(ty)
+        if existing is None:
+            merged[ty] = values
+            continue
+
+        if existing.shape[1] != values.shape[1]:
+            raise ValueError(
+                f"expected new features of type {ty!r} to have size {existing.shape[1]}, found {values.shape[1]}"
+            )
+        new_rows[(new_codes == types.index(ty)) & (new_rows >= 0)] += existing.shape[0]
+        merged[ty] = _concat_features([existing, values])
+
+    return merged, np.concatenate([feature_rows, new_rows])
+
+
+def _ranges(starts, counts):
+    """
+    The concatenation of ``np.arange(start, start + count)`` for each of ``starts`` and
+    ``counts``, computed without a Python loop.
+    """
+    starts = np.asarray(starts, dtype=np.int64)
+    counts = np.asarray(counts, dtype=np.int64)
+    ends = np.cumsum(counts)
+    return np.repeat(starts - (ends - counts), counts) + np.arange(
+        ends[-1] if len(ends) > 0 else 0
+    )
+
+
+def _csr_offsets(keys, number_of_nodes):
+    """
+    The offsets of each node's group of elements, when the elements are sorted by their node
+    iloc ``keys``.
+    """
+    offsets = np.zeros(number_of_nodes + 1, dtype=np.int64)
+    np.cumsum(np.bincount(keys, minlength=number_of_nodes), out=offsets[1:])
+    return offsets
+
+
+def _csr_append(offsets, edges, keys, first_iloc, number_of_nodes):
+    """
+    Add new elements to a CSR index built by :func:`_csr_index`, without re-sorting the existing
+    ones: the new elements have ilocs ``first_iloc, first_iloc + 1, ...`` (after every existing
+    element), and so each goes at the end of the group for its key. The index is also extended
+    to ``number_of_nodes`` nodes, which may be more than it had before.
+    """
+    extra_nodes = number_of_nodes + 1 - len(offsets)
+    offsets = np.concatenate(
+        [offsets, np.full(extra_nodes, offsets[-1], dtype=offsets.dtype)]
+    )
+
+    dtype = _smallest_index_dtype(len(edges) + len(keys))
+    order = np.argsort(keys, kind="stable")
+    positions = offsets[keys[order] + 1]
+    new_edges = np.insert(
+        edges.astype(dtype, copy=False), positions, (order + first_iloc).astype(dtype)
+    )
+
+    new_offsets = offsets.astype(np.int64, copy=True)
+    new_offsets[1:] += np.cumsum(np.bincount(keys, minlength=number_of_nodes))
+    return new_offsets, new_edges
+
+
+def _csr_remove(offsets, edges, keys, keep):
+    """
+    Remove elements from a CSR index built by :func:`_csr_index`, without re-sorting the
+    remaining ones, which are renumbered to be contiguous.
+
+    Args:
+        offsets, edges: the CSR index
+        keys (array of int): the node iloc key of every element, before removal
+        keep (array of bool): whether each element is kept
+    """
+    dtype = _smallest_index_dtype(int(keep.sum()))
+    new_ilocs = np.cumsum(keep) - 1
+    kept = edges[keep[edges]]
+
+    new_offsets = offsets.astype(np.int64, copy=True)
+    removed = np.bincount(keys[~keep], minlength=len(offsets) - 1)
+    new_offsets[1:] -= np.cumsum(removed)
+    return new_offsets, new_ilocs[kept].astype(dtype)
+
+
+def _group_ranks(keys):
+    """
+    The position of each element within the group of elements with the same key, counting in
+    element order: the offset of the element from the start of its group in :func:`_csr_index`.
+
+    This doesn't depend on the values of the keys, only on which elements share one, so it can be
+    computed for a chunk of elements before the final ilocs of the keys are known.
+    """
+    keys = np.asarray(keys)
+    if len(keys) == 0:
+        return np.empty(0, dtype=np.int64)
+
+    order = np.argsort(keys, kind="stable")
+    counts = np.bincount(keys)
+    starts = np.cumsum(counts) - counts
+    ranks = np.empty(len(keys), dtype=np.int64)
+    ranks[order] = np.arange(len(keys)) - np.repeat(starts, counts)
+    return ranks
+
+
+def _csr_merge(blocks, number_of_nodes):
+    """
+    Build the CSR index of :func:`_csr_index` for consecutive chunks of elements, without sorting
+    all of them together.
+
+    Args:
+        blocks (list): a ``(keys, ranks)`` pair for each chunk of elements, in order, where
+            ``keys`` is the node iloc key of each element and ``ranks`` is from
+            :func:`_group_ranks`
+        number_of_nodes (int): the number of nodes
+
+    Returns:
+        The offsets and the element ilocs, exactly as :func:`_csr_index` for the concatenation of
+        every ``keys``.
+    """
+    # the counts of each chunk are recomputed below, rather than kept, so that the memory used
+    # doesn't grow with the number of chunks
+    counts = np.zeros(number_of_nodes, dtype=np.int64)
+    for keys, _ in blocks:
+        counts += np.bincount(keys, minlength=number_of_nodes)
+
+    offsets = np.zeros(number_of_nodes + 1, dtype=np.int64)
+    np.cumsum(counts, out=offsets[1:])
+
+    total = int(offsets[-1])
+    dtype = _smallest_index_dtype(total)
+    edges = np.empty(total, dtype=dtype)
+
+    # each chunk's elements go after those of the earlier chunks in the group for their key
+    group_starts = offsets[:-1].copy()
+    first_iloc = 0
+    for keys, ranks in blocks:
+        edges[group_starts[keys] + ranks] = np.arange(
+            first_iloc, first_iloc + len(keys), dtype=dtype
+        )
+        group_starts += np.bincount(keys, minlength=number_of_nodes)
+        first_iloc += len(keys)
+
+    return offsets, edges
+
+
+def _extend_type_codes(types, values, default):
+    """
+    Compute the codes for the (possibly missing) types ``values`` of some new elements, adding
+    any new types to ``types``, with the same sorted order as :func:`_type_codes`.
+
+    Returns:
+        A tuple of: the codes of the new elements; the new list of types; and an array mapping
+        each code for the old ``types`` to its code in the new list.
+    """
+    values = pd.Series(np.asarray(values, dtype=object)).fillna(default)
+    new_types = sorted(set(types).union(pd.unique(values)), key=str)
+
+    index = pd.Index(new_types)
+    remap = index.get_indexer(types).astype(np.int32)
+    codes = index.get_indexer(values).astype(np.int32)
+    return codes, new_types, remap
+
+
+def _type_groups(type_codes, number_of_types):
+    """
+    Group elements by their type: returns the offsets and ilocs (see :func:`_csr_index`) such
+    that the elements of type code ``c`` are ``ilocs[offsets[c]:offsets[c + 1]]``, in iloc
+    order.
+    """
+    return _csr_index(type_codes, number_of_types)
+
+
+def _edge_type_triples(node_type_codes, edges, edge_ilocs=None):
+    """
+    The unique (source node type, edge type, target node type) codes of the given edges (or all
+    edges), along with the number of edges with each.
+    """
+    if edge_ilocs is None:
+        edge_ilocs = slice(None)
+
+    triples = np.column_stack(
+        [
+            node_type_codes[edges.sources[edge_ilocs]],
+            edges.type_codes[edge_ilocs],
+            node_type_codes[edges.targets[edge_ilocs]],
+        ]
+    )
+    if len(triples) == 0:
+        return np.empty((0, 3), dtype=int), np.empty(0, dtype=int)
+
+    return np.unique(triples, axis=0, return_counts=True)
+
+
+def _graph_schema(is_directed, node_types, node_codes, edge_types, triples):
+    """
+    Build a :class:`GraphSchema` from the node type codes present and the edge type triples
+    computed by :func:`_edge_type_triples`.
+
+    Args:
+        is_directed (bool): whether the graph is directed
+        node_types (list): the node type names
+        node_codes (iterable of int): the codes of the node types to include
+        edge_types (list): the edge type names
+        triples (array of int): the ``(source node type, edge type, target node type)`` codes
+    """
+    node_type_names = sorted((node_types[c] for c in node_codes), key=str)
+    graph_schema = {nt: set() for nt in node_type_names}
+
+    for n1, rel, n2 in triples:
+        node_type_1 = node_types[n1]
+        node_type_2 = node_types[n2]
+        edge_type = edge_types[rel]
+
+        graph_schema[node_type_1].add(EdgeType(node_type_1, edge_type, node_type_2))
+
+        if not is_directed:
+            graph_schema[node_type_2].add(EdgeType(node_type_2, edge_type, node_type_1))
+
+    edge_type_triples = sorted(set().union(*graph_schema.values()))
+    schema = {
+        node_label: sorted(node_data) for node_label, node_data in graph_schema.items()
+    }
+
+    return GraphSchema(is_directed, node_type_names, edge_type_triples, schema)
@@ -0,0 +1,109 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright 2020 Data61, CSIRO
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Storing node features on disk as ``.npy`` files, so that they can be memory-mapped.
+
+"""
+__all__ = ["save_node_features", "load_node_features"]
+
+import json
+import os
+
+import numpy as np
+
+from .element_data import _as_id_array, _ids_to_array
+from .indexed_array import IndexedArray
+
+_METADATA_FILE = "node_features.json"
+
+
+def save_node_features(graph, path, chunk_size=100000):
+    """
+    Write the node features of a graph to a directory of ``.npy`` files, which can be read back
+    with :func:`load_node_features` as memory-mapped arrays.
+
+    The features are copied in chunks, so the graph's features do not need to fit in memory at
+    once (for instance, if they are memory-mapped themselves).
+
+    Args:
+        graph (StellarGraph): the graph with the node features
+        path (str): the directory to write to; it is created if it doesn't exist
+        chunk_size (int): the number of nodes to copy at a time
+    """
+    os.makedirs(path, exist_ok=True)
+
+    node_types = sorted(graph.node_feature_sizes().keys(), key=str)
+    for i, node_type in enumerate(node_types):
+        nodes = graph.nodes_of_type(node_type)
+        indices = graph._get_index_for_nodes(nodes, node_type)
+        with_features = [index is not None for index in indices]
+        nodes = _as_id_array(nodes)[with_features]
+        indices = np.array(
+            [index for index in indices if index is not None], dtype=np.int64
+        )
+
+        features_path = os.path.join(path, f"features_{i}.npy")
+        first = graph.node_features_by_index(indices[:1], node_type)
+        if len(indices) == 0:
+            np.save(features_path, first)
+        else:
+            features = np.lib.format.open_memmap(
+                features_path,
+                mode="w+",
+                dtype=first.dtype,
+                shape=(len(indices), first.shape[1]),
+            )
+            for start in range(0, len(indices), chunk_size):
+                chunk = indices[start : start + chunk_size]
+                features[start : start + len(chunk)] = graph.node_features_by_index(
+                    chunk, node_type
+                )
+            features.flush()
+            del features
+
+        np.save(os.path.join(path, f"ids_{i}.npy"), _ids_to_array(nodes))
+
+    with open(os.path.join(path, _METADATA_FILE), "w") as f:
+        json.dump({"node_types": node_types}, f)
+
+
+def load_node_features(path, mmap_mode="r"):
+    """
+    Read node features written by :func:`save_node_features`.
+
+    The result can be passed as the ``nodes`` argument to :class:`StellarGraph`, or as its
+    ``node_features`` argument along with a NetworkX graph. With the default ``mmap_mode``, the
+    features are memory-mapped, so they are only read from disk as they are needed.
+
+    Args:
+        path (str): the directory written by :func:`save_node_features`
+        mmap_mode (str, optional): the memory-mapping mode passed to ``numpy.load``, or None to
+            read the features into memory.
+
+    Returns:
+        A dictionary of node type to :class:`IndexedArray`.
+    """
+    with open(os.path.join(path, _METADATA_FILE)) as f:
+        node_types = json.load(f)["node_types"]
+
+    result = {}
+    for i, node_type in enumerate(node_types):
+        features = np.load(os.path.join(path, f"features_{i}.npy"), mmap_mode=mmap_mode)
+        ids = np.load(os.path.join(path, f"ids_{i}.npy"), allow_pickle=True)
+        result[node_type] = IndexedArray(features, index=ids)
+
+    return result
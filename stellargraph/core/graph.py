@@ -88,8 +88,24 @@ class StellarGraph:
         Gs = StellarGraph(nx_graph, node_features=node_data)
 
 
+    Large graphs can be constructed directly from pandas DataFrames, without
+    going through NetworkX. The nodes are given as a DataFrame per node type,
+    with the node IDs as the index and the features as the columns, and the
+    edges as a DataFrame with one row per edge::
+
+        nodes = {
+            node_type_1: pd.DataFrame(..., index=[node_id_1, ...]),
+            node_type_2: pd.DataFrame(...),
+        }
+        edges = pd.DataFrame(
+            {"source": [node_id_1, ...], "target": [node_id_2, ...], "weight": [...]}
+        )
+        Gs = StellarGraph(nodes=nodes, edges=edges)
+
+
     Args:
-        graph: The NetworkX graph instance.
+        graph: The NetworkX graph instance. This should not be specified along
+            with ``nodes`` or ``edges``.
         node_type_name: str, optional (default=globals.TYPE_ATTR_NAME)
             This is the name for the node types that StellarGraph uses
             when processing heterogeneous graphs. StellarGraph will
@@ -115,6 +131,39 @@ class StellarGraph:
             required by some graph models. These are expected to be
             a numeric feature vector for each node in the graph.
 
+        backend: str, optional (default="networkx", or "csr" for ``nodes``/``edges``)
+            How the graph is stored. ``"networkx"`` keeps a copy of the graph as a
+            NetworkX multigraph. ``"csr"`` converts it to compact NumPy arrays, with
+            compressed sparse row indices for the edges, which uses much less memory and
+            is faster to construct for large graphs. It stores the nodes grouped by type,
+            so ``nodes()`` lists the nodes of a heterogeneous NetworkX graph type by type.
+            Both provide the same methods.
+
+        nodes: DataFrame, IndexedArray or dict of hashable to those, optional
+            The nodes of the graph, as an alternative to ``graph``. Each DataFrame has
+            the node IDs as its index and the node features as its columns (which may be
+            empty). An IndexedArray is used without copying, so can hold memory-mapped
+            features, or a SciPy sparse matrix of features (as can a DataFrame whose columns
+            are all sparse); sparse features stay sparse, and ``node_features`` returns them
+            as a SciPy CSR matrix. A dictionary holds one of these per node type; otherwise, the
+            nodes have type ``node_type_default``. If not specified, the nodes are the
+            IDs used in ``edges``, without features.
+
+        edges: DataFrame or dict of hashable to DataFrame, optional
+            The edges of the graph, as an alternative to ``graph``. Each DataFrame has
+            one row per edge, with ``source_column`` and ``target_column`` columns of node
+            IDs. Edge weights are read from an ``edge_weight_label`` column and edge types
+            from an ``edge_type_name`` column, if they exist, and any other columns are
+            numeric edge features (see :meth:`edge_features`). A dictionary holds one
+            DataFrame per edge type; otherwise, edges without a type column have type
+            ``edge_type_default``.
+
+        source_column: str, optional (default="source")
+            The name of the column holding the source node IDs in ``edges``.
+
+        target_column: str, optional (default="target")
+            The name of the column holding the target node IDs in ``edges``.
+
     """
 
     def __init__(
@@ -130,11 +179,56 @@ class StellarGraph:
         target_name=globalvar.TARGET_ATTR_NAME,
         node_features=None,
         dtype="float32",
+        backend=None,
+        nodes=None,
+        edges=None,
+        source_column="source",
+        target_column="target",
     ):
         # Avoid a circular import
         from .graph_networkx import NetworkXStellarGraph
+        from .graph_csr import _from_networkx, _from_pandas
+
+        if nodes is not None or edges is not None:
+            if graph is not None:
+                raise ValueError(
+                    "graph: expected no NetworkX graph when 'nodes' or 'edges' are specified"
+                )
+            if backend not in (None, "csr"):
+                raise ValueError(
+                    f"backend: expected 'csr' when 'nodes' or 'edges' are specified, found {backend!r}"
+                )
+            if node_features is not None:
+                raise ValueError(
+                    "node_features: expected no value when 'nodes' is specified, because the features are the columns of the 'nodes' DataFrames"
+                )
+
+            self._graph = _from_pandas(
+                nodes,
+                edges,
+                is_directed,
+                source_column,
+                target_column,
+                edge_weight_label,
+                node_type_name,
+                edge_type_name,
+                node_type_default,
+                edge_type_default,
+                feature_name,
+                dtype,
+            )
+            return
+
+        if backend is None or backend == "networkx":
+            constructor = NetworkXStellarGraph
+        elif backend == "csr":
+            constructor = _from_networkx
+        else:
+            raise ValueError(
+                f"backend: expected 'networkx' or 'csr', found {backend!r}"
+            )
 
-        self._graph = NetworkXStellarGraph(
+        self._graph = constructor(
             graph,
             is_directed,
             edge_weight_label,
@@ -197,14 +291,50 @@ class StellarGraph:
         """
         return self._graph.number_of_edges()
 
-    def nodes(self) -> Iterable[Any]:
+    def nodes(self, use_index=False) -> Iterable[Any]:
         """
         Obtains the collection of nodes in the graph.
 
+        Args:
+            use_index (bool): if True, return the node indices ``0, 1, ..., N - 1`` as a NumPy
+                array, instead of the node IDs. See :meth:`ids_to_index`.
+
         Returns:
             The graph nodes.
         """
-        return self._graph.nodes()
+        return self._graph.nodes(use_index)
+
+    def ids_to_index(self, ids):
+        """
+        Convert node IDs to node indices, in bulk.
+
+        Every node is interned to a contiguous integer index in ``[0, number_of_nodes())``, in
+        the order of :meth:`nodes`. Methods like :meth:`neighbors` and :meth:`node_features`,
+        and the random walkers, can work directly with these indices via their ``use_index``
+        argument, so a pipeline only needs to convert IDs at its start and end.
+
+        Args:
+            ids (iterable): the node IDs
+
+        Returns:
+            A NumPy array of integer node indices, one for each ID. A KeyError is raised if any
+            of the IDs aren't in the graph.
+        """
+        return self._graph.ids_to_index(ids)
+
+    def index_to_ids(self, indices):
+        """
+        Convert node indices, like those returned by :meth:`ids_to_index`, back to node IDs,
+        in bulk.
+
+        Args:
+            indices (array of int): the node indices
+
+        Returns:
+            A NumPy array of node IDs, one for each index. An IndexError is raised if any of the
+            indices are outside ``[0, number_of_nodes())``.
+        """
+        return self._graph.index_to_ids(indices)
 
     def edges(self, triple=False) -> Iterable[Any]:
         """
@@ -233,7 +363,7 @@ class StellarGraph:
         return self._graph.has_node(node)
 
     def neighbors(
-        self, node: Any, include_edge_weight=False, edge_types=None
+        self, node: Any, include_edge_weight=False, edge_types=None, use_index=False
     ) -> Iterable[Any]:
         """
         Obtains the collection of neighbouring nodes connected
@@ -245,16 +375,21 @@ class StellarGraph:
                 output is a named tuple with fields `node` (the node ID) and `weight` (the edge weight)
             edge_types (list of hashable, optional): If provided, only traverse the graph
                 via the provided edge types when collecting neighbours.
+            use_index (bool): if True, ``node`` and the neighbours are node indices rather
+                than node IDs. See :meth:`ids_to_index`.
 
         Returns:
             iterable: The neighbouring nodes.
         """
         return self._graph.neighbors(
-            node, include_edge_weight=include_edge_weight, edge_types=edge_types
+            node,
+            include_edge_weight=include_edge_weight,
+            edge_types=edge_types,
+            use_index=use_index,
         )
 
     def in_nodes(
-        self, node: Any, include_edge_weight=False, edge_types=None
+        self, node: Any, include_edge_weight=False, edge_types=None, use_index=False
     ) -> Iterable[Any]:
         """
         Obtains the collection of neighbouring nodes with edges
@@ -267,16 +402,21 @@ class StellarGraph:
                 output is a named tuple with fields `node` (the node ID) and `weight` (the edge weight)
             edge_types (list of hashable, optional): If provided, only traverse the graph
                 via the provided edge types when collecting neighbours.
+            use_index (bool): if True, ``node`` and the neighbours are node indices rather
+                than node IDs. See :meth:`ids_to_index`.
 
         Returns:
             iterable: The neighbouring in-nodes.
         """
         return self._graph.in_nodes(
-            node, include_edge_weight=include_edge_weight, edge_types=edge_types
+            node,
+            include_edge_weight=include_edge_weight,
+            edge_types=edge_types,
+            use_index=use_index,
         )
 
     def out_nodes(
-        self, node: Any, include_edge_weight=False, edge_types=None
+        self, node: Any, include_edge_weight=False, edge_types=None, use_index=False
     ) -> Iterable[Any]:
         """
         Obtains the collection of neighbouring nodes with edges
@@ -289,14 +429,74 @@ class StellarGraph:
                 output is a named tuple with fields `node` (the node ID) and `weight` (the edge weight)
             edge_types (list of hashable, optional): If provided, only traverse the graph
                 via the provided edge types when collecting neighbours.
+            use_index (bool): if True, ``node`` and the neighbours are node indices rather
+                than node IDs. See :meth:`ids_to_index`.
 
         Returns:
             iterable: The neighbouring out-nodes.
         """
         return self._graph.out_nodes(
-            node, include_edge_weight=include_edge_weight, edge_types=edge_types
+            node,
+            include_edge_weight=include_edge_weight,
+            edge_types=edge_types,
+            use_index=use_index,
         )
 
+    def edge_features(self, edges, edge_type=None):
+        """
+        Get the numeric feature vectors of a batch of edges, given by their indices.
+
+        The index of an edge is its position in :meth:`edges`. The features are stored in one
+        array per edge type, aligned with the edge order, so a whole batch is read with a single
+        NumPy indexing operation. Edge features are given as the columns of the ``edges``
+        DataFrames other than the source, target, weight and type columns, and are only
+        supported by the ``"csr"`` backend.
+
+        Args:
+            edges (array of int): the indices of the edges
+            edge_type (hashable, optional): the type of the edges; if not specified, all of the
+                edges must have the same type.
+
+        Returns:
+            A NumPy array with one row of features for each of ``edges``.
+        """
+        return self._graph.edge_features(edges, edge_type)
+
+    def edge_feature_sizes(self, edge_types=None):
+        """
+        Get the feature sizes of the edge types that have edge features.
+
+        Args:
+            edge_types (list, optional): the edge types to include; if not specified, every
+                edge type with features is included.
+
+        Returns:
+            A dictionary of edge type to integer feature size.
+        """
+        return self._graph.edge_feature_sizes(edge_types)
+
+    def compress_node_features(self, storage="float16", node_types=None):
+        """
+        Store the node features at reduced precision, to reduce the memory they use.
+
+        The features are converted back to their original type only for the rows that are
+        selected, so :meth:`node_features` returns the same type of array as before, with values
+        that are approximately equal to the originals. The features stay compressed when the
+        graph is saved, shared or used to create a subgraph, and the features of nodes added
+        later with :meth:`add_nodes` are compressed too. With ``"int8"``, if added features are
+        outside the range of the existing ones, the scale and zero point of their columns are
+        widened to include them, and the features of every node of that type are compressed
+        again, rather than clipping the new values.
+
+        Args:
+            storage (str): ``"float16"`` to use half the memory of ``float32`` features, or
+                ``"int8"`` to use a quarter, with a scale and zero point for each feature column
+                (the maximum error in each column is half of ``(max - min) / 255``).
+            node_types (list, optional): the node types to compress; if not specified, every
+                node type with features is compressed.
+        """
+        self._graph.compress_node_features(storage, node_types)
+
     def nodes_of_type(self, node_type=None):
         """
         Get the nodes of the graph with the specified node types.
@@ -351,7 +551,7 @@ class StellarGraph:
         """
         self._graph.check_graph_for_ml(features)
 
-    def node_features(self, nodes, node_type=None):
+    def node_features(self, nodes, node_type=None, use_index=False):
         """
         Get the numeric feature vectors for the specified node or nodes.
         If the node type is not specified the node types will be found
@@ -361,11 +561,88 @@ class StellarGraph:
         Args:
             nodes (list or hashable): Node ID or list of node IDs
             node_type (hashable): the type of the nodes.
+            use_index (bool): if True, ``nodes`` are node indices rather than node IDs. See
+                :meth:`ids_to_index`.
+
+        Returns:
+            Numpy array containing the node features for the requested nodes, or a SciPy CSR
+            matrix if the features of ``node_type`` are sparse.
+        """
+        return self._graph.node_features(nodes, node_type, use_index)
+
+    def node_features_by_index(self, indices, node_type):
+        """
+        Get the numeric feature vectors for nodes specified by their indices into the
+        features of ``node_type``, skipping the conversion from node IDs.
+
+        This is a fast path for code that looks up the features of the same nodes
+        repeatedly: resolve the IDs once with ``_get_index_for_nodes``, and then use
+        those indices for every lookup.
+
+        Args:
+            indices (array of int): the indices of the nodes within ``node_type``
+            node_type (hashable): the type of the nodes.
 
         Returns:
             Numpy array containing the node features for the requested nodes.
         """
-        return self._graph.node_features(nodes, node_type)
+        return self._graph.node_features_by_index(indices, node_type)
+
+    def add_nodes(self, nodes):
+        """
+        Add new nodes to the graph.
+
+        The nodes are given in the same form as the ``nodes`` argument to :class:`StellarGraph`:
+        a DataFrame (or :class:`IndexedArray`) indexed by node ID, where the columns are the node
+        features, or a dictionary of node type to such DataFrames. Nodes of an existing type must
+        have the same number of features as the existing nodes of that type.
+
+        Additions are cheap: they're buffered, and merged into the graph's storage in bulk when
+        it is next used, so a sequence of :meth:`add_nodes` and :meth:`add_edges` calls only
+        rebuilds it once. Structures derived from the graph, such as its typed adjacency, are
+        rebuilt on first use after a change. Generators that copy data from the graph when they
+        are created (like ``FullBatchNodeGenerator``) need to be recreated to see the changes,
+        while those that sample from it (like ``GraphSAGENodeGenerator``) see them immediately.
+
+        Args:
+            nodes (DataFrame, IndexedArray or dict): the new nodes; their IDs must not already
+                be in the graph.
+        """
+        self._graph.add_nodes(nodes)
+
+    def add_edges(self, edges, source_column="source", target_column="target"):
+        """
+        Add new edges to the graph, between nodes that are already in it (or have been added
+        with :meth:`add_nodes`).
+
+        The edges are given in the same form as the ``edges`` argument to :class:`StellarGraph`:
+        a DataFrame with a row for each edge, or a dictionary of edge type to such DataFrames.
+        Edges are buffered like nodes: see :meth:`add_nodes`.
+
+        Args:
+            edges (DataFrame or dict): the new edges, with optional weight and type columns
+                (named by the ``edge_weight_label`` and ``edge_type_name`` arguments used when
+                creating the graph).
+            source_column (hashable, optional): the name of the column for the source node of
+                each edge
+            target_column (hashable, optional): the name of the column for the target node of
+                each edge
+        """
+        self._graph.add_edges(edges, source_column, target_column)
+
+    def remove_edges(self, edges):
+        """
+        Remove edges from the graph.
+
+        Every edge matching one of ``edges`` is removed, including all edges of a multigraph
+        between the pair of nodes. For an undirected graph, edges match in either direction. If
+        any of ``edges`` doesn't match an edge, a KeyError is raised and nothing is removed.
+
+        Args:
+            edges (iterable): ``(source, target)`` pairs, or ``(source, target, edge type)``
+                triples to only remove the edges of that type.
+        """
+        self._graph.remove_edges(edges)
 
     ##################################################################
     # Computationally intensive methods:
@@ -375,13 +652,14 @@ class StellarGraph:
         Return an information string summarizing information on the current graph.
         This includes node and edge type information and their attributes.
 
-        Note: This requires processing all nodes and edges and could take a long
-        time for a large graph.
+        The node and edge type counts and degree statistics are computed from cached arrays, so
+        this is fast even for a large graph.
 
         Args:
             show_attributes (bool, default True): If True, include attributes information
-            sample (int): To speed up the graph analysis, use only a random sample of
-                          this many nodes and edges.
+            sample (int, optional): with the ``networkx`` backend, summarise the attributes of a
+                random sample of this many nodes and of their edges. Without it, only the node
+                feature sizes are shown.
 
         Returns:
             An information string.
@@ -403,6 +681,10 @@ class StellarGraph:
                 represent all node types and all edge types in the graph.
                 If not specified, all nodes and edges in the graph are used.
 
+        The schema of the whole graph (``nodes=None``) is computed once and shared between
+        callers, until the graph is changed with :meth:`add_nodes`, :meth:`add_edges` or
+        :meth:`remove_edges`.
+
         Returns:
             GraphSchema object.
         """
@@ -414,29 +696,132 @@ class StellarGraph:
 
         return self._graph.create_graph_schema(nodes)
 
-    def node_degrees(self) -> Mapping[Any, int]:
+    def node_degrees(
+        self, as_array=False, direction="both", edge_types=None, weighted=False
+    ) -> Mapping[Any, int]:
         """
-        Obtains a map from node to node degree.
+        Obtains the degree of each node.
+
+        The degrees are computed for all nodes at once with vectorised operations and cached
+        by the graph, so a degree-based distribution (like the negative sampling distribution
+        of ``UnsupervisedSampler``) can be computed with a single NumPy expression.
+
+        Args:
+            as_array (bool): if True, return a NumPy array of degrees aligned with the node
+                indices (that is, in the order of :meth:`nodes`; see :meth:`ids_to_index`). This
+                array is shared by every caller and so is read-only.
+            direction (str): for a directed graph, count the edges into each node (``"in"``),
+                out of each node (``"out"``), or both (``"both"``). In an undirected graph,
+                every edge is counted for both of its nodes, whatever the direction.
+            edge_types (list of hashable, optional): if specified, only count edges of these
+                types
+            weighted (bool): if True, sum the weights of the edges rather than counting them,
+                where edges without a weight have weight 1.
 
         Returns:
-            The degree of each node.
+            A map from node ID to degree, or a NumPy array if ``as_array`` is True. A self loop
+            contributes 2 to the degree of its node when ``direction="both"``.
         """
-        return self._graph.node_degrees()
+        if direction not in ("in", "out", "both"):
+            raise ValueError(
+                f"direction: expected 'in', 'out' or 'both', found {direction!r}"
+            )
+
+        if not as_array and direction == "both" and edge_types is None and not weighted:
+            return self._graph.node_degrees()
+
+        if edge_types is not None:
+            # normalise, so that equivalent lists share a cache entry
+            edge_types = tuple(sorted(set(edge_types), key=str))
 
-    def to_adjacency_matrix(self, nodes: Optional[Iterable] = None):
+        degrees = self._graph.degree_array(direction, edge_types, weighted)
+        if as_array:
+            return degrees
+        return dict(zip(self.nodes(), degrees.tolist()))
+
+    def to_adjacency_matrix(
+        self,
+        nodes: Optional[Iterable] = None,
+        edge_types=None,
+        weighted=True,
+        format="csr",
+        directed=None,
+    ):
         """
         Obtains a SciPy sparse adjacency matrix of edge weights.
 
+        The matrix is built directly from the edge arrays, and a subgraph is extracted by slicing
+        the adjacency index of the selected nodes, so it takes time proportional to the number of
+        their edges. Multiple edges between a pair of nodes are summed into a single entry.
+
         Args:
-            nodes (iterable): The optional collection of nodes
+            nodes (iterable): The optional collection of unique nodes
                 comprising the subgraph. If specified, then the
-                adjacency matrix is computed for the subgraph;
-                otherwise, it is computed for the full graph.
+                adjacency matrix is computed for the subgraph, with rows and
+                columns in the order given; otherwise, it is computed for the
+                full graph, in the order of ``nodes()``.
+            edge_types (iterable, optional): only include edges of these types
+            weighted (bool): if True, the entries are the edge weights
+                (edges without a weight have weight 1); otherwise, each edge
+                counts as 1.
+            format (str): the SciPy sparse format of the result, such as
+                ``"csr"``, ``"csc"`` or ``"coo"``
+            directed (bool, optional): if False, each edge contributes
+                entries in both directions; if True, each edge only contributes
+                its ``source -> target`` entry. Defaults to ``is_directed()``.
 
         Returns:
              The weighted adjacency matrix.
         """
-        return self._graph.to_adjacency_matrix(nodes)
+        return self._graph.to_adjacency_matrix(
+            nodes, edge_types, weighted, format, directed
+        )
+
+    def subgraph(self, nodes, use_index=False):
+        """
+        Extract the subgraph induced by some nodes: those nodes, with their types and features,
+        and every edge between two of them.
+
+        The subgraph is a new, compact graph using the ``"csr"`` backend, with only the rows of the
+        feature arrays for its nodes. Its nodes keep their IDs, and are in the order given, so the
+        index of a node in the subgraph (its local index, see :meth:`ids_to_index`) is its
+        position in ``nodes``, and ``self.ids_to_index(sub.nodes())`` is the index in this graph
+        (the global index) of each node of the subgraph.
+
+        Args:
+            nodes (iterable): the unique node IDs (or indices, if ``use_index``) to include
+            use_index (bool): if True, ``nodes`` are node indices rather than node IDs
+
+        Returns:
+            A :class:`StellarGraph` or :class:`StellarDiGraph`, like this graph.
+        """
+        return StellarGraph._wrap_backend(self._graph.subgraph(nodes, use_index))
+
+    def k_hop_subgraph(self, seeds, k, max_neighbours=None, use_index=False, seed=None):
+        """
+        Extract the subgraph induced by the nodes within ``k`` hops of any of ``seeds``,
+        following edges in either direction.
+
+        The search is breadth-first, and processes all the nodes of each hop together using the
+        adjacency arrays, so it is fast even with many seeds. Like :meth:`subgraph`, the nodes
+        keep their IDs, and they are ordered by the hop at which they were first reached, so the
+        seeds (without duplicates) are the first nodes of the subgraph, with local indices ``0,
+        1, ...``.
+
+        Args:
+            seeds (iterable): the node IDs (or indices, if ``use_index``) to start from
+            k (int): the number of hops
+            max_neighbours (int, optional): if specified, only follow a random sample of at most
+                this many edges from each node at each hop
+            use_index (bool): if True, ``seeds`` are node indices rather than node IDs
+            seed (int, optional): the random seed used for sampling neighbours
+
+        Returns:
+            A :class:`StellarGraph` or :class:`StellarDiGraph`, like this graph.
+        """
+        return StellarGraph._wrap_backend(
+            self._graph.k_hop_subgraph(seeds, k, max_neighbours, use_index, seed)
+        )
 
     def to_networkx(self):
         """
@@ -448,6 +833,141 @@ class StellarGraph:
         """
         return self._graph.to_networkx()
 
+    @staticmethod
+    def from_edge_chunks(
+        edges,
+        nodes=None,
+        is_directed=False,
+        workers=None,
+        source_column="source",
+        target_column="target",
+        edge_weight_label="weight",
+        node_type_name=globalvar.TYPE_ATTR_NAME,
+        edge_type_name=globalvar.TYPE_ATTR_NAME,
+        node_type_default=globalvar.NODE_TYPE_DEFAULT,
+        edge_type_default=globalvar.EDGE_TYPE_DEFAULT,
+        feature_name=globalvar.FEATURE_ATTR_NAME,
+        dtype="float32",
+    ):
+        """
+        Build a graph from an edge list that is read in chunks, such as a large CSV file read
+        with ``pandas.read_csv(path, chunksize=...)``.
+
+        Each chunk is processed in a pool of worker processes, which find its node IDs and edge
+        types and partially sort its edges for the adjacency indices, and then the chunks are
+        merged with bulk NumPy operations. Only a few chunks are read ahead of the workers, so
+        the edge list doesn't need to fit in memory as a single DataFrame.
+
+        The result is the same as ``StellarGraph(nodes=nodes, edges=pd.concat(edges))``.
+
+        Args:
+            edges (iterable of DataFrame): the chunks of the edge list, each in the format of
+                the ``edges`` argument of :class:`StellarGraph` (but not a dictionary: the edge
+                types come from an ``edge_type_name`` column, or are ``edge_type_default``)
+            nodes (DataFrame, IndexedArray or dict of hashable to those, optional): the nodes,
+                as for :class:`StellarGraph`; if not specified, the nodes are the IDs used in
+                ``edges``, in order of appearance, without features
+            is_directed (bool, optional): whether the graph is directed
+            workers (int, optional): the number of processes to use; defaults to the number of
+                CPUs. With 1, the chunks are processed in this process.
+            source_column, target_column, edge_weight_label, node_type_name, edge_type_name,
+                node_type_default, edge_type_default, feature_name, dtype: as for
+                :class:`StellarGraph`
+
+        Returns:
+            A :class:`StellarGraph` or :class:`StellarDiGraph` using the ``"csr"`` backend.
+        """
+        from .graph_csr import _from_edge_chunks
+
+        return StellarGraph._wrap_backend(
+            _from_edge_chunks(
+                edges,
+                nodes,
+                is_directed,
+                workers,
+                source_column,
+                target_column,
+                edge_weight_label,
+                node_type_name,
+                edge_type_name,
+                node_type_default,
+                edge_type_default,
+                feature_name,
+                dtype,
+            )
+        )
+
+    def save(self, path):
+        """
+        Save this graph to disk, so that it can be reloaded quickly with
+        :meth:`StellarGraph.load`.
+
+        The graph is stored in a columnar format: a directory with a ``.npy`` file for
+        each of the node IDs, node types, edges (including their adjacency indices),
+        edge weights and the node features of each type, along with a small JSON file
+        of metadata.
+
+        Args:
+            path (str): the directory to save the graph into; it is created if it
+                doesn't exist.
+        """
+        self._graph.save(path)
+
+    @staticmethod
+    def load(path, mmap=True):
+        """
+        Load a graph saved by :meth:`StellarGraph.save`.
+
+        The loaded graph always uses the ``"csr"`` backend. By default, its arrays are
+        memory-mapped rather than read, so loading is almost instant, even for large
+        graphs, and many processes loading the same graph share a single copy in
+        memory through the operating system's page cache.
+
+        Args:
+            path (str): the directory the graph was saved into.
+            mmap (bool, optional): if True, memory-map the arrays, otherwise read them
+                into memory.
+
+        Returns:
+            A :class:`StellarGraph` or :class:`StellarDiGraph`, depending on whether the
+            saved graph was directed.
+        """
+        from .graph_csr import _load
+
+        return StellarGraph._wrap_backend(_load(path, mmap=mmap))
+
+    def share(self, path=None):
+        """
+        Create a copy of this graph that can be sent to other processes cheaply, such as the
+        workers used by Keras' ``fit_generator(workers=N, use_multiprocessing=True)``.
+
+        The graph's arrays are saved (see :meth:`save`) and memory-mapped, and the copy pickles
+        as a small handle to those files: each worker maps the same files when it unpickles the
+        graph, so nothing is copied and the operating system's page cache holds a single copy
+        for every process. The generators and sequences should be created from the shared copy.
+
+        Changing the shared copy with :meth:`add_nodes`, :meth:`add_edges` or
+        :meth:`remove_edges` detaches it from the files, and it is pickled in full after that.
+
+        Args:
+            path (str, optional): the directory to save the arrays into. If not specified, a
+                temporary directory is used, and it is deleted when the returned graph is
+                garbage collected in this process.
+
+        Returns:
+            A :class:`StellarGraph` or :class:`StellarDiGraph` using the ``"csr"`` backend.
+        """
+        from .graph_csr import _share
+
+        return StellarGraph._wrap_backend(_share(self._graph, path))
+
+    @staticmethod
+    def _wrap_backend(graph):
+        cls = StellarDiGraph if graph.is_directed() else StellarGraph
+        wrapped = cls.__new__(cls)
+        wrapped._graph = graph
+        return wrapped
+
     # FIXME: Experimental/special-case methods that need to be considered more; the underscores
     # denote "package private", not fully private, and so are ok to use in the rest of stellargraph
     def _get_index_for_nodes(self, nodes, node_type=None):
@@ -472,6 +992,10 @@ class StellarGraph:
 
             {edge_type_triple: {source_node: [target_node, ...]}}
 
+        Each inner mapping is an ``EdgeTypeAdjacency`` of compact arrays, which returns
+        ``[None]`` for nodes without any neighbours of that type. These are built once per
+        graph and shared between all callers.
+
         Args:
             graph_schema: The graph schema.
         Returns:
@@ -479,6 +1003,23 @@ class StellarGraph:
         """
         return self._graph.adjacency_types(graph_schema)
 
+    def _neighbour_arrays(self, include_edge_weight=False):
+        """
+        The neighbours of every node, in the same form as a SciPy CSR matrix: the neighbours of
+        the node with index ``i`` (see :meth:`ids_to_index`) are the indices
+        ``neighbours[offsets[i]:offsets[i + 1]]``, with the same multiplicity as
+        :meth:`neighbors`. These are built once per graph and shared between all callers.
+
+        Args:
+            include_edge_weight (bool): if True, also return the weight of the edge to each
+                neighbour (1 for unweighted graphs, and NaN for missing weights)
+
+        Returns:
+            A tuple of the ``offsets`` and ``neighbours`` NumPy arrays, and the ``weights``
+            array if ``include_edge_weight``.
+        """
+        return self._graph.neighbour_arrays(include_edge_weight)
+
     def _edge_weights(self, source_node: Any, target_node: Any) -> List[Any]:
         """
         Obtains the weights of edges between the given pair of nodes.
@@ -507,6 +1048,11 @@ class StellarDiGraph(StellarGraph):
         target_name=globalvar.TARGET_ATTR_NAME,
         node_features=None,
         dtype="float32",
+        backend=None,
+        nodes=None,
+        edges=None,
+        source_column="source",
+        target_column="target",
     ):
         super().__init__(
             graph=graph,
@@ -520,4 +1066,9 @@ class StellarDiGraph(StellarGraph):
             target_name=target_name,
             node_features=node_features,
             dtype=dtype,
+            backend=backend,
+            nodes=nodes,
+            edges=edges,
+            source_column=source_column,
+            target_column=target_column,
         )
@@ -0,0 +1,2073 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright 2020 Data61, CSIRO
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+The StellarGraph implementation that stores the graph in compact NumPy arrays, with compressed
+sparse row (CSR) indices for the edges.
+
+"""
+__all__ = ["CSRStellarGraph"]
+
+from collections import defaultdict, deque
+from functools import partial
+import json
+import multiprocessing
+import os
+import shutil
+import tempfile
+import weakref
+
+import numpy as np
+import pandas as pd
+import networkx as nx
+import scipy.sparse as sps
+
+from typing import Iterable, Any, Mapping, List, Optional
+
+from .. import globalvar
+from .element_data import (
+    ExternalIdIndex,
+    NodeData,
+    EdgeData,
+    gather_rows,
+    neighbour_index,
+    typed_adjacency,
+    _compress_features,
+    _concat_features,
+    _csr_merge,
+    _edge_type_triples,
+    _extend_type_codes,
+    _graph_schema,
+    _group_features,
+    _group_ranks,
+    _ids_to_array,
+    _index_array,
+    _select_features,
+    _smallest_index_dtype,
+    _type_codes,
+    _type_groups,
+)
+from .indexed_array import IndexedArray
+from .quantised_array import QuantisedArray
+from .graph import StellarGraph
+from .graph_networkx import (
+    NeighbourWithWeight,
+    _convert_from_node_attribute,
+    _degree_summary,
+    _convert_from_node_data,
+    _sparse_frame_values,
+)
+from .schema import EdgeType, GraphSchema
+from .utils import is_real_iterable
+
+
+_METADATA_FILE = "stellargraph.json"
+_FORMAT_VERSION = 1
+
+
+class CSRStellarGraph(StellarGraph):
+    """
+    Implementation based on NumPy arrays, without any per-node or per-edge Python objects.
+
+    Nodes are identified internally by their iloc (their position in the node arrays), and the
+    edges of each node are found with an offset into arrays of edges sorted by source (for
+    out-edges) and by target (for in-edges).
+
+    Args:
+        is_directed (bool): whether the graph is directed
+        nodes (NodeData): the nodes, their types and their features
+        edges (EdgeData): the edges, their types and their weights
+        edge_weight_label (str): the attribute name to use for weights in ``to_networkx``
+        node_type_name (str): the attribute name to use for node types in ``to_networkx``
+        edge_type_name (str): the attribute name to use for edge types in ``to_networkx``
+        node_type_default (str): the type of nodes added without a type
+        edge_type_default (str): the type of edges added without a type
+        feature_name (str): the attribute name to use for node features in ``to_networkx``
+    """
+
+    def __init__(
+        self,
+        is_directed,
+        nodes,
+        edges,
+        edge_weight_label="weight",
+        node_type_name=globalvar.TYPE_ATTR_NAME,
+        edge_type_name=globalvar.TYPE_ATTR_NAME,
+        node_type_default=globalvar.NODE_TYPE_DEFAULT,
+        edge_type_default=globalvar.EDGE_TYPE_DEFAULT,
+        feature_name=globalvar.FEATURE_ATTR_NAME,
+    ):
+        self._is_directed = is_directed
+        self._node_data = nodes
+        self._edge_data = edges
+
+        self._edge_weight_label = edge_weight_label
+        self._node_type_attr = node_type_name
+        self._edge_type_attr = edge_type_name
+        self._node_type_default = node_type_default
+        self._edge_type_default = edge_type_default
+        self._feature_attr = feature_name
+
+        # nodes and edges that have been added, but not yet merged into the arrays: they are
+        # merged in bulk the next time the arrays are used, so that a sequence of additions only
+        # rebuilds the arrays once
+        self._pending_nodes = []
+        self._pending_edges = []
+
+        # the typed adjacency of each edge type triple, the node degree arrays, the schema and
+        # the nodes grouped by type, built on first use, and reset with `_invalidate_caches` if
+        # the graph changes
+        self._adjacency_cache = {}
+        self._degree_cache = {}
+        self._schema = None
+        self._edge_type_triple_counts = None
+        self._node_type_groups = None
+        self._neighbour_index = None
+
+        # the directory the arrays are memory-mapped from, if they're exactly a saved graph, so
+        # that pickling can refer to the files rather than copy the arrays
+        self._shared_path = None
+
+    def __reduce_ex__(self, protocol):
+        if self._shared_path is not None:
+            # a lightweight handle: unpickling maps the same files, without copying any arrays
+            return (_load, (self._shared_path, True))
+        return super().__reduce_ex__(protocol)
+
+    @property
+    def _nodes(self):
+        if self._pending_nodes or self._pending_edges:
+            self._merge_pending()
+        return self._node_data
+
+    @property
+    def _edges(self):
+        if self._pending_nodes or self._pending_edges:
+            self._merge_pending()
+        return self._edge_data
+
+    def _invalidate_caches(self):
+        """
+        Discard the structures derived from the nodes and edges, which are rebuilt on first use.
+        """
+        self._adjacency_cache = {}
+        self._degree_cache = {}
+        self._schema = None
+        self._edge_type_triple_counts = None
+        self._node_type_groups = None
+        self._neighbour_index = None
+        # the arrays no longer match the saved files
+        self._shared_path = None
+
+    def _pending_node_ids(self):
+        return _append_indexes([ids for _, ids, _ in self._pending_nodes])
+
+    def _known_ids(self, ids):
+        """
+        Whether each of ``ids`` is a node in the graph, including nodes that have been added but
+        not merged.
+        """
+        known = self._node_data.ids.to_iloc(ids) >= 0
+        if self._pending_nodes and not known.all():
+            known[~known] = pd.Index(ids[~known]).isin(self._pending_node_ids())
+        return known
+
+    def _feature_width(self, node_type):
+        """
+        The number of features of nodes of ``node_type``, where 0 means no features, or None if
+        there are no such nodes.
+        """
+        for ty, _, values in reversed(self._pending_nodes):
+            if ty == node_type:
+                return 0 if values is None else values.shape[1]
+
+        features = self._node_data.features.get(node_type)
+        if features is not None:
+            return features.shape[1]
+        if self._node_data.type_code(node_type) is not None:
+            return 0
+        return None
+
+    def add_nodes(self, nodes):
+        frames = _as_typed_frames(
+            nodes,
+            self._node_type_default,
+            "nodes",
+            allowed=(pd.DataFrame, IndexedArray),
+        )
+
+        chunks = []
+        for node_type, df in frames.items():
+            existing = self._node_data.features.get(node_type)
+            dtype = "float32" if existing is None else existing.dtype
+            values = _node_feature_values(df, dtype)
+
+            expected = self._feature_width(node_type)
+            found = 0 if values is None else values.shape[1]
+            if expected is not None and found != expected:
+                raise ValueError(
+                    f"nodes[{node_type!r}]: expected {expected} feature columns, matching the existing nodes of this type, found {found}"
+                )
+            chunks.append((node_type, pd.Index(df.index), values))
+
+        new_ids = _append_indexes([ids for _, ids, _ in chunks])
+        duplicated = new_ids[
+            new_ids.duplicated() | self._known_ids(new_ids.to_numpy())
+        ].unique()
+        if len(duplicated) > 0:
+            raise ValueError(
+                f"nodes: expected IDs to appear once, found some that appeared more: {list(duplicated)}"
+            )
+
+        self._pending_nodes.extend(chunks)
+        self._invalidate_caches()
+
+    def add_edges(self, edges, source_column, target_column):
+        frames = _as_typed_frames(edges, self._edge_type_default, "edges")
+        sources, targets, type_values, weights, feature_chunks = _edge_columns(
+            frames,
+            source_column,
+            target_column,
+            self._edge_weight_label,
+            self._edge_type_attr,
+        )
+
+        endpoints = np.concatenate([sources, targets])
+        unknown = endpoints[~self._known_ids(endpoints)]
+        if len(unknown) > 0:
+            raise ValueError(
+                f"edges: expected all source and target node IDs to be contained in the graph, found some missing: {list(pd.unique(unknown))}"
+            )
+
+        self._pending_edges.append(
+            (sources, targets, type_values, weights, feature_chunks)
+        )
+        self._invalidate_caches()
+
+    def _merge_pending(self):
+        """
+        Merge the pending nodes and edges into the arrays, in bulk.
+        """
+        nodes = self._node_data
+        if self._pending_nodes:
+            nodes = _append_nodes(nodes, self._pending_nodes, self._node_type_default)
+
+        pending_edges = self._pending_edges
+        sources = [ids for ids, _, _, _, _ in pending_edges]
+        targets = [ids for _, ids, _, _, _ in pending_edges]
+        type_values = [types for _, _, types, _, _ in pending_edges]
+        if any(weights is not None for _, _, _, weights, _ in pending_edges):
+            weights = np.concatenate(
+                [
+                    np.full(len(s), np.nan) if w is None else w
+                    for s, _, _, w, _ in pending_edges
+                ]
+            )
+        else:
+            weights = None
+        feature_chunks = [
+            chunk for _, _, _, _, chunks in pending_edges for chunk in chunks
+        ]
+
+        edges = self._edge_data.append(
+            nodes.ids.to_iloc(_concat_or_empty(sources), strict=True),
+            nodes.ids.to_iloc(_concat_or_empty(targets), strict=True),
+            _concat_or_empty(type_values, dtype=object),
+            weights,
+            len(nodes),
+            self._edge_type_default,
+            feature_chunks,
+        )
+
+        self._node_data = nodes
+        self._edge_data = edges
+        self._pending_nodes = []
+        self._pending_edges = []
+
+    def remove_edges(self, edges):
+        nodes = self._nodes
+        all_edges = self._edges
+
+        keep = np.ones(len(all_edges), dtype=bool)
+        missing = []
+        for edge in edges:
+            if len(edge) not in (2, 3):
+                raise ValueError(
+                    f"edges: expected (source, target) pairs or (source, target, type) triples, found {edge!r}"
+                )
+
+            source = nodes.ids.to_single_iloc(edge[0])
+            target = nodes.ids.to_single_iloc(edge[1])
+            type_codes = None if len(edge) == 2 else all_edges.type_codes_of([edge[2]])
+            if source < 0 or target < 0 or type_codes == []:
+                missing.append(edge)
+                continue
+
+            out_ilocs = all_edges.out_edge_ilocs(source, type_codes)
+            matched = [out_ilocs[all_edges.targets[out_ilocs] == target]]
+            if not self.is_directed():
+                in_ilocs = all_edges.in_edge_ilocs(source, type_codes)
+                matched.append(in_ilocs[all_edges.sources[in_ilocs] == target])
+
+            matched = np.concatenate(matched)
+            if len(matched) == 0:
+                missing.append(edge)
+            keep[matched] = False
+
+        if missing:
+            raise KeyError(f"edges not found: {missing}")
+
+        self._edge_data = all_edges.remove(keep)
+        self._invalidate_caches()
+
+    def __repr__(self):
+        directed_str = "Directed" if self.is_directed() else "Undirected"
+        s = "{}: {} multigraph\n".format(type(self).__name__, directed_str)
+        s += "    Nodes: {}, Edges: {}\n".format(
+            self.number_of_nodes(), self.number_of_edges()
+        )
+        return s
+
+    def _node_ilocs(self, nodes, use_index=False):
+        if use_index:
+            ilocs = np.asarray(nodes, dtype=np.int64)
+            invalid = (ilocs < 0) | (ilocs >= len(self._nodes))
+            if invalid.any():
+                raise IndexError(
+                    f"expected node indices in the range [0, {len(self._nodes)}), found: {ilocs[invalid].tolist()}"
+                )
+            return ilocs
+        return self._nodes.ids.to_iloc(nodes, strict=True)
+
+    def _single_node_iloc(self, node, use_index=False):
+        if use_index:
+            if not 0 <= node < len(self._nodes):
+                raise IndexError(
+                    f"expected node indices in the range [0, {len(self._nodes)}), found: {[node]}"
+                )
+            return node
+
+        iloc = self._nodes.ids.to_single_iloc(node)
+        if iloc < 0:
+            raise KeyError(f"unknown IDs: {[node]}")
+        return iloc
+
+    def ids_to_index(self, ids):
+        return self._nodes.ids.to_iloc(ids, strict=True)
+
+    def index_to_ids(self, indices):
+        return self._nodes.ids.from_iloc(indices, strict=True)
+
+    def _infer_node_type(self, nodes, use_index=False):
+        known = [n for n in nodes if n is not None]
+        if len(known) == 0:
+            raise ValueError(
+                "At least one node must be given if node_type not specified"
+            )
+
+        if use_index:
+            ilocs = np.asarray(known)
+            self._nodes.ids.from_iloc(ilocs, strict=True)
+        else:
+            ilocs = self._node_ilocs(known)
+        codes = self._nodes.codes_of_ilocs(ilocs)
+        if len(codes) > 1:
+            raise ValueError("All nodes must be of the same type.")
+
+        return self._nodes.types[codes[0]]
+
+    def _feature_rows(self, nodes, node_type, use_index=False):
+        """
+        The rows of the feature array for ``node_type`` holding the features of each of
+        ``nodes`` (IDs, or ilocs if ``use_index``), where ``None`` maps to one past the end (a
+        row of zeros) and unknown nodes to -1.
+        """
+        features = self._nodes.features[node_type]
+        if use_index:
+            ilocs, is_none = _index_array(nodes, len(self._nodes))
+            invalid = (ilocs < 0) & ~is_none
+            if invalid.any():
+                raise IndexError(
+                    f"expected node indices in the range [0, {len(self._nodes)}), found: {list(np.asarray(nodes, dtype=object)[invalid])}"
+                )
+        else:
+            is_none = np.array([n is None for n in nodes], dtype=bool)
+            ilocs = self._nodes.ids.to_iloc(nodes)
+
+        nodes_data = self._nodes
+        type_code = nodes_data.type_code(node_type)
+        ranges = nodes_data.type_ranges()
+        rows = np.full(len(nodes), -1, dtype=np.int64)
+
+        if ranges is not None:
+            # the nodes of the type are a range of ilocs, so the type check is a comparison and
+            # (usually) the feature row is just an offset
+            start, end = ranges[type_code], ranges[type_code + 1]
+            valid = (ilocs >= start) & (ilocs < end)
+            offset = nodes_data.feature_row_offset(type_code)
+            if offset is not None:
+                rows[valid] = ilocs[valid] - offset
+            else:
+                rows[valid] = nodes_data.feature_rows[ilocs[valid]]
+        else:
+            valid = ilocs >= 0
+            valid[valid] &= nodes_data.type_codes[ilocs[valid]] == type_code
+            rows[valid] = nodes_data.feature_rows[ilocs[valid]]
+
+        rows[is_none] = features.shape[0]
+        return rows
+
+    def check_graph_for_ml(self, features=True):
+        """
+        Checks if all properties required for machine learning training/inference are set up.
+        An error will be raised if the graph is not correctly setup.
+        """
+        if features and len(self._nodes.features) == 0:
+            raise RuntimeError(
+                "This StellarGraph has no numeric feature attributes for nodes"
+                "Node features are required for machine learning"
+            )
+
+    def get_index_for_nodes(self, nodes, node_type=None):
+        """
+        Get the indices for the specified node or nodes.
+        If the node type is not specified the node types will be found
+        for all nodes. It is therefore important to supply the ``node_type``
+        for this method to be fast.
+
+        Args:
+            n: (list or hashable) Node ID or list of node IDs
+            node_type: (hashable) the type of the nodes.
+
+        Returns:
+            Numpy array containing the indices for the requested nodes.
+        """
+        if not is_real_iterable(nodes):
+            nodes = [nodes]
+
+        if node_type is None:
+            node_type = self._infer_node_type(nodes)
+
+        rows = self._feature_rows(nodes, node_type)
+        return [None if r < 0 else r for r in rows.tolist()]
+
+    def node_features(self, nodes, node_type=None, use_index=False):
+        """
+        Get the numeric feature vectors for the specified node or nodes.
+        If the node type is not specified the node types will be found
+        for all nodes. It is therefore important to supply the ``node_type``
+        for this method to be fast.
+
+        Args:
+            n: (list or hashable) Node ID or list of node IDs
+            node_type: (hashable) the type of the nodes.
+            use_index (bool): if True, ``nodes`` are node indices rather than node IDs.
+
+        Returns:
+            Numpy array containing the node features for the requested nodes.
+        """
+        if not is_real_iterable(nodes):
+            nodes = [nodes]
+
+        if node_type is None:
+            node_type = self._infer_node_type(nodes, use_index)
+
+        if node_type not in self._nodes.features:
+            raise ValueError(f"Features not found for node type '{node_type}'")
+
+        features = self._nodes.features[node_type]
+        if len(nodes) == 0:
+            return np.empty((0, features.shape[1]))
+
+        rows = self._feature_rows(nodes, node_type, use_index)
+        if (rows < 0).any():
+            problem_nodes = [node for node, row in zip(nodes, rows) if row < 0]
+            kind = "indices" if use_index else "IDs"
+            raise ValueError(
+                f"Could not find features for nodes with {kind} {problem_nodes}."
+            )
+
+        return gather_rows(features, rows)
+
+    def node_features_by_index(self, indices, node_type):
+        """
+        Get the numeric feature vectors for nodes specified by their indices in the feature
+        array of ``node_type``, as returned by ``get_index_for_nodes``.
+
+        Args:
+            indices (array of int): the feature indices of the nodes
+            node_type (hashable): the type of the nodes.
+
+        Returns:
+            Numpy array containing the node features for the requested nodes.
+        """
+        try:
+            features = self._nodes.features[node_type]
+        except KeyError:
+            raise ValueError(f"Features not found for node type '{node_type}'")
+
+        return gather_rows(features, indices)
+
+    def node_feature_sizes(self, node_types=None):
+        """
+        Get the feature sizes for the specified node types.
+
+        Args:
+            node_types: (list) A list of node types. If None all current node types
+                will be used.
+
+        Returns:
+            A dictionary of node type and integer feature size.
+        """
+        if not node_types:
+            node_types = self.node_types
+
+        self.check_graph_for_ml(features=True)
+
+        return {nt: self._nodes.features[nt].shape[1] for nt in node_types}
+
+    def edge_features(self, edges, edge_type=None):
+        edge_ilocs = np.asarray(edges, dtype=np.int64)
+        edge_data = self._edges
+        invalid = (edge_ilocs < 0) | (edge_ilocs >= len(edge_data))
+        if invalid.any():
+            raise IndexError(
+                f"expected edge indices in the range [0, {len(edge_data)}), found: {edge_ilocs[invalid].tolist()}"
+            )
+
+        codes = edge_data.type_codes[edge_ilocs]
+        if edge_type is None:
+            unique = np.unique(codes)
+            if len(unique) != 1:
+                raise ValueError(
+                    "edge_type: expected a type when the edges do not have a single type, found types: "
+                    f"{[edge_data.types[c] for c in unique]}"
+                )
+            edge_type = edge_data.types[unique[0]]
+
+        features = edge_data.features.get(edge_type)
+        if features is None:
+            raise ValueError(f"Features not found for edge type '{edge_type}'")
+
+        rows = edge_data.feature_rows[edge_ilocs]
+        problems = (codes != edge_data.type_code(edge_type)) | (rows < 0)
+        if problems.any():
+            raise ValueError(
+                f"Could not find features of type '{edge_type}' for edges with indices {edge_ilocs[problems].tolist()}."
+            )
+
+        return gather_rows(features, rows)
+
+    def edge_feature_sizes(self, edge_types=None):
+        features = self._edges.features
+        if edge_types is None:
+            edge_types = features.keys()
+        return {et: features[et].shape[1] for et in edge_types if et in features}
+
+    def compress_node_features(self, storage="float16", node_types=None):
+        nodes = self._nodes
+        nodes.features = _compress_features(nodes.features, storage, node_types)
+        self._invalidate_caches()
+
+    def nodes_of_type(self, node_type=None):
+        """
+        Get the nodes of the graph with the specified node types.
+
+        Args:
+            node_type:
+
+        Returns:
+            A list of node IDs with type node_type
+        """
+        if node_type is None:
+            return list(self.nodes())
+
+        code = self._nodes.type_code(node_type)
+        if code is None:
+            return []
+
+        ranges = self._nodes.type_ranges()
+        if ranges is not None:
+            return self._nodes.ids.pandas_index[
+                ranges[code] : ranges[code + 1]
+            ].tolist()
+
+        offsets, ilocs = self._type_groups()
+        return self._nodes.ids.from_iloc(
+            ilocs[offsets[code] : offsets[code + 1]]
+        ).tolist()
+
+    def _type_groups(self):
+        if self._node_type_groups is None:
+            nodes = self._nodes
+            ranges = nodes.type_ranges()
+            if ranges is not None:
+                # already grouped, so there's no need to sort
+                dtype = _smallest_index_dtype(len(nodes))
+                self._node_type_groups = ranges, np.arange(len(nodes), dtype=dtype)
+            else:
+                self._node_type_groups = _type_groups(
+                    nodes.type_codes, len(nodes.types)
+                )
+        return self._node_type_groups
+
+    def _node_type_counts(self):
+        offsets, _ = self._type_groups()
+        counts = np.diff(offsets)
+        return {ty: count for ty, count in zip(self._nodes.types, counts) if count > 0}
+
+    def node_type(self, node):
+        """
+        Get the type of the node
+
+        Args:
+            node: Node ID
+
+        Returns:
+            Node type
+        """
+        iloc = self._single_node_iloc(node)
+        return self._nodes.types[self._nodes.type_codes[iloc]]
+
+    @property
+    def node_types(self):
+        """
+        Get a list of all node types in the graph.
+
+        Returns:
+            set of types
+        """
+        if len(self._nodes.features) > 0:
+            return set(self._nodes.features.keys())
+
+        return set(self._node_type_counts().keys())
+
+    def info(self, show_attributes=True, sample=None):
+        """
+        Return an information string summarizing information on the current graph.
+        This includes node and edge type information and their attributes.
+
+        Args:
+            show_attributes (bool, default True): If True, include the feature sizes of
+                each node type
+            sample: ignored, because the summary is computed from the cached arrays directly,
+                and nodes and edges have no attributes other than features and weights.
+
+        Returns:
+            An information string.
+        """
+        directed_str = "Directed" if self.is_directed() else "Undirected"
+        s = "{}: {} multigraph\n".format(type(self).__name__, directed_str)
+        s += " Nodes: {}, Edges: {}\n".format(
+            self.number_of_nodes(), self.number_of_edges()
+        )
+        s += _degree_summary(self.degree_array("both", None, False))
+
+        gs = self.create_graph_schema()
+        node_counts = self._node_type_counts()
+
+        s += "\n Node types:\n"
+        for nt in gs.node_types:
+            s += "  {}: [{}]\n".format(nt, node_counts.get(nt, 0))
+
+            if show_attributes and nt in self._nodes.features:
+                features = self._nodes.features[nt]
+                s += "        Features: {} vector, length {}\n".format(
+                    features.dtype, features.shape[1]
+                )
+
+            s += "    Edge types: "
+            s += ", ".join(["{}-{}->{}".format(*e) for e in gs.schema[nt]]) + "\n"
+
+        s += "\n Edge types:\n"
+        for et, count in self._edge_triple_counts().items():
+            s += "    {et[0]}-{et[1]}->{et[2]}: [{len}]\n".format(et=et, len=count)
+
+        return s
+
+    def _edge_triples(self, edge_ilocs=None):
+        """
+        The unique (source node type, edge type, target node type) codes of the given edges,
+        along with the number of edges with each; these are cached for all edges.
+        """
+        if edge_ilocs is not None:
+            return _edge_type_triples(self._nodes.type_codes, self._edges, edge_ilocs)
+
+        if self._edge_type_triple_counts is None:
+            self._edge_type_triple_counts = _edge_type_triples(
+                self._nodes.type_codes, self._edges
+            )
+        return self._edge_type_triple_counts
+
+    def _edge_triple_counts(self):
+        triples, counts = self._edge_triples()
+        node_types = self._nodes.types
+        edge_types = self._edges.types
+        return {
+            EdgeType(node_types[n1], edge_types[rel], node_types[n2]): count
+            for (n1, rel, n2), count in zip(triples, counts)
+        }
+
+    def create_graph_schema(self, nodes=None):
+        """
+        Create graph schema in dict of dict format from current graph.
+
+        Note the assumption we make that there is only one
+        edge of a particular edge type per node pair.
+
+        This means that specifying an edge by node0, node1 and edge type
+        is unique.
+
+        Arguments:
+            nodes (list): A list of node IDs to use to build schema. This must
+                represent all node types and all edge types in the graph.
+                If not specified, all nodes and edges in the graph are used.
+
+        Returns:
+            GraphSchema object.
+        """
+        if nodes is None:
+            # the schema of the whole graph is computed once, and shared by every caller
+            if self._schema is None:
+                offsets, _ = self._type_groups()
+                triples, _ = self._edge_triples()
+                self._schema = _graph_schema(
+                    self.is_directed(),
+                    self._nodes.types,
+                    np.flatnonzero(np.diff(offsets)),
+                    self._edges.types,
+                    triples,
+                )
+            return self._schema
+        else:
+            node_ilocs = self._node_ilocs(nodes)
+            node_codes = np.unique(self._nodes.type_codes[node_ilocs])
+
+            # match `networkx`'s `edges(nbunch)`: out-edges for a directed graph, and any incident
+            # edge for an undirected one
+            selected = np.zeros(self.number_of_nodes(), dtype=bool)
+            selected[node_ilocs] = True
+            edge_mask = selected[self._edges.sources]
+            if not self.is_directed():
+                edge_mask |= selected[self._edges.targets]
+            edge_ilocs = np.flatnonzero(edge_mask)
+
+        triples, _ = self._edge_triples(edge_ilocs)
+        return _graph_schema(
+            self.is_directed(),
+            self._nodes.types,
+            node_codes,
+            self._edges.types,
+            triples,
+        )
+
+    ######################################################################
+    # Generic graph interface:
+
+    def is_directed(self) -> bool:
+        return self._is_directed
+
+    def number_of_nodes(self) -> int:
+        return len(self._nodes)
+
+    def number_of_edges(self) -> int:
+        return len(self._edges)
+
+    def nodes(self, use_index=False) -> Iterable[Any]:
+        if use_index:
+            return np.arange(len(self._nodes), dtype=self._nodes.ids.dtype)
+        return self._nodes.ids.pandas_index
+
+    def edges(self, triple=False) -> Iterable[Any]:
+        ids = self._nodes.ids
+        sources = ids.from_iloc(self._edges.sources).tolist()
+        targets = ids.from_iloc(self._edges.targets).tolist()
+        if triple:
+            types = np.asarray(self._edges.types, dtype=object)[self._edges.type_codes]
+            return list(zip(sources, targets, types.tolist()))
+
+        return list(zip(sources, targets))
+
+    def has_node(self, node: Any) -> bool:
+        return self._nodes.ids.contains_external(node)
+
+    def _transform_edges(
+        self, edge_ilocs, other_ilocs, include_edge_weight, use_index=False
+    ):
+        if use_index:
+            neighbours = other_ilocs.tolist()
+        else:
+            neighbours = self._nodes.ids.from_iloc(other_ilocs).tolist()
+        if not include_edge_weight:
+            return neighbours
+
+        weights = self._weights_or_none(edge_ilocs)
+
+        return [NeighbourWithWeight(n, w) for n, w in zip(neighbours, weights)]
+
+    def _edge_type_codes(self, edge_types):
+        return None if edge_types is None else self._edges.type_codes_of(edge_types)
+
+    def _in_edges(self, iloc, type_codes=None):
+        edge_ilocs = self._edges.in_edge_ilocs(iloc, type_codes)
+        return edge_ilocs, self._edges.sources[edge_ilocs]
+
+    def _out_edges(self, iloc, type_codes=None):
+        edge_ilocs = self._edges.out_edge_ilocs(iloc, type_codes)
+        return edge_ilocs, self._edges.targets[edge_ilocs]
+
+    def _undirected_edges(self, iloc, type_codes=None):
+        out_ilocs, out_others = self._out_edges(iloc, type_codes)
+        in_ilocs, in_others = self._in_edges(iloc, type_codes)
+
+        # self loops appear in both the in- and out-edges, but are only reported once
+        not_loop = in_others != iloc
+        return (
+            np.concatenate([out_ilocs, in_ilocs[not_loop]]),
+            np.concatenate([out_others, in_others[not_loop]]),
+        )
+
+    def neighbors(
+        self, node: Any, include_edge_weight=False, edge_types=None, use_index=False
+    ) -> Iterable[Any]:
+        iloc = self._single_node_iloc(node, use_index)
+        type_codes = self._edge_type_codes(edge_types)
+        if self.is_directed():
+            in_ilocs, in_others = self._in_edges(iloc, type_codes)
+            out_ilocs, out_others = self._out_edges(iloc, type_codes)
+            edge_ilocs = np.concatenate([in_ilocs, out_ilocs])
+            others = np.concatenate([in_others, out_others])
+        else:
+            edge_ilocs, others = self._undirected_edges(iloc, type_codes)
+
+        return self._transform_edges(edge_ilocs, others, include_edge_weight, use_index)
+
+    def in_nodes(
+        self, node: Any, include_edge_weight=False, edge_types=None, use_index=False
+    ) -> Iterable[Any]:
+        if not self.is_directed():
+            return self.neighbors(node, include_edge_weight, edge_types, use_index)
+
+        edge_ilocs, others = self._in_edges(
+            self._single_node_iloc(node, use_index), self._edge_type_codes(edge_types)
+        )
+        return self._transform_edges(edge_ilocs, others, include_edge_weight, use_index)
+
+    def out_nodes(
+        self, node: Any, include_edge_weight=False, edge_types=None, use_index=False
+    ) -> Iterable[Any]:
+        if not self.is_directed():
+            return self.neighbors(node, include_edge_weight, edge_types, use_index)
+
+        edge_ilocs, others = self._out_edges(
+            self._single_node_iloc(node, use_index), self._edge_type_codes(edge_types)
+        )
+        return self._transform_edges(edge_ilocs, others, include_edge_weight, use_index)
+
+    ########################################################################
+    # Heavy duty methods:
+
+    def degree_array(self, direction, edge_types, weighted):
+        key = (direction, edge_types, weighted)
+        degrees = self._degree_cache.get(key)
+        if degrees is None:
+            edges = self._edges
+            if not self.is_directed():
+                # every edge is both an in- and an out-edge
+                direction = "both"
+
+            if weighted:
+                # like NetworkX, edges without a weight have weight 1
+                weights = edges.weights_or_ones("float64")
+                weights = np.where(np.isnan(weights), 1.0, weights)
+            else:
+                weights = None
+
+            degrees = edges.degrees(
+                direction, self._edge_type_codes(edge_types), weights
+            )
+            degrees.flags.writeable = False
+            self._degree_cache[key] = degrees
+        return degrees
+
+    def node_degrees(self) -> Mapping[Any, int]:
+        degrees = self.degree_array("both", None, False)
+        return dict(zip(self.nodes(), degrees.tolist()))
+
+    def to_adjacency_matrix(
+        self,
+        nodes: Optional[Iterable] = None,
+        edge_types=None,
+        weighted=True,
+        format="csr",
+        directed=None,
+    ):
+        if weighted:
+            # like NetworkX, edges without a weight have weight 1
+            weights = self._edges.weights_or_ones()
+            weights = np.where(np.isnan(weights), 1, weights)
+        else:
+            weights = None
+
+        return _adjacency_matrix(
+            self._edges,
+            weights,
+            None if nodes is None else self._node_ilocs(nodes),
+            self._edge_type_codes(edge_types),
+            self.is_directed() if directed is None else directed,
+            format,
+        )
+
+    def subgraph(self, nodes, use_index=False):
+        return self._subgraph(self._node_ilocs(nodes, use_index))
+
+    def k_hop_subgraph(self, seeds, k, max_neighbours=None, use_index=False, seed=None):
+        if not isinstance(k, int) or k < 0:
+            raise ValueError(f"k: expected a non-negative integer, found {k!r}")
+        if max_neighbours is not None and (
+            not isinstance(max_neighbours, int) or max_neighbours <= 0
+        ):
+            raise ValueError(
+                f"max_neighbours: expected a positive integer or None, found {max_neighbours!r}"
+            )
+
+        edges = self._edges
+        random_state = np.random.RandomState(seed)
+
+        frontier = pd.unique(self._node_ilocs(seeds, use_index))
+        visited = np.zeros(len(self._nodes), dtype=bool)
+        visited[frontier] = True
+        hops = [frontier]
+
+        # a breadth-first search, where each step visits the whole frontier at once
+        for _ in range(k):
+            owners, neighbours = edges.neighbour_ilocs(frontier)
+            if max_neighbours is not None:
+                neighbours = neighbours[
+                    _sample_per_group(owners, max_neighbours, random_state)
+                ]
+
+            neighbours = pd.unique(neighbours)
+            frontier = neighbours[~visited[neighbours]]
+            if len(frontier) == 0:
+                break
+
+            visited[frontier] = True
+            hops.append(frontier)
+
+        return self._subgraph(np.concatenate(hops))
+
+    def _subgraph(self, node_ilocs):
+        """
+        The subgraph induced by ``node_ilocs``, which become the nodes of the new graph in that
+        order, with the feature arrays sliced to only the rows of those nodes.
+        """
+        nodes = self._nodes
+        edges = self._edges
+
+        sub_nodes = NodeData(
+            ExternalIdIndex(nodes.ids.from_iloc(node_ilocs)),
+            nodes.type_codes[node_ilocs],
+            nodes.types,
+            *_select_features(
+                nodes.features,
+                nodes.feature_rows,
+                nodes.type_codes,
+                nodes.types,
+                node_ilocs,
+            ),
+        )
+
+        edge_ilocs, sources, targets = edges.induced_edges(node_ilocs)
+        edge_features, edge_feature_rows = edges.select_features(edge_ilocs)
+        sub_edges = EdgeData(
+            sources,
+            targets,
+            edges.type_codes[edge_ilocs],
+            edges.types,
+            None if edges.weights is None else edges.weights[edge_ilocs],
+            len(node_ilocs),
+            features=edge_features,
+            feature_rows=edge_feature_rows,
+        )
+
+        return CSRStellarGraph(
+            self.is_directed(),
+            sub_nodes,
+            sub_edges,
+            edge_weight_label=self._edge_weight_label,
+            node_type_name=self._node_type_attr,
+            edge_type_name=self._edge_type_attr,
+            node_type_default=self._node_type_default,
+            edge_type_default=self._edge_type_default,
+            feature_name=self._feature_attr,
+        )
+
+    def save(self, path):
+        """
+        Save this graph to a directory of ``.npy`` files, one per array, that can be loaded with
+        :func:`_load`.
+        """
+        os.makedirs(path, exist_ok=True)
+        nodes = self._nodes
+        edges = self._edges
+
+        arrays = {
+            "node_ids": _ids_to_array(nodes.ids.pandas_index.values),
+            "node_type_codes": nodes.type_codes,
+            "node_feature_rows": nodes.feature_rows,
+            "edge_sources": edges.sources,
+            "edge_targets": edges.targets,
+            "edge_type_codes": edges.type_codes,
+            "edge_out_offsets": edges.out_offsets,
+            "edge_out_edges": edges.out_edges,
+            "edge_in_offsets": edges.in_offsets,
+            "edge_in_edges": edges.in_edges,
+        }
+        if edges.weights is not None:
+            arrays["edge_weights"] = edges.weights
+
+        feature_types = [
+            code for code, ty in enumerate(nodes.types) if ty in nodes.features
+        ]
+        quantised_feature_types = {}
+        sparse_feature_types = {}
+        for code in feature_types:
+            features = nodes.features[nodes.types[code]]
+            if sps.issparse(features):
+                # the CSR arrays are saved separately, the values as the features themselves
+                sparse_feature_types[code] = features.shape[1]
+                arrays[f"node_features_{code}_indices"] = features.indices
+                arrays[f"node_features_{code}_indptr"] = features.indptr
+                features = features.data
+            elif isinstance(features, QuantisedArray):
+                quantised_feature_types[code] = features.dtype.name
+                if features.scale is not None:
+                    arrays[f"node_features_{code}_scale"] = features.scale
+                    arrays[f"node_features_{code}_zero_point"] = features.zero_point
+                features = features.values
+            arrays[f"node_features_{code}"] = features
+
+        edge_feature_types = [
+            code for code, ty in enumerate(edges.types) if ty in edges.features
+        ]
+        if edge_feature_types:
+            arrays["edge_feature_rows"] = edges.feature_rows
+        for code in edge_feature_types:
+            arrays[f"edge_features_{code}"] = edges.features[edges.types[code]]
+
+        for name, array in arrays.items():
+            np.save(os.path.join(path, f"{name}.npy"), array)
+
+        metadata = {
+            "format_version": _FORMAT_VERSION,
+            "is_directed": self.is_directed(),
+            "node_types": nodes.types,
+            "edge_types": edges.types,
+            "feature_types": feature_types,
+            # JSON keys are strings
+            "quantised_feature_types": {
+                str(code): dtype for code, dtype in quantised_feature_types.items()
+            },
+            "sparse_feature_types": {
+                str(code): size for code, size in sparse_feature_types.items()
+            },
+            "edge_feature_types": edge_feature_types,
+            "has_weights": edges.weights is not None,
+            "edge_weight_label": self._edge_weight_label,
+            "node_type_name": self._node_type_attr,
+            "edge_type_name": self._edge_type_attr,
+            "node_type_default": self._node_type_default,
+            "edge_type_default": self._edge_type_default,
+            "feature_name": self._feature_attr,
+        }
+        with open(os.path.join(path, _METADATA_FILE), "w") as f:
+            json.dump(metadata, f)
+
+    def to_networkx(self):
+        if self.is_directed():
+            graph = nx.MultiDiGraph()
+        else:
+            graph = nx.MultiGraph()
+
+        for ty in self._nodes.types:
+            node_ids = self.nodes_of_type(ty)
+            ty_dict = {self._node_type_attr: ty}
+
+            if ty in self._nodes.features:
+                features = self.node_features(node_ids, node_type=ty)
+                if sps.issparse(features):
+                    features = features.toarray()
+
+                for node_id, node_features in zip(node_ids, features):
+                    graph.add_node(
+                        node_id, **ty_dict, **{self._feature_attr: node_features},
+                    )
+            else:
+                graph.add_nodes_from(node_ids, **ty_dict)
+
+        edges = self._edges
+        ids = self._nodes.ids
+        sources = ids.from_iloc(edges.sources).tolist()
+        targets = ids.from_iloc(edges.targets).tolist()
+        types = np.asarray(edges.types, dtype=object)[edges.type_codes].tolist()
+        if edges.weights is None:
+            graph.add_edges_from(
+                (src, tgt, {self._edge_type_attr: ty})
+                for src, tgt, ty in zip(sources, targets, types)
+            )
+        else:
+            graph.add_edges_from(
+                (src, tgt, {self._edge_type_attr: ty, self._edge_weight_label: w})
+                for src, tgt, ty, w in zip(
+                    sources, targets, types, edges.weights.tolist()
+                )
+            )
+
+        return graph
+
+    # XXX This has not yet been standardised in the interface.
+    def neighbour_arrays(self, include_edge_weight=False):
+        """
+        The neighbours of every node, as the offsets and neighbour indices of a CSR index (see
+        :func:`neighbour_index`), built on first use, along with the weight of the edge to each
+        neighbour if ``include_edge_weight``.
+        """
+        if self._neighbour_index is None:
+            edges = self._edges
+            self._neighbour_index = neighbour_index(
+                edges.sources, edges.targets, len(self._nodes), self.is_directed()
+            )
+
+        offsets, neighbours, edge_ilocs = self._neighbour_index
+        if include_edge_weight:
+            weights = self._edges.weights_or_ones(dtype=np.float64)[edge_ilocs]
+            return offsets, neighbours, weights
+        return offsets, neighbours
+
+    def adjacency_types(self, graph_schema: GraphSchema):
+        """
+        Obtains the edges in the form of the typed mapping:
+
+            {edge_type_triple: EdgeTypeAdjacency}
+
+        where ``adj[edge_type_triple][source_node]`` is the list of target nodes. These are
+        built once and shared between all callers.
+
+        Args:
+            graph_schema: The graph schema.
+        Returns:
+             The edge types mapping.
+        """
+        missing = [
+            et for et in graph_schema.edge_types if et not in self._adjacency_cache
+        ]
+        if missing:
+            self._adjacency_cache.update(
+                typed_adjacency(
+                    self._nodes.ids,
+                    self._nodes.type_codes,
+                    self._nodes.types,
+                    self._edges,
+                    self.is_directed(),
+                    missing,
+                )
+            )
+
+        return {et: self._adjacency_cache[et] for et in graph_schema.edge_types}
+
+    # XXX This has not yet been standardised in the interface.
+    def edge_weights(self, source_node: Any, target_node: Any) -> List[Any]:
+        """
+        Obtains the weights of edges between the given pair of nodes.
+
+        Args:
+            source_node (any): The source node.
+            target_node (any): The target node.
+
+        Returns:
+            list: The edge weights.
+        """
+        source, target = self._node_ilocs([source_node, target_node])
+        edge_ilocs, others = self._out_edges(source)
+        edge_ilocs = edge_ilocs[others == target]
+
+        if not self.is_directed():
+            in_ilocs, in_others = self._in_edges(source)
+            in_ilocs = in_ilocs[(in_others == target) & (in_others != source)]
+            edge_ilocs = np.concatenate([edge_ilocs, in_ilocs])
+
+        return self._weights_or_none(edge_ilocs)
+
+    def _weights_or_none(self, edge_ilocs):
+        """
+        The weights of some edges as a list, with None for edges without a weight (which are
+        stored as NaN), like the NetworkX backend.
+        """
+        if self._edges.weights is None:
+            return [None] * len(edge_ilocs)
+        weights = self._edges.weights[edge_ilocs]
+        return [
+            None if isinstance(w, float) and np.isnan(w) else w
+            for w in weights.tolist()
+        ]
+
+
+def _features_from_index_maps(ids, index_maps, arrays):
+    """
+    Convert the ``{node_type: {node_id: row}}`` maps produced by the feature conversion functions
+    into a single array of feature rows aligned with ``ids``.
+    """
+    feature_rows = np.full(len(ids), -1, dtype=np.int64)
+    for node_type, index_map in index_maps.items():
+        if node_type not in arrays:
+            continue
+        node_ids = [n for n in index_map.keys() if n is not None]
+        ilocs = ids.to_iloc(node_ids)
+        rows = np.fromiter((index_map[n] for n in node_ids), dtype=np.int64)
+        known = ilocs >= 0
+        feature_rows[ilocs[known]] = rows[known]
+    return feature_rows
+
+
+def _sample_per_group(groups, size, random_state):
+    """
+    Choose a random subset of at most ``size`` elements from each group, where ``groups`` is the
+    group of each element, and return the positions of the chosen elements in order.
+    """
+    order = np.lexsort((random_state.random_sample(len(groups)), groups))
+    sorted_groups = groups[order]
+    rank = np.arange(len(groups)) - np.searchsorted(sorted_groups, sorted_groups)
+    return np.sort(order[rank < size])
+
+
+def _adjacency_matrix(edges, weights, node_ilocs, type_codes, directed, format):
+    """
+    Build a SciPy sparse adjacency matrix from the edge arrays.
+
+    Args:
+        edges (EdgeData): the edges of the graph
+        weights (array of float, optional): the weight of each edge, or None to use 1
+        node_ilocs (array of int, optional): the nodes to include, which become the rows and
+            columns of the matrix in this order; if None, every node is included in iloc order.
+        type_codes (list of int, optional): only include edges with one of these types
+        directed (bool): if False, every edge also contributes an entry from target to source
+        format (str): the SciPy sparse format of the result, such as ``"csr"`` or ``"coo"``
+    """
+    if node_ilocs is None:
+        size = edges.number_of_nodes
+        edge_ilocs = np.arange(len(edges))
+        sources = edges.sources
+        targets = edges.targets
+    else:
+        size = len(node_ilocs)
+        edge_ilocs, sources, targets = edges.induced_edges(node_ilocs)
+
+    if type_codes is not None:
+        keep = np.isin(edges.type_codes[edge_ilocs], type_codes)
+        edge_ilocs = edge_ilocs[keep]
+        sources = sources[keep]
+        targets = targets[keep]
+
+    if weights is None:
+        weights = np.ones(len(edge_ilocs), dtype=np.float32)
+    else:
+        weights = weights[edge_ilocs]
+
+    if not directed:
+        # an undirected edge appears in both directions, except for self loops which only appear
+        # once on the diagonal
+        not_loop = sources != targets
+        sources, targets = (
+            np.concatenate([sources, targets[not_loop]]),
+            np.concatenate([targets, sources[not_loop]]),
+        )
+        weights = np.concatenate([weights, weights[not_loop]])
+
+    adj = sps.coo_matrix((weights, (sources, targets)), shape=(size, size))
+    # sum any multi-edges into a single entry, like networkx
+    adj.sum_duplicates()
+    return adj.asformat(format)
+
+
+def _from_networkx(
+    graph,
+    is_directed,
+    edge_weight_label,
+    node_type_name,
+    edge_type_name,
+    node_type_default,
+    edge_type_default,
+    feature_name,
+    target_name,
+    node_features,
+    dtype,
+    group_by_type=True,
+):
+    """
+    Convert a NetworkX graph into a :class:`CSRStellarGraph`, iterating over its nodes and edges
+    once, without copying it into another NetworkX graph.
+
+    The arguments are the same as :class:`StellarGraph`, along with ``group_by_type``: if False,
+    the nodes keep the NetworkX order, rather than being grouped by type.
+    """
+    if graph is None:
+        graph = nx.MultiDiGraph() if is_directed else nx.MultiGraph()
+
+    node_ids = []
+    node_type_values = []
+    for n, ndata in graph.nodes(data=True):
+        node_ids.append(n)
+        node_type_values.append(ndata.get(node_type_name))
+
+    node_type_codes, node_types = _type_codes(node_type_values, node_type_default)
+
+    # store the nodes grouped by type (see NodeData), keeping the NetworkX order within each type
+    if group_by_type and (node_type_codes[1:] < node_type_codes[:-1]).any():
+        by_type = np.argsort(node_type_codes, kind="stable")
+        node_type_codes = node_type_codes[by_type]
+        node_ids = [node_ids[i] for i in by_type]
+
+    ids = ExternalIdIndex(node_ids)
+
+    sources = []
+    targets = []
+    edge_type_values = []
+    weights = []
+    for src, tgt, edata in graph.edges(data=True):
+        sources.append(src)
+        targets.append(tgt)
+        edge_type_values.append(edata.get(edge_type_name))
+        weights.append(edata.get(edge_weight_label))
+
+    edge_type_codes, edge_types = _type_codes(edge_type_values, edge_type_default)
+    if all(w is None for w in weights):
+        weights = None
+    else:
+        # edges without a weight get NaN, so that they can still be detected as missing
+        weights = np.array([np.nan if w is None else w for w in weights])
+
+    if isinstance(node_features, str):
+        index_maps, feature_arrays = _convert_from_node_attribute(
+            graph, node_features, node_types, node_type_name, node_type_default, dtype
+        )
+    elif node_features is not None:
+        type_for_node = dict(
+            zip(node_ids, np.asarray(node_types, dtype=object)[node_type_codes])
+        )
+        index_maps, feature_arrays = _convert_from_node_data(
+            node_features, type_for_node, node_types, dtype
+        )
+    else:
+        index_maps, feature_arrays = {}, {}
+
+    nodes = NodeData(
+        ids,
+        node_type_codes,
+        node_types,
+        feature_arrays,
+        _features_from_index_maps(ids, index_maps, feature_arrays),
+    )
+    edges = EdgeData(
+        ids.to_iloc(sources, strict=True),
+        ids.to_iloc(targets, strict=True),
+        edge_type_codes,
+        edge_types,
+        weights,
+        len(ids),
+    )
+
+    return CSRStellarGraph(
+        is_directed,
+        nodes,
+        edges,
+        edge_weight_label=edge_weight_label,
+        node_type_name=node_type_name,
+        edge_type_name=edge_type_name,
+        node_type_default=node_type_default,
+        edge_type_default=edge_type_default,
+        feature_name=feature_name,
+    )
+
+
+def _as_typed_frames(data, default_type, name, allowed=(pd.DataFrame,)):
+    """
+    Normalise the ``nodes`` or ``edges`` argument into a dictionary of type -> DataFrame (or
+    other ``allowed`` type), with the types sorted for determinism.
+    """
+    allowed_names = " or ".join(cls.__name__ for cls in allowed)
+    if data is None:
+        return {}
+    if isinstance(data, allowed):
+        return {default_type: data}
+    if isinstance(data, dict):
+        for ty, df in data.items():
+            if not isinstance(df, allowed):
+                raise TypeError(
+                    f"{name}[{ty!r}]: expected {allowed_names}, found {type(df).__name__}"
+                )
+        return {ty: data[ty] for ty in sorted(data.keys(), key=str)}
+
+    raise TypeError(
+        f"{name}: expected {allowed_names}, or a dict of type -> {allowed_names}, found {type(data).__name__}"
+    )
+
+
+def _append_indexes(indexes):
+    if not indexes:
+        return pd.Index([])
+    first, *rest = indexes
+    return first.append(rest)
+
+
+def _concat_or_empty(arrays, dtype=None):
+    if not arrays:
+        return np.empty(0, dtype=dtype)
+    return np.concatenate(arrays)
+
+
+def _append_nodes(nodes, chunks, node_type_default):
+    """
+    Create a new NodeData with some nodes added after the existing ones, which keep their ilocs.
+
+    Args:
+        nodes (NodeData): the existing nodes
+        chunks (list): the new nodes, as ``(node type, pandas.Index of IDs, feature array or
+            None)`` tuples
+        node_type_default (hashable): the type of nodes without one
+    """
+    new_ids = _append_indexes([ids for _, ids, _ in chunks])
+    ids = ExternalIdIndex(nodes.ids.pandas_index.append(new_ids))
+
+    type_values = _concat_or_empty(
+        [np.full(len(ids), ty, dtype=object) for ty, ids, _ in chunks], dtype=object
+    )
+    new_codes, types, remap = _extend_type_codes(
+        nodes.types, type_values, node_type_default
+    )
+
+    # gather the new features of each type, so that each array is only extended once
+    new_features = defaultdict(list)
+    feature_rows = [nodes.feature_rows]
+    for node_type, chunk_ids, values in chunks:
+        if values is None:
+            feature_rows.append(np.full(len(chunk_ids), -1, dtype=np.int64))
+            continue
+
+        existing = nodes.features.get(node_type)
+        start = 0 if existing is None else existing.shape[0]
+        start += sum(v.shape[0] for v in new_features[node_type])
+        feature_rows.append(np.arange(start, start + values.shape[0]))
+        new_features[node_type].append(values)
+
+    features = dict(nodes.features)
+    for node_type, arrays in new_features.items():
+        existing = features.get(node_type)
+        if existing is not None:
+            arrays = [existing] + arrays
+        features[node_type] = _concat_features(arrays)
+
+    return NodeData(
+        ids,
+        np.concatenate([remap[nodes.type_codes], new_codes]),
+        types,
+        features,
+        np.concatenate(feature_rows),
+    )
+
+
+def _node_feature_values(df, dtype):
+    """
+    The feature array of a DataFrame or IndexedArray of nodes of a single type, or None if the
+    nodes have no features.
+    """
+    if isinstance(df, IndexedArray):
+        # use the array as is, so that it can be memory-mapped
+        values = df.values
+    elif len(df.columns) > 0:
+        values = _sparse_frame_values(df, dtype)
+        if values is None:
+            try:
+                values = df.to_numpy(dtype=dtype)
+            except ValueError:
+                raise ValueError(
+                    "Node data passed as Pandas arrays should contain only numeric values"
+                )
+    else:
+        return None
+
+    return values if values.shape[1] > 0 else None
+
+
+def _node_data_from_frames(node_frames, dtype):
+    """
+    Create a NodeData from a dictionary of node type -> DataFrame or IndexedArray, with the nodes
+    in the order of the dictionary.
+    """
+    node_types = list(node_frames.keys())
+    sizes = [len(df) for df in node_frames.values()]
+    ids = ExternalIdIndex(
+        _append_indexes([pd.Index(df.index) for df in node_frames.values()])
+    )
+
+    node_type_codes = np.repeat(np.arange(len(node_types), dtype=np.int32), sizes)
+
+    feature_arrays = {}
+    feature_rows = np.full(len(ids), -1, dtype=np.int64)
+    start = 0
+    for node_type, df, size in zip(node_types, node_frames.values(), sizes):
+        values = _node_feature_values(df, dtype)
+        if values is not None:
+            feature_arrays[node_type] = values
+            feature_rows[start : start + size] = np.arange(size)
+        start += size
+
+    return NodeData(ids, node_type_codes, node_types, feature_arrays, feature_rows)
+
+
+def _edge_columns(
+    edge_frames,
+    source_column,
+    target_column,
+    edge_weight_label,
+    edge_type_name,
+    dtype="float32",
+):
+    """
+    Concatenate the edges in a dictionary of type -> DataFrame.
+
+    Any other columns are edge features.
+
+    Returns:
+        A tuple of arrays of the source IDs, target IDs, types and weights (or None, if no
+        DataFrame has a weight column) of the edges, and the feature chunks of the edges, for
+        :func:`_group_features`.
+    """
+    for ty, df in edge_frames.items():
+        missing = [c for c in [source_column, target_column] if c not in df.columns]
+        if missing:
+            raise ValueError(
+                f"edges[{ty!r}]: expected {source_column!r} and {target_column!r} columns, found: {list(df.columns)}"
+            )
+
+    concat = _concat_or_empty
+
+    sources = concat([df[source_column].to_numpy() for df in edge_frames.values()])
+    targets = concat([df[target_column].to_numpy() for df in edge_frames.values()])
+
+    # an explicit type column takes precedence over the dictionary key
+    type_values = concat(
+        [
+            df[edge_type_name].to_numpy(dtype=object)
+            if edge_type_name in df.columns
+            else np.full(len(df), ty, dtype=object)
+            for ty, df in edge_frames.items()
+        ],
+        dtype=object,
+    )
+
+    if any(edge_weight_label in df.columns for df in edge_frames.values()):
+        # edges without a weight get NaN, so that they can still be detected as missing
+        weights = concat(
+            [
+                df[edge_weight_label].to_numpy(dtype=np.float64)
+                if edge_weight_label in df.columns
+                else np.full(len(df), np.nan)
+                for df in edge_frames.values()
+            ]
+        )
+    else:
+        weights = None
+
+    special = {source_column, target_column, edge_weight_label, edge_type_name}
+    feature_chunks = [
+        (len(df), _edge_feature_values(df, special, dtype))
+        for df in edge_frames.values()
+    ]
+
+    return sources, targets, type_values, weights, feature_chunks
+
+
+def _edge_feature_values(df, special_columns, dtype):
+    """
+    The feature array of a DataFrame of edges, from the columns that aren't ``special_columns``
+    (the source, target, weight and type), or None if there are no such columns.
+    """
+    columns = [c for c in df.columns if c not in special_columns]
+    if not columns:
+        return None
+
+    try:
+        return df[columns].to_numpy(dtype=dtype)
+    except ValueError:
+        raise ValueError(
+            f"Edge data passed as Pandas arrays should contain only numeric values in the feature columns, found columns: {columns}"
+        )
+
+
+def _from_pandas(
+    nodes,
+    edges,
+    is_directed,
+    source_column,
+    target_column,
+    edge_weight_label,
+    node_type_name,
+    edge_type_name,
+    node_type_default,
+    edge_type_default,
+    feature_name,
+    dtype,
+):
+    """
+    Build a :class:`CSRStellarGraph` directly from pandas DataFrames, with bulk NumPy operations
+    rather than per-node or per-edge Python code.
+
+    The arguments are the same as :class:`StellarGraph`.
+    """
+    edge_frames = _as_typed_frames(edges, edge_type_default, "edges")
+    sources, targets, edge_type_values, weights, edge_feature_chunks = _edge_columns(
+        edge_frames,
+        source_column,
+        target_column,
+        edge_weight_label,
+        edge_type_name,
+        dtype,
+    )
+
+    # nodes
+    if nodes is None:
+        # without explicit nodes, every node mentioned by an edge has the default type
+        node_frames = {
+            node_type_default: pd.DataFrame(
+                index=pd.unique(np.concatenate([sources, targets]))
+                if len(sources) > 0
+                else []
+            )
+        }
+    else:
+        node_frames = _as_typed_frames(
+            nodes, node_type_default, "nodes", allowed=(pd.DataFrame, IndexedArray)
+        )
+
+    node_data = _node_data_from_frames(node_frames, dtype)
+    ids = node_data.ids
+
+    # edges
+    source_ilocs = ids.to_iloc(sources)
+    target_ilocs = ids.to_iloc(targets)
+
+    unknown = np.concatenate([sources[source_ilocs < 0], targets[target_ilocs < 0]])
+    if len(unknown) > 0:
+        raise ValueError(
+            f"edges: expected all source and target node IDs to be contained in `nodes`, found some missing: {list(pd.unique(unknown))}"
+        )
+
+    edge_type_codes, edge_types = _type_codes(edge_type_values, edge_type_default)
+    edge_features, edge_feature_rows = _group_features(
+        edge_feature_chunks, edge_type_codes, edge_types, "edges"
+    )
+
+    return CSRStellarGraph(
+        is_directed,
+        node_data,
+        EdgeData(
+            source_ilocs,
+            target_ilocs,
+            edge_type_codes,
+            edge_types,
+            weights,
+            len(ids),
+            features=edge_features,
+            feature_rows=edge_feature_rows,
+        ),
+        edge_weight_label=edge_weight_label,
+        node_type_name=node_type_name,
+        edge_type_name=edge_type_name,
+        node_type_default=node_type_default,
+        edge_type_default=edge_type_default,
+        feature_name=feature_name,
+    )
+
+
+def _edge_chunk_block(
+    df, source_column, target_column, edge_weight_label, edge_type_name, dtype
+):
+    """
+    Process one chunk of edges for :func:`_from_edge_chunks`, in a worker process: the node IDs
+    and edge types are factorized within the chunk, and the edges are ranked within the CSR
+    groups of their source and target nodes, so that merging the chunks is just relabelling.
+
+    Returns:
+        A dictionary of the unique node IDs of the chunk; the source and target of each edge as
+        an index into those; their group ranks; the unique edge types (with missing types as
+        None) and the code of each edge; and the weights and feature chunks of
+        :func:`_edge_columns`.
+    """
+    if not isinstance(df, pd.DataFrame):
+        raise TypeError(
+            f"edges: expected an iterable of DataFrames, found an element of type {type(df).__name__}"
+        )
+
+    sources, targets, type_values, weights, feature_chunks = _edge_columns(
+        {None: df},
+        source_column,
+        target_column,
+        edge_weight_label,
+        edge_type_name,
+        dtype,
+    )
+
+    endpoint_codes, ids = pd.factorize(np.concatenate([sources, targets]))
+    source_codes = endpoint_codes[: len(sources)]
+    target_codes = endpoint_codes[len(sources) :]
+
+    type_codes, types = pd.factorize(pd.Series(type_values, dtype=object))
+    if (type_codes < 0).any():
+        # factorize gives missing values the code -1, so they get an explicit type of their own
+        types = list(types) + [None]
+        type_codes[type_codes < 0] = len(types) - 1
+
+    return {
+        "ids": np.asarray(ids),
+        "sources": source_codes,
+        "targets": target_codes,
+        "source_ranks": _group_ranks(source_codes),
+        "target_ranks": _group_ranks(target_codes),
+        "types": list(types),
+        "type_codes": type_codes,
+        "weights": weights,
+        "feature_chunks": feature_chunks,
+    }
+
+
+def _map_chunks(function, chunks, workers):
+    """
+    Apply ``function`` to each of ``chunks`` in a pool of ``workers`` processes, yielding the
+    results in order. Only a few chunks are in flight at once, so ``chunks`` can be a lazy
+    iterator (like ``pandas.read_csv(..., chunksize=...)``) over more data than fits in memory.
+    """
+    if workers == 1:
+        yield from map(function, chunks)
+        return
+
+    with multiprocessing.Pool(workers) as pool:
+        pending = deque()
+        for chunk in chunks:
+            pending.append(pool.apply_async(function, (chunk,)))
+            if len(pending) >= 2 * workers:
+                yield pending.popleft().get()
+
+        while pending:
+            yield pending.popleft().get()
+
+
+def _from_edge_chunks(
+    chunks,
+    nodes,
+    is_directed,
+    workers,
+    source_column,
+    target_column,
+    edge_weight_label,
+    node_type_name,
+    edge_type_name,
+    node_type_default,
+    edge_type_default,
+    feature_name,
+    dtype,
+):
+    """
+    Build a :class:`CSRStellarGraph` from an iterable of edge DataFrames, processing the chunks in
+    parallel with :func:`_edge_chunk_block` and then merging them.
+
+    The arguments are the same as :meth:`StellarGraph.from_edge_chunks`.
+    """
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if not isinstance(workers, int) or workers < 1:
+        raise ValueError(f"workers: expected a positive integer, found {workers!r}")
+
+    process = partial(
+        _edge_chunk_block,
+        source_column=source_column,
+        target_column=target_column,
+        edge_weight_label=edge_weight_label,
+        edge_type_name=edge_type_name,
+        dtype=dtype,
+    )
+
+    if isinstance(chunks, pd.DataFrame):
+        chunks = [chunks]
+
+    blocks = list(_map_chunks(process, chunks, workers))
+
+    # nodes
+    if nodes is None:
+        # nodes are the IDs used in the chunks, in order of appearance in every source and
+        # then every target, like the constructor
+        endpoint_ids = [
+            block["ids"][pd.unique(block[column])]
+            for column in ["sources", "targets"]
+            for block in blocks
+        ]
+        node_frames = {
+            node_type_default: pd.DataFrame(
+                index=pd.unique(_concat_or_empty(endpoint_ids, dtype=object))
+            )
+        }
+    else:
+        node_frames = _as_typed_frames(
+            nodes, node_type_default, "nodes", allowed=(pd.DataFrame, IndexedArray)
+        )
+
+    node_data = _node_data_from_frames(node_frames, dtype)
+    ids = node_data.ids
+
+    # edges: relabel the node IDs and types of each chunk to the merged ones
+    edge_types = sorted(
+        {
+            edge_type_default if ty is None else ty
+            for block in blocks
+            for ty in block["types"]
+        },
+        key=str,
+    )
+    edge_type_index = pd.Index(edge_types)
+
+    unknown = []
+    source_blocks = []
+    target_blocks = []
+    type_codes = []
+    for block in blocks:
+        block_ilocs = ids.to_iloc(block["ids"])
+        unknown.extend(block["ids"][block_ilocs < 0])
+
+        source_blocks.append((block_ilocs[block["sources"]], block["source_ranks"]))
+        target_blocks.append((block_ilocs[block["targets"]], block["target_ranks"]))
+
+        block_types = [edge_type_default if ty is None else ty for ty in block["types"]]
+        type_codes.append(
+            edge_type_index.get_indexer(block_types).astype(np.int32)[
+                block["type_codes"]
+            ]
+        )
+
+    if unknown:
+        raise ValueError(
+            f"edges: expected all source and target node IDs to be contained in `nodes`, found some missing: {list(pd.unique(np.array(unknown, dtype=object)))}"
+        )
+
+    source_ilocs = _concat_or_empty([keys for keys, _ in source_blocks], ids.dtype)
+    target_ilocs = _concat_or_empty([keys for keys, _ in target_blocks], ids.dtype)
+    edge_type_codes = _concat_or_empty(type_codes, np.int32)
+
+    if any(block["weights"] is not None for block in blocks):
+        weights = np.concatenate(
+            [
+                np.full(len(block["sources"]), np.nan)
+                if block["weights"] is None
+                else block["weights"]
+                for block in blocks
+            ]
+        )
+    else:
+        weights = None
+
+    edge_features, edge_feature_rows = _group_features(
+        [chunk for block in blocks for chunk in block["feature_chunks"]],
+        edge_type_codes,
+        edge_types,
+        "edges",
+    )
+
+    out_offsets, out_edges = _csr_merge(source_blocks, len(ids))
+    in_offsets, in_edges = _csr_merge(target_blocks, len(ids))
+
+    return CSRStellarGraph(
+        is_directed,
+        node_data,
+        EdgeData(
+            source_ilocs,
+            target_ilocs,
+            edge_type_codes,
+            edge_types,
+            weights,
+            len(ids),
+            csr_indices=(out_offsets, out_edges, in_offsets, in_edges),
+            features=edge_features,
+            feature_rows=edge_feature_rows,
+        ),
+        edge_weight_label=edge_weight_label,
+        node_type_name=node_type_name,
+        edge_type_name=edge_type_name,
+        node_type_default=node_type_default,
+        edge_type_default=edge_type_default,
+        feature_name=feature_name,
+    )
+
+
+def _load(path, mmap=True):
+    """
+    Load a :class:`CSRStellarGraph` saved by :meth:`CSRStellarGraph.save`.
+
+    Args:
+        path (str): the directory containing the saved graph
+        mmap (bool): if True, the arrays are memory-mapped rather than read into memory, so
+            loading is almost instant and processes loading the same graph share its memory.
+    """
+    with open(os.path.join(path, _METADATA_FILE)) as f:
+        metadata = json.load(f)
+
+    version = metadata.get("format_version")
+    if version != _FORMAT_VERSION:
+        raise ValueError(
+            f"path: expected a saved graph with format version {_FORMAT_VERSION}, found {version!r}"
+        )
+
+    mmap_mode = "r" if mmap else None
+
+    def load(name):
+        return np.load(os.path.join(path, f"{name}.npy"), mmap_mode=mmap_mode)
+
+    # IDs that aren't numbers or strings are pickled, and so can't be memory-mapped
+    ids = ExternalIdIndex(
+        np.load(os.path.join(path, "node_ids.npy"), allow_pickle=True)
+    )
+    node_types = metadata["node_types"]
+    quantised_feature_types = metadata.get("quantised_feature_types", {})
+
+    sparse_feature_types = metadata.get("sparse_feature_types", {})
+
+    def load_features(code):
+        values = load(f"node_features_{code}")
+        size = sparse_feature_types.get(str(code))
+        if size is not None:
+            indptr = load(f"node_features_{code}_indptr")
+            return sps.csr_matrix(
+                (values, load(f"node_features_{code}_indices"), indptr),
+                shape=(len(indptr) - 1, size),
+            )
+
+        dtype = quantised_feature_types.get(str(code))
+        if dtype is None:
+            return values
+        if values.dtype != np.int8:
+            return QuantisedArray(values, dtype=dtype)
+        return QuantisedArray(
+            values,
+            load(f"node_features_{code}_scale"),
+            load(f"node_features_{code}_zero_point"),
+            dtype,
+        )
+
+    features = {
+        node_types[code]: load_features(code) for code in metadata["feature_types"]
+    }
+    nodes = NodeData(
+        ids, load("node_type_codes"), node_types, features, load("node_feature_rows"),
+    )
+    edge_types = metadata["edge_types"]
+    # graphs saved before edge features were supported don't have any
+    edge_feature_types = metadata.get("edge_feature_types", [])
+    edges = EdgeData(
+        load("edge_sources"),
+        load("edge_targets"),
+        load("edge_type_codes"),
+        edge_types,
+        load("edge_weights") if metadata["has_weights"] else None,
+        len(ids),
+        csr_indices=(
+            load("edge_out_offsets"),
+            load("edge_out_edges"),
+            load("edge_in_offsets"),
+            load("edge_in_edges"),
+        ),
+        features={
+            edge_types[code]: load(f"edge_features_{code}")
+            for code in edge_feature_types
+        },
+        feature_rows=load("edge_feature_rows") if edge_feature_types else None,
+    )
+
+    graph = CSRStellarGraph(
+        metadata["is_directed"],
+        nodes,
+        edges,
+        edge_weight_label=metadata["edge_weight_label"],
+        node_type_name=metadata["node_type_name"],
+        edge_type_name=metadata["edge_type_name"],
+        node_type_default=metadata.get(
+            "node_type_default", globalvar.NODE_TYPE_DEFAULT
+        ),
+        edge_type_default=metadata.get(
+            "edge_type_default", globalvar.EDGE_TYPE_DEFAULT
+        ),
+        feature_name=metadata["feature_name"],
+    )
+    if mmap:
+        graph._shared_path = os.path.abspath(path)
+    return graph
+
+
+def _share(graph, path=None):
+    """
+    Save ``graph`` (either backend) and load it back memory-mapped, so that it pickles as a
+    handle to the files.
+
+    Args:
+        graph: the graph to share
+        path (str, optional): the directory to save into; if not specified, a temporary
+            directory is used, which is deleted when the returned graph is garbage collected.
+    """
+    temporary = path is None
+    if temporary:
+        path = tempfile.mkdtemp(prefix="stellargraph-")
+
+    graph.save(path)
+    shared = _load(path, mmap=True)
+    if temporary:
+        weakref.finalize(shared, shutil.rmtree, path, True)
+    return shared
+
+
+def _from_networkx_backend(graph):
+    """
+    Convert a :class:`NetworkXStellarGraph` to a :class:`CSRStellarGraph`, sharing its feature
+    arrays.
+    """
+    node_features = {
+        node_type: IndexedArray(
+            graph._node_attribute_arrays[node_type], index=index.pandas_index
+        )
+        for node_type, index in graph._node_index_maps.items()
+        if node_type in graph._node_attribute_arrays
+    }
+    return _from_networkx(
+        graph._graph,
+        graph.is_directed(),
+        graph._edge_weight_label,
+        graph._node_type_attr,
+        graph._edge_type_attr,
+        graph._node_type_default,
+        graph._edge_type_default,
+        graph._feature_attr,
+        graph._target_attr,
+        node_features or None,
+        None,
+        # the node indices of the copy need to match those of the NetworkX backend
+        group_by_type=False,
+    )
@@ -31,9 +31,23 @@ import warnings
 import pandas as pd
 import numpy as np
 import networkx as nx
+import scipy.sparse as sps
 
 from typing import Iterable, Iterator, Any, Mapping, List, Set, Optional
 
+from .element_data import (
+    ExternalIdIndex,
+    EdgeData,
+    gather_rows,
+    typed_adjacency,
+    _compress_features,
+    _concat_features,
+    _edge_type_triples,
+    _graph_schema,
+    _type_codes,
+    _type_groups,
+)
+from .indexed_array import IndexedArray
 from .schema import GraphSchema
 from .utils import is_real_iterable
 
@@ -122,21 +136,32 @@ def _convert_from_node_attribute(
         # Create zero attribute array
         data_size = data_sizes.pop()
 
-        # Dummy feature/target value for invalid nodes,
-        # this will be inserted into the array in two cases:
-        # 1. node ID of None (representing sampling for a missing neighbour)
-        # 2. node with no attribute
+        # Dummy feature/target value for nodes with no attribute (a node ID of None, representing
+        # sampling for a missing neighbour, isn't stored, but gets zeros when the rows are
+        # gathered).
         # TODO: Make these two cases more explicit, allow custom values.
         default_value = np.zeros(data_size)
 
-        # Convert to numpy array
+        # Convert to numpy array, without the None node at the end
         attribute_arrays[nt] = np.asarray(
-            [x if x is not None else default_value for x in attr_data]
+            [x if x is not None else default_value for x in attr_data[:-1]]
         )
 
     return node_index_map, attribute_arrays
 
 
+def _sparse_frame_values(df, dtype):
+    """
+    The values of a DataFrame whose columns are all sparse, as a SciPy CSR matrix, or None if it
+    has any dense columns (or none at all).
+    """
+    if len(df.columns) == 0 or not all(
+        isinstance(col_dtype, pd.SparseDtype) for col_dtype in df.dtypes
+    ):
+        return None
+    return df.sparse.to_coo().tocsr().astype(dtype)
+
+
 def _convert_from_node_data(data, node_type_map, node_types, dtype="f"):
     """
     Store the node data as feature vectors, for use with machine learning models.
@@ -144,12 +169,14 @@ def _convert_from_node_data(data, node_type_map, node_types, dtype="f"):
     For a single node type, the data can be either:
      * a Pandas DataFrame with the index being node IDs and the columns the numeric
         feature values. Note that the features must be numeric.
+     * an IndexedArray, with the index being node IDs, holding a (possibly
+        memory-mapped) array that is used without copying it, or a SciPy sparse matrix.
      * a list or iterable of `(node_id, node_feature)` pairs where node_feature is
         a value, a list of values, or a numpy array representing the numeric feature
         values.
 
     For multiple node types, the data can be either:
-     * a dictionary of node_type -> DataFrame with the index of each DataFrame
+     * a dictionary of node_type -> DataFrame or IndexedArray with the index of each DataFrame
         being node IDs and the columns the numeric feature values.
         Note that the features must be numeric and can be different sizes for each
         node type.
@@ -185,10 +212,17 @@ def _convert_from_node_data(data, node_type_map, node_types, dtype="f"):
         data_arrays = {}
         data_index = {}
         for nt, arr in data.items():
-            if isinstance(arr, pd.DataFrame):
+            if isinstance(arr, IndexedArray):
+                # use the array as is, so that it can be memory-mapped
                 node_index_map = {nid: nii for nii, nid in enumerate(arr.index)}
+                data_arr = arr.values
+
+            elif isinstance(arr, pd.DataFrame):
+                node_index_map = {nid: nii for nii, nid in enumerate(arr.index)}
+                data_arr = _sparse_frame_values(arr, dtype)
                 try:
-                    data_arr = arr.values.astype(dtype)
+                    if data_arr is None:
+                        data_arr = arr.values.astype(dtype)
                 except ValueError:
                     raise ValueError(
                         "Node data passed as Pandas arrays should contain only numeric values"
@@ -207,15 +241,14 @@ def _convert_from_node_data(data, node_type_map, node_types, dtype="f"):
                     "Node data should be a pandas array, an iterable, a list, or name of a node_attribute"
                 )
 
-            # Add default value to end of feature array
-            default_value = np.zeros(data_arr.shape[1])
-            data_arrays[nt] = np.vstack([data_arr, default_value])
-
+            # The index one past the end is used for None, and gets zeros when the rows are
+            # gathered
+            data_arrays[nt] = data_arr
             node_index_map[None] = data_arr.shape[0]
             data_index[nt] = node_index_map
 
     # If data is a pd.Dataframe, try pulling out the type
-    elif isinstance(data, pd.DataFrame):
+    elif isinstance(data, (pd.DataFrame, IndexedArray)):
         if len(node_types) > 1:
             raise TypeError(
                 "When there is more than one node type, pass node features as a dictionary."
@@ -247,6 +280,35 @@ def _convert_from_node_data(data, node_type_map, node_types, dtype="f"):
     return data_index, data_arrays
 
 
+def _index_map_to_ids(index_map):
+    """
+    Convert a ``{node_id: node_index}`` dictionary, as produced by the feature conversion
+    functions, into an :class:`ExternalIdIndex` of the node IDs in index order, without ``None``.
+    """
+    ids = [None] * index_map[None]
+    for node_id, index in index_map.items():
+        if node_id is not None:
+            ids[index] = node_id
+
+    if len(index_map) - 1 < len(ids):
+        # rows overwritten by a later duplicate ID are unreachable, like in the dictionary, so they
+        # get a unique placeholder
+        ids = [object() if node_id is None else node_id for node_id in ids]
+
+    return ExternalIdIndex(ids)
+
+
+def _degree_summary(degrees):
+    """
+    The line of ``info`` describing the distribution of the node degrees.
+    """
+    if len(degrees) == 0:
+        return ""
+    return " Degrees: min {}, mean {:.2f}, max {}\n".format(
+        degrees.min(), degrees.mean(), degrees.max()
+    )
+
+
 class NetworkXStellarGraph(StellarGraph):
     """
     Implementation based on encapsulating a NetworkX graph.
@@ -326,11 +388,31 @@ class NetworkXStellarGraph(StellarGraph):
         # TODO: What other convenience attributes do we need?
         self._nodes_by_type = None
 
+        # The node index, the edges indexed by node and edge type (for filtering neighbours by
+        # edge type) and their order in NetworkX, the typed adjacency for each edge type triple,
+        # the node degree arrays, the nodes grouped by type and the schema; these are built on
+        # first use and must be reset with `_invalidate_caches` if the graph changes
+        self._node_ids = None
+        self._typed_edges = None
+        self._typed_edge_ranks = None
+        self._adjacency_cache = {}
+        self._degree_cache = {}
+        self._schema = None
+        self._edge_type_triple_counts = None
+        self._csr_copy = None
+        # the types have already been computed above, so the grouping can be seeded with them
+        self._node_types_by_index = self._group_node_types(type_for_node.values())
+
         # This stores the feature vectors per node type as numpy arrays
         self._node_attribute_arrays = data_arrays
 
-        # This stores the map between node ID and index in the attribute arrays
-        self._node_index_maps = data_index_maps
+        # This stores the map between node ID and index in the attribute arrays, as an index of
+        # the IDs in row order (the final row, for None, isn't included), so that a whole batch of
+        # IDs can be resolved at once
+        self._node_index_maps = {
+            nt: _index_map_to_ids(index_map)
+            for nt, index_map in data_index_maps.items()
+        }
 
     def __repr__(self):
         directed_str = "Directed" if self.is_directed() else "Undirected"
@@ -390,28 +472,26 @@ class NetworkXStellarGraph(StellarGraph):
 
         # Get the node type if not specified.
         if node_type is None:
-            node_types = {
-                self._get_node_type(self._graph.nodes[n])
-                for n in nodes
-                if n is not None
-            }
-
-            if len(node_types) > 1:
-                raise ValueError("All nodes must be of the same type.")
-
-            if len(node_types) == 0:
+            known = [n for n in nodes if n is not None]
+            if len(known) == 0:
                 raise ValueError(
                     "At least one node must be given if node_type not specified"
                 )
 
-            node_type = node_types.pop()
+            # look up the types in bulk, from the cached type code of every node
+            type_codes, types, _, _ = self._node_type_data()
+            ilocs = self._node_id_index().to_iloc(known, strict=True)
+            codes = np.unique(type_codes[ilocs])
+            if len(codes) > 1:
+                raise ValueError("All nodes must be of the same type.")
+
+            node_type = types[codes[0]]
 
         # Get index for nodes of this type
-        nt_id_to_index = self._node_index_maps[node_type]
-        node_indices = [nt_id_to_index.get(n) for n in nodes]
-        return node_indices
+        node_indices = self._feature_rows(nodes, node_type)
+        return [None if index < 0 else index for index in node_indices.tolist()]
 
-    def node_features(self, nodes, node_type=None):
+    def node_features(self, nodes, node_type=None, use_index=False):
         """
         Get the numeric feature vectors for the specified node or nodes.
         If the node type is not specified the node types will be found
@@ -421,6 +501,7 @@ class NetworkXStellarGraph(StellarGraph):
         Args:
             n: (list or hashable) Node ID or list of node IDs
             node_type: (hashable) the type of the nodes.
+            use_index (bool): if True, ``nodes`` are node indices rather than node IDs.
 
         Returns:
             Numpy array containing the node features for the requested nodes.
@@ -429,23 +510,25 @@ class NetworkXStellarGraph(StellarGraph):
         if not is_real_iterable(nodes):
             nodes = [nodes]
 
+        if use_index:
+            nodes = self._node_ids_for_index(nodes)
+
         # Get the node type if not specified.
         if node_type is None:
-            node_types = {
-                self._get_node_type(self._graph.nodes[n])
-                for n in nodes
-                if n is not None
-            }
-
-            if len(node_types) > 1:
-                raise ValueError("All nodes must be of the same type.")
-
-            if len(node_types) == 0:
+            known = [n for n in nodes if n is not None]
+            if len(known) == 0:
                 raise ValueError(
                     "At least one node must be given if node_type not specified"
                 )
 
-            node_type = node_types.pop()
+            # look up the types in bulk, from the cached type code of every node
+            type_codes, types, _, _ = self._node_type_data()
+            ilocs = self._node_id_index().to_iloc(known, strict=True)
+            codes = np.unique(type_codes[ilocs])
+            if len(codes) > 1:
+                raise ValueError("All nodes must be of the same type.")
+
+            node_type = types[codes[0]]
 
         # Check node_types
         if (
@@ -460,19 +543,46 @@ class NetworkXStellarGraph(StellarGraph):
             return np.empty((0, feature_size))
 
         # Get index for nodes of this type
-        nt_id_to_index = self._node_index_maps[node_type]
-        node_indices = [nt_id_to_index.get(n) for n in nodes]
+        node_indices = self._feature_rows(nodes, node_type)
 
-        if None in node_indices:
+        if (node_indices < 0).any():
             problem_nodes = [
-                node for node, index in zip(nodes, node_indices) if index is None
+                node for node, index in zip(nodes, node_indices) if index < 0
             ]
             raise ValueError(
                 "Could not find features for nodes with IDs {}.".format(problem_nodes)
             )
 
-        features = self._node_attribute_arrays[node_type][node_indices]
-        return features
+        return gather_rows(self._node_attribute_arrays[node_type], node_indices)
+
+    def node_features_by_index(self, indices, node_type):
+        """
+        Get the numeric feature vectors for nodes specified by their indices in the feature
+        array of ``node_type``, as returned by ``get_index_for_nodes``.
+
+        Args:
+            indices (array of int): the feature indices of the nodes
+            node_type (hashable): the type of the nodes.
+
+        Returns:
+            Numpy array containing the node features for the requested nodes.
+        """
+        try:
+            features = self._node_attribute_arrays[node_type]
+        except KeyError:
+            raise ValueError(f"Features not found for node type '{node_type}'")
+
+        return gather_rows(features, indices)
+
+    def _feature_rows(self, nodes, node_type):
+        """
+        The rows of the feature array for ``node_type`` holding the features of each of
+        ``nodes``, where ``None`` maps to the final row of zeros and unknown nodes to -1.
+        """
+        index = self._node_index_maps[node_type]
+        rows = index.to_iloc(nodes)
+        rows[[n is None for n in nodes]] = len(index)
+        return rows
 
     def node_feature_sizes(self, node_types=None):
         """
@@ -494,6 +604,20 @@ class NetworkXStellarGraph(StellarGraph):
         fsize = {nt: self._node_attribute_arrays[nt].shape[1] for nt in node_types}
         return fsize
 
+    def edge_features(self, edges, edge_type=None):
+        raise ValueError(
+            "Features not found for edges: edge features are only supported by the 'csr' backend"
+        )
+
+    def edge_feature_sizes(self, edge_types=None):
+        return {}
+
+    def compress_node_features(self, storage="float16", node_types=None):
+        self._node_attribute_arrays = _compress_features(
+            self._node_attribute_arrays, storage, node_types
+        )
+        self._invalidate_caches()
+
     def nodes_of_type(self, node_type=None):
         """
         Get the nodes of the graph with the specified node types.
@@ -507,12 +631,34 @@ class NetworkXStellarGraph(StellarGraph):
         # TODO: unit test!
         if node_type is None:
             return list(self)
-        else:
-            return [
-                n
-                for n, ndata in self._graph.nodes(data=True)
-                if self._get_node_type(ndata) == node_type
-            ]
+
+        _, types, offsets, ilocs = self._node_type_data()
+        try:
+            code = types.index(node_type)
+        except ValueError:
+            return []
+
+        return (
+            self._node_id_index()
+            .from_iloc(ilocs[offsets[code] : offsets[code + 1]])
+            .tolist()
+        )
+
+    def _group_node_types(self, node_types):
+        type_codes, types = _type_codes(list(node_types), self._node_type_default)
+        offsets, ilocs = _type_groups(type_codes, len(types))
+        return type_codes, types, offsets, ilocs
+
+    def _node_type_data(self):
+        """
+        The type code of each node (in the order of ``nodes()``), the type names, and the nodes
+        grouped by type (see :func:`_type_groups`).
+        """
+        if self._node_types_by_index is None:
+            self._node_types_by_index = self._group_node_types(
+                self._get_node_type(ndata) for _, ndata in self._graph.nodes(data=True)
+            )
+        return self._node_types_by_index
 
     def node_type(self, node):
         """
@@ -535,13 +681,11 @@ class NetworkXStellarGraph(StellarGraph):
             set of types
         """
         # TODO: unit test!
-        # TODO: create a schmea when we geenrate _node_attribute_arrays and use it?
         if len(self._node_attribute_arrays) > 0:
             return set(self._node_attribute_arrays.keys())
         else:
-            return {
-                self._get_node_type(ndata) for n, ndata in self._graph.nodes(data=True)
-            }
+            _, types, offsets, _ = self._node_type_data()
+            return {ty for ty, count in zip(types, np.diff(offsets)) if count > 0}
 
     def _is_of_edge_type(self, edge, expected_triple):
         source, target, _ = edge
@@ -566,12 +710,15 @@ class NetworkXStellarGraph(StellarGraph):
         Return an information string summarizing information on the current graph.
         This includes node and edge type information and their attributes.
 
-        Note: This requires processing all nodes and edges and could take a long
-        time for a large graph.
+        The counts are computed from the cached node type and edge type triple arrays, so this
+        doesn't need to visit every node and edge.
 
         Args:
-            sample (int): To speed up the graph analysis, use only a random sample of
-                          this many nodes and edges.
+            show_attributes (bool, default True): If True, include the feature sizes of each node
+                type, and the attributes found in the sample (if any)
+            sample (int, optional): summarise the attributes of a random sample of this many
+                nodes, and of the edges incident to them. If not specified, attributes other than
+                the node features aren't shown.
 
         Returns:
             An information string.
@@ -581,56 +728,94 @@ class NetworkXStellarGraph(StellarGraph):
         s += " Nodes: {}, Edges: {}\n".format(
             self.number_of_nodes(), self.number_of_edges()
         )
+        s += _degree_summary(self.degree_array("both", None, False))
 
-        # Sample the nodes for our analysis
-        if sample:
-            all_nodes = list(self._graph.nodes)
-            snodes = random.sample(all_nodes, sample)
-        else:
-            snodes = None
+        gs = self.create_graph_schema()
+        _, types, offsets, _ = self._node_type_data()
+        node_counts = dict(zip(types, np.diff(offsets)))
 
-        gs = self.create_graph_schema(nodes=snodes)
+        if show_attributes and sample:
+            node_attrs, edge_attrs = self._sampled_attributes(sample)
+        else:
+            node_attrs = edge_attrs = {}
 
-        # Go over all node types
         s += "\n Node types:\n"
         for nt in gs.node_types:
-            # Filter nodes by type
-            nt_nodes = [
-                ndata
-                for n, ndata in self._graph.nodes(data=True)
-                if self._get_node_type(ndata) == nt
-            ]
-            s += "  {}: [{}]\n".format(nt, len(nt_nodes))
+            s += "  {}: [{}]\n".format(nt, node_counts.get(nt, 0))
 
-            # Get the attributes for this node type
-            attrs = set(it.chain(*[ndata.keys() for ndata in nt_nodes]))
-            attrs.discard(self._node_type_attr)
-            if show_attributes and len(attrs) > 0:
-                s += "        Attributes: {}\n".format(attrs)
+            if show_attributes and nt in self._node_attribute_arrays:
+                features = self._node_attribute_arrays[nt]
+                s += "        Features: {} vector, length {}\n".format(
+                    features.dtype, features.shape[1]
+                )
+            if node_attrs.get(nt):
+                s += "        Attributes: {}\n".format(node_attrs[nt])
 
             s += "    Edge types: "
             s += ", ".join(["{}-{}->{}".format(*e) for e in gs.schema[nt]]) + "\n"
 
         s += "\n Edge types:\n"
-        for et in gs.edge_types:
-            # Filter edges by type
-            et_edges = [
-                e[3]
-                for e in self._graph.edges(keys=True, data=True)
-                if self._is_of_edge_type(e[:3], et)
-            ]
-            if len(et_edges) > 0:
-                s += "    {et[0]}-{et[1]}->{et[2]}: [{len}]\n".format(
-                    et=et, len=len(et_edges)
+        for et, count in self._edge_triple_counts().items():
+            s += "    {et[0]}-{et[1]}->{et[2]}: [{len}]\n".format(et=et, len=count)
+            if edge_attrs.get(et):
+                s += "        Attributes: {}\n".format(edge_attrs[et])
+
+        return s
+
+    def _sampled_attributes(self, sample):
+        """
+        The attribute names of a random sample of ``sample`` nodes by node type, and of the edges
+        incident to them by edge type triple.
+        """
+        ids = self._node_id_index()
+        chosen = np.random.choice(len(ids), size=min(sample, len(ids)), replace=False)
+        nodes = ids.from_iloc(chosen).tolist()
+
+        node_attrs = defaultdict(set)
+        for node in nodes:
+            ndata = self._graph.nodes[node]
+            node_attrs[self._get_node_type(ndata)].update(ndata.keys())
+
+        edge_attrs = defaultdict(set)
+        for src, tgt, edata in self._graph.edges(nodes, data=True):
+            node_type_1 = self.node_type(src)
+            node_type_2 = self.node_type(tgt)
+            edge_type = self._get_edge_type(edata)
+            edge_attrs[EdgeType(node_type_1, edge_type, node_type_2)].update(
+                edata.keys()
+            )
+            if not self.is_directed():
+                # the edges of the sampled nodes may be visited in either orientation
+                edge_attrs[EdgeType(node_type_2, edge_type, node_type_1)].update(
+                    edata.keys()
                 )
 
-            # Get the attributes for this edge type
-            attrs = set(it.chain(*[edata.keys() for edata in et_edges]))
+        for attrs in node_attrs.values():
+            attrs.discard(self._node_type_attr)
+        for attrs in edge_attrs.values():
             attrs.discard(self._edge_type_attr)
-            if show_attributes and len(attrs) > 0:
-                s += "        Attributes: {}\n".format(attrs)
 
-        return s
+        return node_attrs, edge_attrs
+
+    def _edge_triples(self):
+        """
+        The unique (source node type, edge type, target node type) codes of the edges, along with
+        the number of edges with each.
+        """
+        if self._edge_type_triple_counts is None:
+            type_codes, _, _, _ = self._node_type_data()
+            _, edges, _ = self._typed_edge_data()
+            self._edge_type_triple_counts = _edge_type_triples(type_codes, edges)
+        return self._edge_type_triple_counts
+
+    def _edge_triple_counts(self):
+        triples, counts = self._edge_triples()
+        _, node_types, _, _ = self._node_type_data()
+        _, edges, _ = self._typed_edge_data()
+        return {
+            EdgeType(node_types[n1], edges.types[rel], node_types[n2]): count
+            for (n1, rel, n2), count in zip(triples, counts)
+        }
 
     def create_graph_schema(self, nodes=None):
         """
@@ -651,8 +836,19 @@ class NetworkXStellarGraph(StellarGraph):
             GraphSchema object.
         """
         if nodes is None:
-            nodes = self.nodes()
-            edges = self.edges(triple=True)
+            # the schema of the whole graph is computed once, and shared by every caller
+            if self._schema is None:
+                _, types, offsets, _ = self._node_type_data()
+                _, edges, _ = self._typed_edge_data()
+                triples, _ = self._edge_triples()
+                self._schema = _graph_schema(
+                    self.is_directed(),
+                    types,
+                    np.flatnonzero(np.diff(offsets)),
+                    edges.types,
+                    triples,
+                )
+            return self._schema
         else:
             edges = (
                 (src, dst, self._get_edge_type(data))
@@ -708,7 +904,10 @@ class NetworkXStellarGraph(StellarGraph):
     def number_of_edges(self) -> int:
         return self._graph.number_of_edges()
 
-    def nodes(self) -> Iterable[Any]:
+    def nodes(self, use_index=False) -> Iterable[Any]:
+        if use_index:
+            ids = self._node_id_index()
+            return np.arange(len(ids), dtype=ids.dtype)
         return self._graph.nodes()
 
     def edges(self, triple=False) -> Iterable[Any]:
@@ -725,9 +924,296 @@ class NetworkXStellarGraph(StellarGraph):
     def has_node(self, node: Any) -> bool:
         return self._graph.__contains__(node)
 
-    def _transform_edges(self, edges, get_node, include_edge_weight, edge_types):
-        edge_types_set = set(edge_types) if edge_types is not None else None
+    def _invalidate_caches(self):
+        """
+        Discard the structures derived from the NetworkX graph, which are rebuilt on first use.
+        """
+        self._node_ids = None
+        self._typed_edges = None
+        self._typed_edge_ranks = None
+        self._adjacency_cache = {}
+        self._degree_cache = {}
+        self._schema = None
+        self._edge_type_triple_counts = None
+        self._node_types_by_index = None
+        self._csr_copy = None
+
+    def add_nodes(self, nodes):
+        # avoid a circular import
+        from .graph_csr import _as_typed_frames, _node_feature_values
+
+        frames = _as_typed_frames(
+            nodes,
+            self._node_type_default,
+            "nodes",
+            allowed=(pd.DataFrame, IndexedArray),
+        )
+
+        existing_types = None
+        chunks = []
+        for node_type, df in frames.items():
+            existing = self._node_attribute_arrays.get(node_type)
+            dtype = "float32" if existing is None else existing.dtype
+            values = _node_feature_values(df, dtype)
 
+            found = 0 if values is None else values.shape[1]
+            if existing is not None:
+                expected = existing.shape[1]
+            else:
+                if existing_types is None:
+                    existing_types = {
+                        self._get_node_type(ndata)
+                        for _, ndata in self._graph.nodes(data=True)
+                    }
+                expected = 0 if node_type in existing_types else found
+
+            if found != expected:
+                raise ValueError(
+                    f"nodes[{node_type!r}]: expected {expected} feature columns, matching the existing nodes of this type, found {found}"
+                )
+            chunks.append((node_type, pd.Index(df.index), values))
+
+        all_ids = [n for _, ids, _ in chunks for n in ids]
+        duplicated = pd.Index(all_ids)[
+            pd.Index(all_ids).duplicated()
+            | np.array([n in self._graph for n in all_ids], dtype=bool)
+        ].unique()
+        if len(duplicated) > 0:
+            raise ValueError(
+                f"nodes: expected IDs to appear once, found some that appeared more: {list(duplicated)}"
+            )
+
+        for node_type, ids, values in chunks:
+            self._graph.add_nodes_from(ids, **{self._node_type_attr: node_type})
+            if values is None:
+                continue
+
+            existing = self._node_attribute_arrays.get(node_type)
+            if existing is None:
+                self._node_attribute_arrays[node_type] = values
+                self._node_index_maps[node_type] = ExternalIdIndex(ids)
+            else:
+                self._node_attribute_arrays[node_type] = _concat_features(
+                    [existing, values]
+                )
+                index = self._node_index_maps[node_type]
+                self._node_index_maps[node_type] = ExternalIdIndex(
+                    index.pandas_index.append(ids)
+                )
+
+        self._invalidate_caches()
+
+    def add_edges(self, edges, source_column, target_column):
+        # avoid a circular import
+        from .graph_csr import _as_typed_frames, _edge_columns
+
+        frames = _as_typed_frames(edges, self._edge_type_default, "edges")
+        sources, targets, type_values, weights, feature_chunks = _edge_columns(
+            frames,
+            source_column,
+            target_column,
+            self._edge_weight_label,
+            self._edge_type_attr,
+        )
+        if any(values is not None for _, values in feature_chunks):
+            raise ValueError(
+                "edges: expected only source, target, weight and type columns, because edge features are only supported by the 'csr' backend"
+            )
+
+        unknown = [n for n in it.chain(sources, targets) if n not in self._graph]
+        if unknown:
+            raise ValueError(
+                f"edges: expected all source and target node IDs to be contained in the graph, found some missing: {list(pd.unique(np.array(unknown, dtype=object)))}"
+            )
+
+        type_values = pd.Series(type_values, dtype=object).fillna(
+            self._edge_type_default
+        )
+        for i, (src, tgt, edge_type) in enumerate(zip(sources, targets, type_values)):
+            data = {self._edge_type_attr: edge_type}
+            if weights is not None and not np.isnan(weights[i]):
+                data[self._edge_weight_label] = weights[i]
+            self._graph.add_edge(src, tgt, **data)
+
+        self._invalidate_caches()
+
+    def remove_edges(self, edges):
+        to_remove = []
+        missing = []
+        for edge in edges:
+            if len(edge) not in (2, 3):
+                raise ValueError(
+                    f"edges: expected (source, target) pairs or (source, target, type) triples, found {edge!r}"
+                )
+
+            source, target = edge[0], edge[1]
+            if not self._graph.has_edge(source, target):
+                missing.append(edge)
+                continue
+
+            keys = [
+                key
+                for key, data in self._graph[source][target].items()
+                if len(edge) == 2 or self._get_edge_type(data) == edge[2]
+            ]
+            if not keys:
+                missing.append(edge)
+            to_remove.extend((source, target, key) for key in keys)
+
+        if missing:
+            raise KeyError(f"edges not found: {missing}")
+
+        # an edge may have been matched more than once
+        self._graph.remove_edges_from(set(to_remove))
+        self._invalidate_caches()
+
+    def _node_id_index(self):
+        """
+        The contiguous integer index of each node, in the order of ``nodes()``.
+        """
+        if self._node_ids is None:
+            self._node_ids = ExternalIdIndex(list(self._graph.nodes()))
+        return self._node_ids
+
+    def ids_to_index(self, ids):
+        return self._node_id_index().to_iloc(ids, strict=True)
+
+    def index_to_ids(self, indices):
+        return self._node_id_index().from_iloc(indices, strict=True)
+
+    def _node_ids_for_index(self, nodes):
+        """
+        Convert node indices, where some may be ``None``, to node IDs.
+        """
+        ids = self._node_id_index()
+        known = [n for n in nodes if n is not None]
+        if len(known) == len(nodes):
+            return ids.from_iloc(np.asarray(nodes), strict=True).tolist()
+
+        converted = iter(ids.from_iloc(np.asarray(known), strict=True).tolist())
+        return [None if n is None else next(converted) for n in nodes]
+
+    def _neighbours_to_index(self, neighbours, include_edge_weight):
+        ids = self._node_id_index()
+        if not include_edge_weight:
+            return ids.to_iloc(neighbours).tolist()
+
+        ilocs = ids.to_iloc([n.node for n in neighbours]).tolist()
+        return [NeighbourWithWeight(i, n.weight) for i, n in zip(ilocs, neighbours)]
+
+    def _typed_edge_data(self):
+        if self._typed_edges is None:
+            ids = self._node_id_index()
+
+            sources = []
+            targets = []
+            types = []
+            weights = []
+            for src, tgt, data in self._graph.edges(data=True):
+                sources.append(src)
+                targets.append(tgt)
+                types.append(data.get(self._edge_type_attr))
+                weights.append(data.get(self._edge_weight_label))
+
+            type_codes, type_names = _type_codes(types, self._edge_type_default)
+            edges = EdgeData(
+                ids.to_iloc(sources),
+                ids.to_iloc(targets),
+                type_codes,
+                type_names,
+                None,
+                len(ids),
+            )
+            # the weights are kept exactly as they are in the graph, including None
+            weight_values = np.empty(len(weights), dtype=object)
+            weight_values[:] = weights
+
+            self._typed_edges = (ids, edges, weight_values)
+
+        return self._typed_edges
+
+    def _typed_edge_rank_data(self):
+        """
+        The position of each edge (in the order of ``_typed_edge_data``) among the incident
+        edges of its source and of its target, in the order that NetworkX lists them (like
+        ``out_edges`` and ``in_edges``, or ``edges`` for an undirected graph).
+        """
+        if self._typed_edge_ranks is None:
+            directed = self.is_directed()
+            edge_ilocs = {
+                edge: iloc for iloc, edge in enumerate(self._graph.edges(keys=True))
+            }
+            source_ranks = np.zeros(len(edge_ilocs), dtype=np.int64)
+            target_ranks = np.zeros(len(edge_ilocs), dtype=np.int64)
+
+            for node in self._graph.nodes():
+                if directed:
+                    for rank, edge in enumerate(self._graph.out_edges(node, keys=True)):
+                        source_ranks[edge_ilocs[edge]] = rank
+                    for rank, edge in enumerate(self._graph.in_edges(node, keys=True)):
+                        target_ranks[edge_ilocs[edge]] = rank
+                    continue
+
+                for rank, (src, tgt, key) in enumerate(
+                    self._graph.edges(node, keys=True)
+                ):
+                    # an undirected edge is stored with one orientation, with `node` as its
+                    # source or its target
+                    iloc = edge_ilocs.get((src, tgt, key))
+                    if iloc is not None:
+                        source_ranks[iloc] = rank
+                    else:
+                        target_ranks[edge_ilocs[(tgt, src, key)]] = rank
+
+            self._typed_edge_ranks = (source_ranks, target_ranks)
+
+        return self._typed_edge_ranks
+
+    def _typed_neighbours(self, node, include_edge_weight, edge_types, directions):
+        """
+        The neighbours of ``node`` along edges with one of ``edge_types``, looked up by slicing
+        the cached typed index, rather than checking the type of each incident edge. They're in
+        the same order as NetworkX lists the edges, like without ``edge_types``.
+        """
+        ids, edges, weights = self._typed_edge_data()
+        source_ranks, target_ranks = self._typed_edge_rank_data()
+        iloc = ids.to_single_iloc(node)
+        if iloc < 0:
+            raise KeyError(f"unknown IDs: {[node]}")
+
+        type_codes = edges.type_codes_of(edge_types)
+        all_edge_ilocs = []
+        all_others = []
+        all_ranks = []
+        for direction in directions:
+            if direction == "out":
+                edge_ilocs = edges.out_edge_ilocs(iloc, type_codes)
+                others = edges.targets[edge_ilocs]
+                ranks = source_ranks[edge_ilocs]
+            else:
+                edge_ilocs = edges.in_edge_ilocs(iloc, type_codes)
+                others = edges.sources[edge_ilocs]
+                ranks = target_ranks[edge_ilocs]
+                if not self.is_directed():
+                    # self loops are already included as out-edges
+                    not_loop = others != iloc
+                    edge_ilocs = edge_ilocs[not_loop]
+                    others = others[not_loop]
+                    ranks = ranks[not_loop]
+
+            all_edge_ilocs.append(edge_ilocs)
+            all_others.append(others)
+            all_ranks.append(ranks)
+
+        order = np.argsort(np.concatenate(all_ranks), kind="stable")
+        neighbours = ids.from_iloc(np.concatenate(all_others)[order]).tolist()
+        if not include_edge_weight:
+            return neighbours
+
+        edge_weights = weights[np.concatenate(all_edge_ilocs)[order]]
+        return [NeighbourWithWeight(n, w) for n, w in zip(neighbours, edge_weights)]
+
+    def _transform_edges(self, edges, get_node, include_edge_weight):
         def get(e):
             if include_edge_weight:
                 return NeighbourWithWeight(
@@ -735,71 +1221,157 @@ class NetworkXStellarGraph(StellarGraph):
                 )
             return get_node(e)
 
-        def is_correct_type(e):
-            return (
-                edge_types_set is None
-                or e[2].get(self._edge_type_attr) in edge_types_set
-            )
-
-        return [get(e) for e in edges if is_correct_type(e)]
+        return [get(e) for e in edges]
 
     def _in(self, node, include_edge_weight, edge_types):
+        if edge_types is not None:
+            return self._typed_neighbours(node, include_edge_weight, edge_types, ["in"])
+
         return self._transform_edges(
-            self._graph.in_edges(node, data=True),
-            lambda e: e[0],
-            include_edge_weight,
-            edge_types,
+            self._graph.in_edges(node, data=True), lambda e: e[0], include_edge_weight,
         )
 
     def _out(self, node, include_edge_weight, edge_types):
+        if edge_types is not None:
+            return self._typed_neighbours(
+                node, include_edge_weight, edge_types, ["out"]
+            )
+
         return self._transform_edges(
-            self._graph.out_edges(node, data=True),
-            lambda e: e[1],
-            include_edge_weight,
-            edge_types,
+            self._graph.out_edges(node, data=True), lambda e: e[1], include_edge_weight,
         )
 
     def neighbors(
-        self, node: Any, include_edge_weight=False, edge_types=None
+        self, node: Any, include_edge_weight=False, edge_types=None, use_index=False
     ) -> Iterable[Any]:
+        if use_index:
+            node = self._node_ids_for_index([node])[0]
+            neighbours = self.neighbors(node, include_edge_weight, edge_types)
+            return self._neighbours_to_index(neighbours, include_edge_weight)
+
         if self.is_directed():
             in_nodes = self._in(node, include_edge_weight, edge_types)
             out_nodes = self._out(node, include_edge_weight, edge_types)
             return in_nodes + out_nodes
+
+        if edge_types is not None:
+            return self._typed_neighbours(
+                node, include_edge_weight, edge_types, ["out", "in"]
+            )
+
         return self._transform_edges(
-            self._graph.edges(node, data=True),
-            lambda e: e[1],
-            include_edge_weight,
-            edge_types,
+            self._graph.edges(node, data=True), lambda e: e[1], include_edge_weight,
         )
 
     def in_nodes(
-        self, node: Any, include_edge_weight=False, edge_types=None
+        self, node: Any, include_edge_weight=False, edge_types=None, use_index=False
     ) -> Iterable[Any]:
-        if self.is_directed():
-            return self._in(node, include_edge_weight, edge_types)
-        return self.neighbors(node, include_edge_weight, edge_types)
+        if not self.is_directed():
+            return self.neighbors(node, include_edge_weight, edge_types, use_index)
+
+        if use_index:
+            node = self._node_ids_for_index([node])[0]
+            neighbours = self._in(node, include_edge_weight, edge_types)
+            return self._neighbours_to_index(neighbours, include_edge_weight)
+
+        return self._in(node, include_edge_weight, edge_types)
 
     def out_nodes(
-        self, node: Any, include_edge_weight=False, edge_types=None
+        self, node: Any, include_edge_weight=False, edge_types=None, use_index=False
     ) -> Iterable[Any]:
-        if self.is_directed():
-            return self._out(node, include_edge_weight, edge_types)
-        return self.neighbors(node, include_edge_weight, edge_types)
+        if not self.is_directed():
+            return self.neighbors(node, include_edge_weight, edge_types, use_index)
+
+        if use_index:
+            node = self._node_ids_for_index([node])[0]
+            neighbours = self._out(node, include_edge_weight, edge_types)
+            return self._neighbours_to_index(neighbours, include_edge_weight)
+
+        return self._out(node, include_edge_weight, edge_types)
 
     ########################################################################
     # Heavy duty methods:
 
+    def degree_array(self, direction, edge_types, weighted):
+        key = (direction, edge_types, weighted)
+        degrees = self._degree_cache.get(key)
+        if degrees is None:
+            _, edges, weights = self._typed_edge_data()
+            if not self.is_directed():
+                # every edge is both an in- and an out-edge
+                direction = "both"
+
+            if weighted:
+                # like NetworkX, edges without a weight have weight 1
+                weights = np.array(
+                    [1.0 if w is None else w for w in weights], dtype=np.float64
+                )
+            else:
+                weights = None
+
+            type_codes = None if edge_types is None else edges.type_codes_of(edge_types)
+            degrees = edges.degrees(direction, type_codes, weights)
+            degrees.flags.writeable = False
+            self._degree_cache[key] = degrees
+        return degrees
+
     def node_degrees(self) -> Mapping[Any, int]:
         return self._graph.degree()
 
-    def to_adjacency_matrix(self, nodes: Optional[Iterable] = None):
-        if nodes is not None:
-            return nx.adjacency_matrix(self._graph.subgraph(nodes))
-        return nx.to_scipy_sparse_matrix(
-            self._graph, dtype="float32", weight=self._edge_weight_label, format="coo"
+    def to_adjacency_matrix(
+        self,
+        nodes: Optional[Iterable] = None,
+        edge_types=None,
+        weighted=True,
+        format="csr",
+        directed=None,
+    ):
+        # Avoid a circular import
+        from .graph_csr import _adjacency_matrix
+
+        ids, edges, weight_values = self._typed_edge_data()
+        if weighted:
+            # like NetworkX, edges without a weight have weight 1
+            weights = np.array(
+                [1 if w is None else w for w in weight_values], dtype=np.float32
+            )
+        else:
+            weights = None
+
+        return _adjacency_matrix(
+            edges,
+            weights,
+            None if nodes is None else ids.to_iloc(nodes, strict=True),
+            None if edge_types is None else edges.type_codes_of(edge_types),
+            self.is_directed() if directed is None else directed,
+            format,
         )
 
+    def _as_csr(self):
+        """
+        A copy of this graph using the CSR backend (sharing the feature arrays), for operations
+        that work on its arrays.
+        """
+        if self._csr_copy is None:
+            # Avoid a circular import
+            from .graph_csr import _from_networkx_backend
+
+            self._csr_copy = _from_networkx_backend(self)
+        return self._csr_copy
+
+    def neighbour_arrays(self, include_edge_weight=False):
+        return self._as_csr().neighbour_arrays(include_edge_weight)
+
+    def save(self, path):
+        # the saved format is the same as the CSR backend's arrays
+        self._as_csr().save(path)
+
+    def subgraph(self, nodes, use_index=False):
+        return self._as_csr().subgraph(nodes, use_index)
+
+    def k_hop_subgraph(self, seeds, k, max_neighbours=None, use_index=False, seed=None):
+        return self._as_csr().k_hop_subgraph(seeds, k, max_neighbours, use_index, seed)
+
     def to_networkx(self):
         # Despite this class using NetworkX, this implementation does not directly use that
         # representation, so that it can be reused as we move away from being NetworkX-based.
@@ -817,6 +1389,8 @@ class NetworkXStellarGraph(StellarGraph):
             if ty in self._node_attribute_arrays:
                 # has features!
                 features = self.node_features(node_ids, node_type=ty)
+                if sps.issparse(features):
+                    features = features.toarray()
 
                 for node_id, node_features in zip(node_ids, features):
                     graph.add_node(
@@ -835,28 +1409,29 @@ class NetworkXStellarGraph(StellarGraph):
         """
         Obtains the edges in the form of the typed mapping:
 
-            {edge_type_triple: {source_node: [target_node, ...]}}
+            {edge_type_triple: EdgeTypeAdjacency}
+
+        where ``adj[edge_type_triple][source_node]`` is the list of target nodes. These are
+        built once and shared between all callers.
 
         Args:
             graph_schema: The graph schema.
         Returns:
              The edge types mapping.
         """
-        edge_types = graph_schema.edge_types
-        adj = {et: defaultdict(lambda: [None]) for et in edge_types}
-        for n1, nbrdict in self._graph.adjacency():
-            for et in edge_types:
-                neigh_et = [
-                    n2
-                    for n2, nkeys in nbrdict.items()
-                    for k in nkeys
-                    if self._is_of_edge_type((n1, n2, k), et)
-                ]
-                # Create adjacency list in lexicographical order
-                # Otherwise sampling methods will not be deterministic
-                # even when the seed is set.
-                adj[et][n1] = sorted(neigh_et, key=str)
-        return adj
+        missing = [
+            et for et in graph_schema.edge_types if et not in self._adjacency_cache
+        ]
+        if missing:
+            ids, edges, _ = self._typed_edge_data()
+            node_type_codes, node_types, _, _ = self._node_type_data()
+            self._adjacency_cache.update(
+                typed_adjacency(
+                    ids, node_type_codes, node_types, edges, self.is_directed(), missing
+                )
+            )
+
+        return {et: self._adjacency_cache[et] for et in graph_schema.edge_types}
 
     # XXX This has not yet been standardised in the interface.
     def edge_weights(self, source_node: Any, target_node: Any) -> List[Any]:
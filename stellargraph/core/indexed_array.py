@@ -0,0 +1,74 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright 2020 Data61, CSIRO
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+__all__ = ["IndexedArray"]
+
+import numpy as np
+import scipy.sparse as sps
+
+from .quantised_array import QuantisedArray
+
+
+class IndexedArray:
+    """
+    A 2D array of node features, with an ID for each row.
+
+    Unlike a pandas DataFrame, the array is used exactly as given, without any copies. This
+    allows it to be a memory-mapped array (such as an ``np.memmap``, or the result of
+    ``np.load(..., mmap_mode="r")``), so that a graph can have features larger than the available
+    memory: only the rows that are requested by ``StellarGraph.node_features`` are read.
+
+    The values can also be a SciPy sparse matrix, for features that are mostly zero (such as a
+    bag of words), which is stored in CSR format.
+
+    Example::
+
+        features = np.load("features.npy", mmap_mode="r")
+        nodes = IndexedArray(features, index=node_ids)
+        Gs = StellarGraph(nodes=nodes, edges=edges)
+
+    Args:
+        values (numpy.ndarray, QuantisedArray or scipy.sparse.spmatrix): a 2D array with one row
+            per node, of shape ``(N, F)``.
+        index (iterable, optional): the ID of the node in each row, of length ``N``. If not
+            specified, the IDs are ``0, 1, ..., N - 1``.
+    """
+
+    def __init__(self, values, index=None):
+        if sps.issparse(values):
+            values = sps.csr_matrix(values)
+        elif not isinstance(values, (np.ndarray, QuantisedArray)):
+            raise TypeError(
+                f"values: expected a NumPy array, found {type(values).__name__}"
+            )
+        if values.ndim != 2:
+            raise ValueError(
+                f"values: expected a 2D array, found one with shape {values.shape}"
+            )
+
+        num_rows = values.shape[0]
+        if index is None:
+            index = range(num_rows)
+        if len(index) != num_rows:
+            raise ValueError(
+                f"index: expected one ID for each of the {num_rows} rows of values, found {len(index)}"
+            )
+
+        self.values = values
+        self.index = index
+
+    def __len__(self):
+        return self.values.shape[0]
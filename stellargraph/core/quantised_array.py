@@ -0,0 +1,219 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright 2020 Data61, CSIRO
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+__all__ = ["QuantisedArray"]
+
+import numpy as np
+
+_INT8_MIN = np.iinfo(np.int8).min
+_INT8_MAX = np.iinfo(np.int8).max
+
+
+class QuantisedArray:
+    """
+    A 2D array of features stored at reduced precision, where only the rows that are selected
+    are converted back to full precision.
+
+    The values are stored either as ``float16``, or as ``int8`` with a scale and zero point for
+    each column, so that each value ``x`` is approximately ``(q - zero_point) * scale``. The
+    ``int8`` range of each column covers its minimum and maximum values, and always includes 0,
+    which is represented exactly.
+
+    Selecting rows with ``array[rows]`` returns a normal NumPy array of ``dtype``, so this can be
+    used anywhere StellarGraph reads node features. Use :meth:`from_array` to create one from
+    full precision features.
+
+    Args:
+        values (numpy.ndarray): the stored values, a 2D ``float16`` or ``int8`` array; this may
+            be memory-mapped
+        scale (numpy.ndarray, optional): for ``int8`` values, the scale of each column
+        zero_point (numpy.ndarray, optional): for ``int8`` values, the integer that represents
+            0 in each column
+        dtype (numpy.dtype): the type of the rows returned by selecting from the array
+    """
+
+    def __init__(self, values, scale=None, zero_point=None, dtype="float32"):
+        if values.ndim != 2:
+            raise ValueError(
+                f"values: expected a 2D array, found one with shape {values.shape}"
+            )
+        if values.dtype == np.int8:
+            if scale is None or zero_point is None:
+                raise ValueError(
+                    "scale, zero_point: expected values for int8 values, found None"
+                )
+        elif values.dtype != np.float16:
+            raise ValueError(
+                f"values: expected float16 or int8 values, found {values.dtype}"
+            )
+
+        self.values = values
+        self.scale = None if scale is None else np.asarray(scale, dtype=np.float32)
+        self.zero_point = (
+            None if zero_point is None else np.asarray(zero_point, dtype=np.int16)
+        )
+        self.dtype = np.dtype(dtype)
+
+    @staticmethod
+    def from_array(array, storage="float16", dtype=None):
+        """
+        Quantise a 2D array of features.
+
+        Args:
+            array (numpy.ndarray): the features
+            storage (str): ``"float16"`` to halve the memory used by ``float32`` features, or
+                ``"int8"`` to use a quarter of it, at lower precision
+            dtype (numpy.dtype, optional): the type of the rows returned by selecting from the
+                result; defaults to the type of ``array``
+
+        Returns:
+            A :class:`QuantisedArray`.
+        """
+        if isinstance(array, QuantisedArray):
+            array = array[:]
+        array = np.asarray(array)
+        if dtype is None:
+            dtype = array.dtype
+
+        if storage == "float16":
+            return QuantisedArray(array.astype(np.float16), dtype=dtype)
+
+        if storage != "int8":
+            raise ValueError(
+                f"storage: expected 'float16' or 'int8', found {storage!r}"
+            )
+
+        if len(array) == 0:
+            low = high = np.zeros(array.shape[1])
+        else:
+            low = np.minimum(array.min(axis=0), 0)
+            high = np.maximum(array.max(axis=0), 0)
+
+        scale = (high - low) / (_INT8_MAX - _INT8_MIN)
+        # an all-zero column can use any scale
+        scale[scale == 0] = 1
+        zero_point = np.round(_INT8_MIN - low / scale)
+
+        quantised = QuantisedArray(
+            np.empty(array.shape, dtype=np.int8), scale, zero_point, dtype
+        )
+        quantised.values[:] = quantised._quantise(array)
+        return quantised
+
+    def _quantise(self, array):
+        """
+        Convert full precision values to the stored representation, using the existing scale
+        and zero point (so values outside the range of ``int8`` values are clipped).
+        """
+        if self.scale is None:
+            return np.asarray(array).astype(np.float16)
+
+        quantised = np.round(array / self.scale) + self.zero_point
+        return np.clip(quantised, _INT8_MIN, _INT8_MAX).astype(np.int8)
+
+    @property
+    def shape(self):
+        return self.values.shape
+
+    @property
+    def ndim(self):
+        return 2
+
+    @property
+    def storage(self):
+        """
+        The type used to store the values: ``"float16"`` or ``"int8"``.
+        """
+        return self.values.dtype.name
+
+    def __len__(self):
+        return len(self.values)
+
+    def __getitem__(self, rows):
+        if isinstance(rows, tuple):
+            # only convert the selected rows, and then select the columns from them
+            rows, *columns = rows
+            return self[rows][(...,) + tuple(columns)]
+
+        values = self.values[rows]
+        if self.scale is None:
+            return values.astype(self.dtype)
+        return ((values.astype(np.int16) - self.zero_point) * self.scale).astype(
+            self.dtype
+        )
+
+    def select(self, rows):
+        """
+        A new QuantisedArray of some of the rows, without converting them to full precision.
+        """
+        return QuantisedArray(
+            self.values[rows], self.scale, self.zero_point, self.dtype
+        )
+
+    def _range(self):
+        """
+        The smallest and largest value of each column that can be represented with the ``int8``
+        scale and zero point.
+        """
+        return (
+            (_INT8_MIN - self.zero_point) * self.scale,
+            (_INT8_MAX - self.zero_point) * self.scale,
+        )
+
+    def append(self, arrays):
+        """
+        A new QuantisedArray with the rows of ``arrays`` added after these ones.
+
+        Full precision arrays are quantised with this array's scale and zero point. For
+        ``int8`` values, if any of the new values is outside the range of a column, the scale
+        and zero point are widened to cover it, and every value is quantised again (which
+        converts the existing values to full precision, and may change them by up to half of
+        the new scale).
+        """
+        new = []
+        for array in arrays:
+            if isinstance(array, QuantisedArray):
+                array = array[:]
+            array = np.asarray(array)
+            if array.shape[1:] != self.shape[1:]:
+                raise ValueError(
+                    f"arrays: expected arrays with {self.shape[1]} columns, found {array.shape[1]}"
+                )
+            new.append(array)
+
+        if self.scale is not None:
+            low, high = self._range()
+            # allow for the rounding of the scale to float32
+            tolerance = self.scale / 2
+            outside = any(
+                len(array) > 0
+                and (
+                    (array.min(axis=0) < low - tolerance).any()
+                    or (array.max(axis=0) > high + tolerance).any()
+                )
+                for array in new
+            )
+            if outside:
+                return QuantisedArray.from_array(
+                    np.concatenate([self[:]] + new), "int8", self.dtype
+                )
+
+        return QuantisedArray(
+            np.concatenate([self.values] + [self._quantise(array) for array in new]),
+            self.scale,
+            self.zero_point,
+            self.dtype,
+        )
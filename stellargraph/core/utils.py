@@ -32,6 +32,20 @@ def is_real_iterable(x):
     return isinstance(x, collections.Iterable) and not isinstance(x, (str, bytes))
 
 
+def dense_features(features):
+    """
+    Converts node features to a dense array, for models that only accept dense inputs.
+
+    Args:
+        features: node features from ``StellarGraph.node_features``, which are a SciPy sparse
+            matrix if the graph stores them sparsely
+
+    Returns:
+        The features as a NumPy array
+    """
+    return features.toarray() if sp.issparse(features) else features
+
+
 def normalize_adj(adj, symmetric=True):
     """
     Normalize adjacency matrix.
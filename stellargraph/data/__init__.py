@@ -25,3 +25,4 @@ from .edge_splitter import *
 from .node_splitter import *
 from .loader import from_epgm, load_dataset_BlogCatalog3
 from .unsupervised_sampler import *
+from .walk_corpus import *
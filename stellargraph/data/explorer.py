@@ -24,6 +24,7 @@ __all__ = [
 ]
 
 
+import multiprocessing
 import numpy as np
 import random
 import warnings
@@ -31,14 +32,115 @@ from collections import defaultdict, deque
 
 from ..core.schema import GraphSchema
 from ..core.graph import StellarGraph
+from ..core.graph_networkx import NetworkXStellarGraph
+from ..core.element_data import _ranges
 from ..core.utils import is_real_iterable
 
 
+# the walker used by each process of the pool in `GraphWalk._run_sharded`
+_shard_walker = None
+
+
+def _init_shard_worker(walker_class, graph, graph_schema):
+    global _shard_walker
+    _shard_walker = walker_class(graph, graph_schema=graph_schema)
+
+
+def _walk_shard(args):
+    nodes, seed, kwargs = args
+    return _shard_walker.run(nodes=nodes, seed=seed, **kwargs)
+
+
+def _shard_seed(seed, shard):
+    """
+    The seed for the random state of a shard of root nodes, derived from the ``seed`` of the run
+    and the shard number, so that it doesn't depend on which process walks the shard.
+    """
+    return int(np.random.SeedSequence([seed, shard]).generate_state(1)[0])
+
+
+class WalkChunks:
+    """
+    The random walks of ``GraphWalk.run_iter``, as an iterable of 2D NumPy arrays of node
+    indices, one per chunk of root nodes, with one row per walk padded with -1 after the end of
+    the walk.
+
+    The walks are generated as they're iterated, and every iteration generates the same walks,
+    so this can be passed to consumers that take several passes over the walks, like training a
+    Word2Vec model for several epochs (see ``sentences``).
+
+    Args:
+        walker (GraphWalk): the walker performing the walks
+        nodes (list): the root nodes, as a list of node IDs
+        chunk_size (int): the number of root nodes in each chunk
+        seed (int): the seed for the random states of the chunks
+        workers (int, optional): the number of processes walking the chunks
+        run_args (dict): the other arguments to the walker's ``run`` method
+    """
+
+    def __init__(self, walker, nodes, chunk_size, seed, workers, run_args):
+        self.walker = walker
+        self.nodes = nodes
+        self.chunk_size = chunk_size
+        self.seed = seed
+        self.workers = workers
+        self.run_args = run_args
+
+    @property
+    def graph(self):
+        return self.walker.graph
+
+    def __iter__(self):
+        length = self.run_args["length"]
+        use_index = self.run_args.get("use_index", False)
+        results = self.walker._walk_shards(
+            self.nodes,
+            self.seed,
+            self.workers or 1,
+            self.chunk_size,
+            wave=self.workers,
+            **self.run_args,
+        )
+        for walks in results:
+            if not isinstance(walks, np.ndarray):
+                walks = self.walker._walks_array(walks, length, use_index)
+            yield walks
+
+    def sentences(self):
+        """
+        The walks as an iterable of lists of the node IDs in each walk, converted to strings,
+        such as for the ``sentences`` of a gensim ``Word2Vec`` model. Like this object itself,
+        it can be iterated several times.
+
+        Returns:
+            An iterable of lists of strings, one per walk.
+        """
+        return _WalkSentences(self)
+
+
+class _WalkSentences:
+    def __init__(self, chunks):
+        self.chunks = chunks
+
+    def __iter__(self):
+        graph = self.chunks.graph
+        for walks in self.chunks:
+            valid = walks >= 0
+            ids = graph.index_to_ids(walks[valid]).astype(str)
+            ends = np.cumsum(valid.sum(axis=1))
+            starts = ends - valid.sum(axis=1)
+            for start, end in zip(starts, ends):
+                yield ids[start:end].tolist()
+
+
 class GraphWalk(object):
     """
     Base class for exploring graphs.
     """
 
+    # the number of root nodes in each shard, for runs with `workers`
+    _SHARD_SIZE = 1000
+
     def __init__(self, graph, graph_schema=None, seed=None):
         self.graph = graph
 
@@ -67,7 +169,8 @@ class GraphWalk(object):
         # Allow additional info for heterogeneous graphs.
         adj = getattr(self, "adj_types", None)
         if not adj:
-            # Create a dict of adjacency lists per edge type, for faster neighbour sampling from graph in SampledHeteroBFS:
+            # Get the adjacency per edge type, for faster neighbour sampling from graph in SampledHeteroBFS;
+            # this is cached by the graph, and so shared with other walkers
             self.adj_types = adj = self.graph._adjacency_types(self.graph_schema)
         return adj
 
@@ -96,7 +199,177 @@ class GraphWalk(object):
         # seed the random number generator
         return random.Random(seed)
 
-    def neighbors(self, node):
+    def _get_np_random_state(self, seed):
+        """
+        Args:
+            seed: The optional seed value for a given run.
+
+        Returns:
+            The NumPy random state as determined by the seed.
+        """
+        if seed is None:
+            return self._np_random_state
+        return np.random.RandomState(seed)
+
+    def _root_indices(self, nodes, use_index):
+        """
+        The node indices of the root nodes, as a NumPy array.
+        """
+        if use_index:
+            indices = np.asarray(nodes, dtype=np.int64)
+            # validates the indices
+            self.graph.index_to_ids(indices)
+            return indices
+
+        try:
+            return self.graph.ids_to_index(nodes).astype(np.int64)
+        except KeyError as e:
+            self._raise_error(e.args[0])
+
+    def _check_workers(self, workers):
+        if type(workers) != int or workers <= 0:
+            self._raise_error(
+                "The number of worker processes, workers, should be a positive integer."
+            )
+
+    def _walk_shards(self, nodes, seed, workers, size, wave=None, **kwargs):
+        """
+        Split the root nodes into shards of ``size`` nodes and yield the result of calling
+        ``run`` for each, in order, with a seed derived from ``seed`` and the shard number, in a
+        pool of ``workers`` processes that walk up to ``wave`` shards at a time (default: all of
+        them).
+        """
+        if not isinstance(nodes, (list, tuple, np.ndarray)):
+            # such as a view of the nodes of a NetworkX graph, which can't be sliced
+            nodes = list(nodes)
+
+        shards = [
+            (nodes[start : start + size], _shard_seed(seed, start // size), kwargs)
+            for start in range(0, len(nodes), size)
+        ] or [(nodes, seed, kwargs)]
+
+        # walk the same arrays in every case, so that the walks don't depend on whether they're
+        # from the original graph (in this process), or a shared copy of it (in the others)
+        graph = self.graph
+        if isinstance(graph._graph, NetworkXStellarGraph):
+            graph = StellarGraph._wrap_backend(graph._graph._as_csr())
+
+        if workers == 1 or len(shards) == 1:
+            walker = type(self)(graph, graph_schema=self.graph_schema)
+            for ns, s, kw in shards:
+                yield walker.run(nodes=ns, seed=s, **kw)
+            return
+
+        if graph._graph._shared_path is None:
+            # the workers map the graph's arrays from disk, rather than each copying them
+            graph = graph.share()
+
+        wave = wave or len(shards)
+        with multiprocessing.Pool(
+            workers,
+            initializer=_init_shard_worker,
+            initargs=(type(self), graph, self.graph_schema),
+        ) as pool:
+            for start in range(0, len(shards), wave):
+                yield from pool.map(_walk_shard, shards[start : start + wave])
+
+    def _run_sharded(self, nodes, seed, workers, **kwargs):
+        """
+        Split the root nodes into shards of a fixed size and call ``run`` for each, with a seed
+        derived from ``seed`` and the shard number, in a pool of ``workers`` processes.
+
+        The walks are the same for any number of workers, because the shards and their seeds
+        don't depend on it, and the walks of the shards are concatenated in order.
+        """
+        self._check_workers(workers)
+
+        if seed is None:
+            seed = int(self._np_random_state.randint(2 ** 32))
+
+        results = list(
+            self._walk_shards(nodes, seed, workers, self._SHARD_SIZE, **kwargs)
+        )
+
+        if isinstance(results[0], np.ndarray):
+            return np.concatenate(results)
+        return [walk for result in results for walk in result]
+
+    def run_iter(
+        self,
+        nodes=None,
+        n=None,
+        length=None,
+        chunk_size=1000,
+        seed=None,
+        workers=None,
+        **kwargs,
+    ):
+        """
+        Perform the random walks of ``run`` lazily, in chunks of ``chunk_size`` root nodes, so
+        that only one chunk of walks (or one per worker) is held in memory at a time.
+
+        This supports ``UniformRandomWalk``, ``BiasedRandomWalk`` and
+        ``UniformRandomMetaPathWalk``. Each chunk is walked with a random state derived from
+        ``seed`` and the chunk number, so the walks are the same as ``run(..., workers=...)``
+        when ``chunk_size`` is 1000, and are the same for every pass over the result. The
+        walks of a chunk are returned as a 2D NumPy array of node indices (see
+        ``StellarGraph.index_to_ids``), with one row per walk, padded with -1 after the end of
+        the walk.
+
+        Example: training a Word2Vec model with gensim, without holding every walk in memory::
+
+            walks = BiasedRandomWalk(graph).run_iter(graph.nodes(), n=10, length=80, p=0.5, q=2)
+            model = Word2Vec(walks.sentences(), min_count=0, sg=1)
+
+        Args:
+            nodes: <list> The root nodes as a list of node IDs
+            n: <int> Total number of random walks per root node
+            length: <int> Maximum length of each random walk
+            chunk_size: <int> The number of root nodes in each chunk
+            seed: <int> Random number generator seed; default is None
+            workers: <int> If specified, walk the chunks in a pool of this many processes
+                that share the graph's arrays (see ``StellarGraph.share``), ``workers`` chunks
+                at a time. The walks are the same for any number of workers.
+            **kwargs: the other parameters of ``run``, such as ``p`` and ``q`` for
+                ``BiasedRandomWalk``, or ``metapaths`` for ``UniformRandomMetaPathWalk``
+
+        Returns:
+            <WalkChunks> An iterable of 2D NumPy arrays of node indices, one per chunk, that can
+            be iterated several times, yielding the same walks each time.
+        """
+        self._check_common_parameters(nodes, n, length, seed)
+        if type(chunk_size) != int or chunk_size <= 0:
+            self._raise_error(
+                "The chunk size, chunk_size, should be a positive integer."
+            )
+        if workers is not None:
+            self._check_workers(workers)
+
+        if seed is None:
+            # every pass over the chunks has to walk the same walks
+            seed = int(self._np_random_state.randint(2 ** 32))
+
+        return WalkChunks(
+            self, nodes, chunk_size, seed, workers, dict(kwargs, n=n, length=length)
+        )
+
+    def _walks_array(self, walks, length, use_index):
+        """
+        Convert walks as lists of nodes into a 2D array of node indices, padded with -1.
+        """
+        lengths = np.array([len(walk) for walk in walks], dtype=np.int64)
+        flat = [node for walk in walks for node in walk]
+        if not use_index:
+            flat = self.graph.ids_to_index(flat)
+
+        array = np.full((len(walks), length), -1, dtype=np.int64)
+        array[np.arange(length) < lengths[:, None]] = flat
+        return array
+
+    def neighbors(self, node, use_index=False):
+        if use_index:
+            # an unknown index is reported by the graph itself
+            return self.graph.neighbors(node, use_index=True)
         if not self.graph.has_node(node):
             self._raise_error("node {} not in graph".format(node))
         return self.graph.neighbors(node)
@@ -183,7 +456,16 @@ class UniformRandomWalk(GraphWalk):
     Performs uniform random walks on the given graph
     """
 
-    def run(self, nodes=None, n=None, length=None, seed=None):
+    def run(
+        self,
+        nodes=None,
+        n=None,
+        length=None,
+        seed=None,
+        use_index=False,
+        batched=False,
+        workers=None,
+    ):
         """
         Perform a random walk starting from the root nodes.
 
@@ -192,22 +474,56 @@ class UniformRandomWalk(GraphWalk):
             n: <int> Total number of random walks per root node
             length: <int> Maximum length of each random walk
             seed: <int> Random number generator seed; default is None
+            use_index: <bool> If True, the root nodes and the nodes in the walks are node
+                indices (see ``StellarGraph.ids_to_index``) rather than node IDs
+            batched: <bool> If True, advance every walk at once with NumPy operations over the
+                graph's neighbour arrays, rather than walking one node at a time, and return
+                the walks as a 2D array of node indices. This is much faster for many walks.
+            workers: <int> If specified, walk from the root nodes in shards of a fixed size,
+                each with a random state derived from ``seed`` and the shard, in a pool of this
+                many processes that share the graph's arrays (see ``StellarGraph.share``). The
+                walks are the same for any number of workers (but not the same as without
+                ``workers``).
 
         Returns:
-            <list> List of lists of nodes ids for each of the random walks
+            <list> List of lists of nodes ids for each of the random walks. With
+            ``batched=True``, a NumPy array of node indices (see
+            ``StellarGraph.index_to_ids``) with shape ``(len(nodes) * n, length)``, with one
+            row per walk, where walks that reach a node without neighbours are padded with -1.
 
         """
         self._check_common_parameters(nodes, n, length, seed)
+
+        if workers is not None:
+            return self._run_sharded(
+                nodes,
+                seed,
+                workers,
+                n=n,
+                length=length,
+                use_index=use_index,
+                batched=batched,
+            )
+
+        if batched:
+            roots = np.repeat(self._root_indices(nodes, use_index), n)
+            offsets, neighbours = self.graph._neighbour_arrays()
+            return _uniform_walks(
+                offsets, neighbours, roots, length, self._get_np_random_state(seed)
+            )
+
         rs = self._get_random_state(seed)
 
         # for each root node, do n walks
-        return [self._walk(rs, node, length) for node in nodes for _ in range(n)]
+        return [
+            self._walk(rs, node, length, use_index) for node in nodes for _ in range(n)
+        ]
 
-    def _walk(self, rs, start_node, length):
+    def _walk(self, rs, start_node, length, use_index=False):
         walk = [start_node]
         current_node = start_node
         for _ in range(length - 1):
-            neighbours = self.neighbors(current_node)
+            neighbours = self.neighbors(current_node, use_index)
             if not neighbours:
                 # dead end, so stop
                 break
@@ -219,6 +535,48 @@ class UniformRandomWalk(GraphWalk):
         return walk
 
 
+def _uniform_walks(offsets, neighbours, roots, length, rs):
+    """
+    Perform a uniform random walk from each of ``roots`` at once, over a CSR index of neighbours
+    (see ``StellarGraph._neighbour_arrays``): each step draws one random offset into the
+    neighbours of the current node of every walk that hasn't reached a dead end.
+
+    Args:
+        offsets (array of int): the offsets of each node's neighbours
+        neighbours (array of int): the neighbour indices
+        roots (array of int): the node index to start each walk from
+        length (int): the length of each walk
+        rs (numpy.random.RandomState): the random state
+
+    Returns:
+        A NumPy array of shape ``(len(roots), length)``, with the walks padded with -1 after a
+        dead end.
+    """
+    walks = np.full((len(roots), length), -1, dtype=neighbours.dtype)
+    walks[:, 0] = roots
+
+    # the walks that haven't reached a dead end, and their current nodes
+    active = np.arange(len(roots))
+    current = roots
+    for step in range(1, length):
+        starts = offsets[current]
+        degrees = offsets[current + 1] - starts
+
+        has_neighbours = degrees > 0
+        active = active[has_neighbours]
+        if len(active) == 0:
+            break
+
+        starts = starts[has_neighbours]
+        degrees = degrees[has_neighbours]
+        choices = (rs.random_sample(len(active)) * degrees).astype(np.int64)
+
+        current = neighbours[starts + choices]
+        walks[active, step] = current
+
+    return walks
+
+
 def naive_weighted_choices(rs, weights):
     """
     Select an index at random, weighted by the iterator `weights` of
@@ -254,6 +612,256 @@ def naive_weighted_choices(rs, weights):
     return idx
 
 
+def _segment_cumulative(weights, offsets):
+    """
+    The cumulative sum of ``weights``, where each segment ``offsets[i]:offsets[i + 1]`` is
+    normalised to sum to 1 (a segment that sums to 0 is treated as uniform), so that sampling
+    from a segment is a binary search for ``start + u`` where ``start`` is the total before it
+    and ``u`` is uniform in [0, 1).
+
+    Returns:
+        A tuple of the cumulative sums and the total before each segment.
+    """
+    sizes = np.diff(offsets)
+    nonempty = sizes > 0
+    totals = np.zeros(len(sizes))
+    totals[nonempty] = np.add.reduceat(weights, offsets[:-1][nonempty])
+
+    owner_totals = np.repeat(totals, sizes)
+    owner_sizes = np.repeat(sizes, sizes)
+    normalised = np.where(
+        owner_totals > 0,
+        weights / np.where(owner_totals > 0, owner_totals, 1),
+        1 / np.maximum(owner_sizes, 1),
+    )
+    cumulative = np.cumsum(normalised)
+    before = np.concatenate([[0.0], cumulative])[offsets[:-1]]
+    return cumulative, before
+
+
+def _sample_segments(cumulative, before, starts, sizes, rs):
+    """
+    Sample an offset into each of the segments ``starts[i]:starts[i] + sizes[i]`` of a
+    :func:`_segment_cumulative` array, where ``before`` is the total before each segment.
+    """
+    targets = before + rs.random_sample(len(starts))
+    positions = np.searchsorted(cumulative, targets, side="right")
+    # rounding can put a position just outside its segment
+    return np.clip(positions - starts, 0, sizes - 1)
+
+
+class _BiasedWalkSampler:
+    """
+    Precomputed structures for sampling the second order transitions of :class:`BiasedRandomWalk`
+    for many walks at once.
+
+    The walks move along "arcs": the ``i``-th arc is from the node that owns position ``i`` of
+    the graph's neighbour arrays to ``neighbours[i]``. The next step of a walk that arrived at
+    node ``v`` along an arc from ``t`` picks a neighbour ``x`` of ``v`` with probability
+    proportional to ``weight(v, x) * bias(t, x)``, where the bias is ``1/p`` if ``x`` is ``t``,
+    1 if ``x`` is a neighbour of ``t`` and ``1/q`` otherwise.
+
+    For the arcs into low degree nodes, this distribution is precomputed as a table (with
+    ``degree(v)`` entries for each arc into ``v``), as long as the tables fit in
+    ``memory_budget`` bytes, and sampled with a binary search. For the other arcs, it is sampled
+    by rejection: ``x`` is proposed from the first order (weighted) distribution over the
+    neighbours of ``v`` and accepted with probability ``bias(t, x) / max_bias``, which takes a
+    constant number of proposals on average, independent of the degree. Walks that are still
+    rejected after a few proposals (such as with extreme values of ``p`` and ``q``) are sampled
+    exactly, by computing the distribution over the neighbours of ``v`` on the fly.
+
+    Args:
+        graph (StellarGraph): the graph
+        p (float): the return parameter
+        q (float): the in-out parameter
+        weighted (bool): whether to use the edge weights
+        memory_budget (int): the maximum size in bytes of the precomputed tables
+    """
+
+    _TABLE_ENTRY_BYTES = 8
+    _REJECTION_ROUNDS = 8
+
+    def __init__(self, graph, p, q, weighted, memory_budget):
+        offsets, neighbours, weights = graph._neighbour_arrays(include_edge_weight=True)
+        number_of_nodes = len(offsets) - 1
+        self.degrees = np.diff(offsets)
+        self.offsets = offsets
+        self.biases = np.array([1.0 / p, 1.0, 1.0 / q])
+
+        # sort the neighbours of each node, so that membership can be found with a binary search
+        # of the (node, neighbour) pairs
+        owners = np.repeat(np.arange(number_of_nodes), self.degrees)
+        order = np.lexsort((neighbours, owners))
+        self.owners = owners
+        self.neighbours = neighbours[order]
+        self.number_of_nodes = number_of_nodes
+        self.pairs = owners * number_of_nodes + self.neighbours
+
+        if weighted:
+            weights = weights[order]
+            self._check_weights(weights)
+            self.proposal = _segment_cumulative(weights, offsets)
+        else:
+            weights = np.ones(len(neighbours))
+            self.proposal = None
+
+        self.weights = weights
+        self._build_tables(memory_budget)
+
+    def _check_weights(self, weights):
+        invalid = ~np.isfinite(weights) | (weights < 0)
+        if invalid.any():
+            first = np.flatnonzero(invalid)[0]
+            raise ValueError(
+                f"(BiasedRandomWalk) Missing, invalid or negative edge weight ({weights[first]}) between node indices ({self.owners[first]}) and ({self.neighbours[first]})."
+            )
+
+        # parallel edges are sorted next to each other
+        ambiguous = (self.pairs[1:] == self.pairs[:-1]) & (weights[1:] != weights[:-1])
+        if ambiguous.any():
+            first = np.flatnonzero(ambiguous)[0]
+            raise ValueError(
+                f"(BiasedRandomWalk) Node indices ({self.owners[first]}) and ({self.neighbours[first]}) have multiple edges with different weights. Ambiguous to choose an edge for the random walk."
+            )
+
+    def _build_tables(self, memory_budget):
+        # the arcs into a node each need a table entry for every neighbour of the node, so use
+        # the budget on the nodes with the smallest tables
+        in_arcs = np.bincount(self.neighbours, minlength=self.number_of_nodes)
+        costs = in_arcs * self.degrees * self._TABLE_ENTRY_BYTES
+        by_cost = np.argsort(costs, kind="stable")
+        affordable = np.cumsum(costs[by_cost]) <= memory_budget
+        in_table = np.zeros(self.number_of_nodes, dtype=bool)
+        in_table[by_cost[affordable]] = True
+
+        arcs = np.flatnonzero(in_table[self.neighbours])
+        self.arc_tables = np.full(len(self.neighbours), -1, dtype=np.int64)
+        self.arc_tables[arcs] = np.arange(len(arcs))
+
+        self.table_starts, table_weights = self._transition_weights(
+            self.owners[arcs], self.neighbours[arcs]
+        )
+        self.tables = _segment_cumulative(table_weights, self.table_starts)
+
+    def _transition_weights(self, previous, current):
+        """
+        The unnormalised transition weights over the neighbours of each of ``current``, having
+        come from ``previous``, concatenated, along with the offsets of each segment.
+        """
+        sizes = self.degrees[current]
+        positions = _ranges(self.offsets[current], sizes)
+        weights = self.weights[positions] * self._bias(
+            np.repeat(previous, sizes), self.neighbours[positions]
+        )
+        return np.concatenate([[0], np.cumsum(sizes)]), weights
+
+    def _bias(self, previous, candidates):
+        """
+        The second order bias of moving to each of ``candidates``, having come from
+        ``previous``.
+        """
+        pairs = previous * self.number_of_nodes + candidates
+        found = np.searchsorted(self.pairs, pairs)
+        is_neighbour = self.pairs[np.minimum(found, len(self.pairs) - 1)] == pairs
+        kind = np.where(candidates == previous, 0, np.where(is_neighbour, 1, 2))
+        return self.biases[kind]
+
+    def _propose(self, nodes, rs):
+        """
+        Sample a neighbour of each of ``nodes`` from the first order distribution, returning the
+        offset into its neighbours.
+        """
+        sizes = self.degrees[nodes]
+        if self.proposal is None:
+            return (rs.random_sample(len(nodes)) * sizes).astype(np.int64)
+
+        cumulative, before = self.proposal
+        return _sample_segments(
+            cumulative, before[nodes], self.offsets[nodes], sizes, rs
+        )
+
+    def _next_offsets(self, arcs, rs):
+        """
+        Sample the offset into the neighbours of the node each of ``arcs`` ends at, for the next
+        step.
+        """
+        result = np.empty(len(arcs), dtype=np.int64)
+
+        slots = self.arc_tables[arcs]
+        tabled = slots >= 0
+        if tabled.any():
+            cumulative, before = self.tables
+            tabled_slots = slots[tabled]
+            starts = self.table_starts[tabled_slots]
+            result[tabled] = _sample_segments(
+                cumulative,
+                before[tabled_slots],
+                starts,
+                self.table_starts[tabled_slots + 1] - starts,
+                rs,
+            )
+
+        pending = np.flatnonzero(~tabled)
+        previous = self.owners[arcs]
+        current = self.neighbours[arcs]
+        max_bias = self.biases.max()
+        for _ in range(self._REJECTION_ROUNDS):
+            if len(pending) == 0:
+                break
+
+            nodes = current[pending]
+            proposed = self._propose(nodes, rs)
+            candidates = self.neighbours[self.offsets[nodes] + proposed]
+            bias = self._bias(previous[pending], candidates)
+
+            accepted = rs.random_sample(len(pending)) * max_bias < bias
+            result[pending[accepted]] = proposed[accepted]
+            pending = pending[~accepted]
+
+        if len(pending) > 0:
+            starts, weights = self._transition_weights(
+                previous[pending], current[pending]
+            )
+            cumulative, before = _segment_cumulative(weights, starts)
+            result[pending] = _sample_segments(
+                cumulative, before, starts[:-1], np.diff(starts), rs
+            )
+
+        return result
+
+    def walk(self, roots, length, rs):
+        """
+        Walk from each of ``roots``, returning an array of shape ``(len(roots), length)``, padded
+        with -1 after a dead end.
+        """
+        walks = np.full((len(roots), length), -1, dtype=self.neighbours.dtype)
+        walks[:, 0] = roots
+
+        active = np.arange(len(roots))
+        current = roots
+        arcs = None
+        for step in range(1, length):
+            has_neighbours = self.degrees[current] > 0
+            active = active[has_neighbours]
+            if len(active) == 0:
+                break
+            current = current[has_neighbours]
+
+            if arcs is None:
+                # like the first order walk, the first step is uniform
+                offsets = (
+                    rs.random_sample(len(current)) * self.degrees[current]
+                ).astype(np.int64)
+            else:
+                offsets = self._next_offsets(arcs[has_neighbours], rs)
+
+            arcs = self.offsets[current] + offsets
+            current = self.neighbours[arcs]
+            walks[active, step] = current
+
+        return walks
+
+
 class BiasedRandomWalk(GraphWalk):
     """
     Performs biased second order random walks (like those used in Node2Vec algorithm
@@ -261,7 +869,17 @@ class BiasedRandomWalk(GraphWalk):
     """
 
     def run(
-        self, nodes=None, n=None, p=1.0, q=1.0, length=None, seed=None, weighted=False
+        self,
+        nodes=None,
+        n=None,
+        p=1.0,
+        q=1.0,
+        length=None,
+        seed=None,
+        weighted=False,
+        batched=False,
+        memory_budget=2 ** 28,
+        workers=None,
     ):
 
         """
@@ -275,13 +893,57 @@ class BiasedRandomWalk(GraphWalk):
             length: <int> Maximum length of each random walk
             seed: <int> Random number generator seed; default is None
             weighted: <False or True> Indicates whether the walk is unweighted or weighted
+            batched: <bool> If True, advance every walk at once with NumPy operations, sampling
+                each step in constant time (on average) from transition tables precomputed for
+                these ``p``, ``q`` and ``weighted`` values (and reused by later runs with the same
+                values), and return the walks as a 2D array of node indices.
+            memory_budget: <int> With ``batched=True``, the maximum number of bytes to use for
+                the precomputed transition tables. The tables for the transitions into a node
+                take ``8 * degree ** 2`` bytes, and so nodes with the highest degrees that
+                don't fit are sampled by rejection sampling instead.
+            workers: <int> If specified, walk from the root nodes in shards of a fixed size,
+                each with a random state derived from ``seed`` and the shard, in a pool of this
+                many processes that share the graph's arrays (see ``StellarGraph.share``). The
+                walks are the same for any number of workers (but not the same as without
+                ``workers``).
 
         Returns:
-            <list> List of lists of nodes ids for each of the random walks
+            <list> List of lists of nodes ids for each of the random walks. With
+            ``batched=True``, a NumPy array of node indices (see
+            ``StellarGraph.index_to_ids``) with shape ``(len(nodes) * n, length)``, with one
+            row per walk, where walks that reach a node without neighbours are padded with -1.
 
         """
         self._check_common_parameters(nodes, n, length, seed)
         self._check_weights(p, q, weighted)
+
+        if workers is not None:
+            return self._run_sharded(
+                nodes,
+                seed,
+                workers,
+                n=n,
+                p=p,
+                q=q,
+                length=length,
+                weighted=weighted,
+                batched=batched,
+                memory_budget=memory_budget,
+            )
+
+        if batched:
+            key = (p, q, weighted, memory_budget)
+            sampler = getattr(self, "_batched_sampler", None)
+            if sampler is None or sampler[0] != key:
+                sampler = (
+                    key,
+                    _BiasedWalkSampler(self.graph, p, q, weighted, memory_budget),
+                )
+                self._batched_sampler = sampler
+
+            roots = np.repeat(self._root_indices(nodes, False), n)
+            return sampler[1].walk(roots, length, self._get_np_random_state(seed))
+
         rs = self._get_random_state(seed)
 
         if weighted:
@@ -407,7 +1069,9 @@ class UniformRandomMetaPathWalk(GraphWalk):
     For heterogeneous graphs, it performs uniform random walks based on given metapaths.
     """
 
-    def run(self, nodes=None, n=None, length=None, metapaths=None, seed=None):
+    def run(
+        self, nodes=None, n=None, length=None, metapaths=None, seed=None, workers=None
+    ):
         """
         Performs metapath-driven uniform random walks on heterogeneous graphs.
 
@@ -419,12 +1083,22 @@ class UniformRandomMetaPathWalk(GraphWalk):
             [['Author', 'Paper', 'Author'], ['Author, 'Paper', 'Venue', 'Paper', 'Author']] specifies two metapath
             schemas of length 3 and 5 respectively.
             seed: <int> Random number generator seed; default is None
+            workers: <int> If specified, walk from the root nodes in shards of a fixed size,
+                each with a random state derived from ``seed`` and the shard, in a pool of this
+                many processes that share the graph's arrays (see ``StellarGraph.share``). The
+                walks are the same for any number of workers (but not the same as without
+                ``workers``).
 
         Returns:
             <list> List of lists of nodes ids for each of the random walks generated
         """
         self._check_common_parameters(nodes, n, length, seed)
         self._check_metapath_values(metapaths)
+
+        if workers is not None:
+            return self._run_sharded(
+                nodes, seed, workers, n=n, length=length, metapaths=metapaths
+            )
         rs = self._get_random_state(seed)
 
         walks = []
@@ -506,7 +1180,7 @@ class SampledBreadthFirstWalk(GraphWalk):
     It can be used to extract a random sub-graph starting from a set of initial nodes.
     """
 
-    def run(self, nodes=None, n=1, n_size=None, seed=None):
+    def run(self, nodes=None, n=1, n_size=None, seed=None, use_index=False):
         """
         Performs a sampled breadth-first walk starting from the root nodes.
 
@@ -518,6 +1192,8 @@ class SampledBreadthFirstWalk(GraphWalk):
             neighbours with replacement is always used regardless of the node degree and number of neighbours
             requested.
             seed: <int> Random number generator seed; default is None
+            use_index: <bool> If True, the root nodes and the nodes in the walks are node indices (see
+            ``StellarGraph.ids_to_index``) rather than node IDs.
 
         Returns:
             A list of lists such that each list element is a sequence of ids corresponding to a BFW.
@@ -547,7 +1223,9 @@ class SampledBreadthFirstWalk(GraphWalk):
                     if depth > max_hops:
                         continue
                     neighbours = (
-                        self.neighbors(cur_node) if cur_node is not None else []
+                        self.neighbors(cur_node, use_index)
+                        if cur_node is not None
+                        else []
                     )
                     if len(neighbours) == 0:
                         # Either node is unconnected or is in directed graph with no out-nodes.
@@ -127,10 +127,8 @@ class UnsupervisedSampler:
         """
         self._check_parameter_values(batch_size)
 
-        all_nodes = list(self.graph.nodes())
         # Use the sampling distribution as per node2vec
-        degrees = self.graph.node_degrees()
-        sampling_distribution = np.array([degrees[n] ** 0.75 for n in all_nodes])
+        sampling_distribution = self.graph.node_degrees(as_array=True) ** 0.75
         sampling_distribution_norm = sampling_distribution / np.sum(
             sampling_distribution
         )
@@ -150,8 +148,12 @@ class UnsupervisedSampler:
             ]
         )
 
-        negative_samples = self.np_random.choice(
-            all_nodes, size=len(positive_pairs), p=sampling_distribution_norm
+        negative_samples = self.graph.index_to_ids(
+            self.np_random.choice(
+                len(sampling_distribution_norm),
+                size=len(positive_pairs),
+                p=sampling_distribution_norm,
+            )
         )
         negative_pairs = np.column_stack((positive_pairs[:, 0], negative_samples))
 
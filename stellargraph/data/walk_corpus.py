@@ -0,0 +1,223 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright 2020 Data61, CSIRO
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Storing random walks on disk in a compact binary format, so that they can be memory-mapped and
+reused for several training runs without walking again.
+
+"""
+__all__ = ["save_walks", "load_walks", "WalkCorpus"]
+
+import json
+import os
+
+import numpy as np
+
+from ..core.element_data import _ids_to_array, _smallest_index_dtype
+
+_METADATA_FILE = "walks.json"
+_NODES_FILE = "nodes.bin"
+_OFFSETS_FILE = "offsets.bin"
+_IDS_FILE = "ids.npy"
+
+
+def save_walks(walks, path, graph=None):
+    """
+    Write random walks to a directory, which can be read back with :func:`load_walks` as a
+    memory-mapped :class:`WalkCorpus`.
+
+    The walks are written as they're iterated, so the result of ``run_iter`` on a walker (such
+    as :class:`BiasedRandomWalk` or :class:`UniformRandomMetaPathWalk`) is never held in memory
+    at once. The nodes of every walk are stored one after the other as 32-bit node indices
+    (64-bit for graphs with more than 2**31 nodes), without any padding, along with the offset
+    of the start of each walk, and the ID of each node index.
+
+    Args:
+        walks: the walks, as an iterable of 2D NumPy arrays of node indices with one row per
+            walk, padded with -1 (like the result of ``run_iter``), or as one such array
+            (like the result of ``run`` with ``batched=True``)
+        path (str): the directory to write to; it is created if it doesn't exist
+        graph (StellarGraph, optional): the graph that was walked; this is only required if
+            ``walks`` is not the result of ``run_iter``
+    """
+    if graph is None:
+        graph = getattr(walks, "graph", None)
+        if graph is None:
+            raise ValueError(
+                "graph: expected the graph that was walked, found None; it is only optional for the result of 'run_iter'"
+            )
+    if isinstance(walks, np.ndarray):
+        walks = [walks]
+
+    os.makedirs(path, exist_ok=True)
+
+    ids = graph.index_to_ids(np.arange(graph.number_of_nodes()))
+    dtype = _smallest_index_dtype(len(ids))
+
+    num_walks = 0
+    num_steps = 0
+    with open(os.path.join(path, _NODES_FILE), "wb") as nodes_file, open(
+        os.path.join(path, _OFFSETS_FILE), "wb"
+    ) as offsets_file:
+        offsets_file.write(np.zeros(1, dtype=np.int64).tobytes())
+
+        for chunk in walks:
+            # the padding is only ever after the end of a walk, so this keeps each walk in order
+            valid = chunk >= 0
+            nodes_file.write(chunk[valid].astype(dtype).tobytes())
+
+            ends = num_steps + np.cumsum(valid.sum(axis=1), dtype=np.int64)
+            offsets_file.write(ends.tobytes())
+
+            num_walks += len(chunk)
+            if len(ends) > 0:
+                num_steps = int(ends[-1])
+
+    np.save(os.path.join(path, _IDS_FILE), _ids_to_array(ids))
+
+    with open(os.path.join(path, _METADATA_FILE), "w") as f:
+        json.dump(
+            {
+                "dtype": np.dtype(dtype).name,
+                "number_of_walks": num_walks,
+                "number_of_steps": num_steps,
+            },
+            f,
+        )
+
+
+def load_walks(path, mmap=True):
+    """
+    Read random walks written by :func:`save_walks`.
+
+    Args:
+        path (str): the directory written by :func:`save_walks`
+        mmap (bool, optional): if True, memory-map the walks, so that they are only read from
+            disk as they are needed, otherwise read them into memory
+
+    Returns:
+        A :class:`WalkCorpus` of the walks.
+    """
+    with open(os.path.join(path, _METADATA_FILE)) as f:
+        metadata = json.load(f)
+
+    def load(name, dtype, size):
+        filename = os.path.join(path, name)
+        if mmap and size > 0:
+            return np.memmap(filename, dtype=dtype, mode="r", shape=(size,))
+        return np.fromfile(filename, dtype=dtype, count=size)
+
+    nodes = load(_NODES_FILE, metadata["dtype"], metadata["number_of_steps"])
+    offsets = load(_OFFSETS_FILE, np.int64, metadata["number_of_walks"] + 1)
+    ids = np.load(os.path.join(path, _IDS_FILE), allow_pickle=True)
+    return WalkCorpus(nodes, offsets, ids)
+
+
+class WalkCorpus:
+    """
+    A collection of random walks stored compactly as one array of the node indices of every
+    walk, one after the other, and an array of the offsets of the start of each walk, usually
+    read from disk with :func:`load_walks`.
+
+    Iterating over this yields each walk as a NumPy array of node indices, and ``sentences``
+    yields the walks as lists of node IDs, optionally in a different random order on each pass,
+    such as for training a gensim ``Word2Vec`` model::
+
+        corpus = load_walks("walks")
+        model = Word2Vec(corpus.sentences(shuffle=True, seed=42), min_count=0, sg=1, iter=5)
+
+    Args:
+        nodes (numpy.ndarray): the node indices of every walk, one walk after the other
+        offsets (numpy.ndarray): the offset into ``nodes`` of the start of each walk, followed
+            by the length of ``nodes``
+        ids (numpy.ndarray): the ID of each node index
+    """
+
+    def __init__(self, nodes, offsets, ids):
+        if len(offsets) == 0 or offsets[0] != 0 or offsets[-1] != len(nodes):
+            raise ValueError(
+                f"offsets: expected an array starting at 0 and ending at the number of nodes ({len(nodes)})"
+            )
+
+        self.nodes = nodes
+        self.offsets = offsets
+        self.ids = ids
+        self._tokens = None
+
+    def __len__(self):
+        return len(self.offsets) - 1
+
+    def __getitem__(self, walk):
+        """
+        The node indices of the walk with index ``walk``.
+        """
+        if not -len(self) <= walk < len(self):
+            raise IndexError(
+                f"walk: expected an index less than {len(self)}, found {walk}"
+            )
+        walk %= len(self)
+        return np.asarray(self.nodes[self.offsets[walk] : self.offsets[walk + 1]])
+
+    def __iter__(self):
+        for walk in range(len(self)):
+            yield self[walk]
+
+    def index_to_ids(self, indices):
+        """
+        Convert node indices in the walks to their node IDs.
+
+        Args:
+            indices (numpy.ndarray): node indices
+
+        Returns:
+            A NumPy array of the node IDs.
+        """
+        return self.ids[indices]
+
+    def sentences(self, shuffle=False, seed=None):
+        """
+        The walks as an iterable of lists of the node IDs in each walk, converted to strings,
+        such as for the ``sentences`` of a gensim ``Word2Vec`` model. It can be iterated
+        several times, yielding each walk once per pass.
+
+        Args:
+            shuffle (bool): if True, yield the walks in a different random order on each pass
+            seed (int, optional): the random seed for the orders of the passes
+
+        Returns:
+            An iterable of lists of strings, one per walk.
+        """
+        if self._tokens is None:
+            self._tokens = self.ids.astype(str)
+
+        return _CorpusSentences(self, shuffle, np.random.RandomState(seed))
+
+
+class _CorpusSentences:
+    def __init__(self, corpus, shuffle, random_state):
+        self.corpus = corpus
+        self.shuffle = shuffle
+        self.random_state = random_state
+
+    def __iter__(self):
+        corpus = self.corpus
+        if self.shuffle:
+            order = self.random_state.permutation(len(corpus))
+        else:
+            order = range(len(corpus))
+
+        for walk in order:
+            yield corpus._tokens[corpus[walk]].tolist()
@@ -19,7 +19,7 @@ import tensorflow.keras.backend as K
 
 from ..mapper import FullBatchNodeGenerator
 from .preprocessing_layer import GraphPreProcessingLayer
-from .misc import SqueezedSparseConversion
+from .misc import SqueezedSparseConversion, _feature_placeholders, _sparse_features
 
 
 class APPNPPropagationLayer(Layer):
@@ -242,6 +242,7 @@ class APPNP:
 
         # Check if the generator is producing a sparse matrix
         self.use_sparse = generator.use_sparse
+        self.sparse_features = generator.sparse_features
         if self.method == "none":
             self.graph_norm_layer = GraphPreProcessingLayer(
                 num_of_nodes=self.generator.Aadj.shape[0]
@@ -287,19 +288,34 @@ class APPNP:
         ]
         where N is the number of nodes, F the number of input features,
               E is the number of edges, O the number of output nodes.
+        If the generator's features are sparse, the node features are replaced by
+        their indices (1, nnz, 2) and values (1, nnz).
         Args:
             x (Tensor): input tensors
         Returns:
             Output tensor
         """
-        x_in, out_indices, *As = x
-
-        # Currently we require the batch dimension to be one for full-batch methods
-        batch_dim, n_nodes, _ = K.int_shape(x_in)
-        if batch_dim != 1:
-            raise ValueError(
-                "Currently full-batch methods only support a batch dimension of one"
+        mlp_layers = self._layers[: (2 * len(self.layer_sizes))]
+        if self.sparse_features:
+            x_indices, x_values, out_indices, *As = x
+            n_nodes, n_features = self.generator.features.shape
+            # the first dropout layer is applied to the values of the sparse features, and
+            # the first dense layer multiplies them by its kernel, giving dense N x F' outputs
+            x_in = _sparse_features(
+                [x_indices, x_values], (n_nodes, n_features), mlp_layers[0]
             )
+            h_layer = Lambda(lambda h: K.expand_dims(h, 0))(mlp_layers[1](x_in))
+            mlp_layers = mlp_layers[2:]
+        else:
+            x_in, out_indices, *As = x
+            h_layer = x_in
+
+            # Currently we require the batch dimension to be one for full-batch methods
+            batch_dim, n_nodes, _ = K.int_shape(x_in)
+            if batch_dim != 1:
+                raise ValueError(
+                    "Currently full-batch methods only support a batch dimension of one"
+                )
 
         # Convert input indices & values to a sparse matrix
         if self.use_sparse:
@@ -320,9 +336,7 @@ class APPNP:
                 "The APPNP method currently only accepts a single matrix"
             )
 
-        h_layer = x_in
-
-        for layer in self._layers[: (2 * len(self.layer_sizes))]:
+        for layer in mlp_layers:
             h_layer = layer(h_layer)
 
         feature_layer = h_layer
@@ -362,8 +376,8 @@ class APPNP:
             A_placeholders = [A_m]
 
         # Inputs for features & target indices
-        x_t = Input(batch_shape=(1, N_nodes, N_feat))
-        x_inp = [x_t, out_indices_t] + A_placeholders
+        x_t = _feature_placeholders(N_nodes, N_feat, self.sparse_features)
+        x_inp = x_t + [out_indices_t] + A_placeholders
         x_out = self(x_inp)
 
         # TODO: Support multiple matrices
@@ -388,6 +402,11 @@ class APPNP:
             and `x_out` is a Keras tensor for the APPNP model output.
         """
 
+        if self.sparse_features:
+            raise ValueError(
+                "propagate_model: expected a generator with dense node features, found sparse features"
+            )
+
         N_nodes = self.generator.features.shape[0]
         N_feat = self.generator.features.shape[1]
 
@@ -14,12 +14,18 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import tensorflow as tf
 from tensorflow.keras import backend as K
 from tensorflow.keras import activations, initializers, constraints, regularizers
 from tensorflow.keras.layers import Input, Layer, Lambda, Dropout, Reshape
 
 from ..mapper import FullBatchNodeGenerator
-from .misc import SqueezedSparseConversion
+from .misc import (
+    SqueezedSparseConversion,
+    _feature_placeholders,
+    _sparse_features,
+    _squeeze_features,
+)
 from .preprocessing_layer import GraphPreProcessingLayer
 
 
@@ -136,11 +142,12 @@ class GraphConvolution(Layer):
         """
         feature_shape, out_shape, *As_shapes = input_shapes
 
-        batch_dim = feature_shape[0]
+        # sparse features have no batch dimension
+        batch_dim = 1 if len(feature_shape) == 2 else feature_shape[0]
         if self.final_layer:
             out_dim = out_shape[1]
         else:
-            out_dim = feature_shape[1]
+            out_dim = feature_shape[-2]
 
         return batch_dim, out_dim, self.units
 
@@ -181,7 +188,7 @@ class GraphConvolution(Layer):
 
         Args:
             inputs (list): a list of 3 input tensors that includes
-                node features (size 1 x N x F),
+                node features (size 1 x N x F, or a sparse tensor of size N x F),
                 output indices (size 1 x M)
                 graph adjacency matrix (size N x N),
                 where N is the number of nodes in the graph, and
@@ -191,20 +198,19 @@ class GraphConvolution(Layer):
             Keras Tensor that represents the output of the layer.
         """
         features, out_indices, *As = inputs
-        batch_dim, n_nodes, _ = K.int_shape(features)
-        if batch_dim != 1:
-            raise ValueError(
-                "Currently full-batch methods only support a batch dimension of one"
-            )
 
         # Remove singleton batch dimension
-        features = K.squeeze(features, 0)
+        features, n_nodes = _squeeze_features(features)
         out_indices = K.squeeze(out_indices, 0)
 
         # Calculate the layer operation of GCN
         A = As[0]
-        h_graph = K.dot(A, features)
-        output = K.dot(h_graph, self.kernel)
+        if isinstance(features, tf.SparseTensor):
+            # apply the kernel first, so that both products are sparse-dense
+            output = K.dot(A, K.dot(features, self.kernel))
+        else:
+            h_graph = K.dot(A, features)
+            output = K.dot(h_graph, self.kernel)
 
         # Add optional bias & apply activation
         if self.bias is not None:
@@ -215,10 +221,8 @@ class GraphConvolution(Layer):
         if self.final_layer:
             output = K.gather(output, out_indices)
 
-        # Add batch dimension back if we removed it
-        # print("BATCH DIM:", batch_dim)
-        if batch_dim == 1:
-            output = K.expand_dims(output, 0)
+        # Add batch dimension back
+        output = K.expand_dims(output, 0)
 
         return output
 
@@ -298,6 +302,7 @@ class GCN:
 
         # Check if the generator is producing a sparse matrix
         self.use_sparse = generator.use_sparse
+        self.sparse_features = generator.sparse_features
         if self.method == "none":
             self.graph_norm_layer = GraphPreProcessingLayer(
                 num_of_nodes=self.generator.Aadj.shape[0]
@@ -356,6 +361,8 @@ class GCN:
         ]
         where N is the number of nodes, F the number of input features,
               E is the number of edges, O the number of output nodes.
+        If the generator's features are sparse, the node features are replaced by
+        their indices (1, nnz, 2) and values (1, nnz).
 
         Args:
             x (Tensor): input tensors
@@ -363,14 +370,24 @@ class GCN:
         Returns:
             Output tensor
         """
-        x_in, out_indices, *As = x
-
-        # Currently we require the batch dimension to be one for full-batch methods
-        batch_dim, n_nodes, _ = K.int_shape(x_in)
-        if batch_dim != 1:
-            raise ValueError(
-                "Currently full-batch methods only support a batch dimension of one"
+        layers = self._layers
+        if self.sparse_features:
+            x_indices, x_values, out_indices, *As = x
+            n_nodes, n_features = self.generator.features.shape
+            # the first dropout layer is applied to the values of the sparse features
+            x_in = _sparse_features(
+                [x_indices, x_values], (n_nodes, n_features), layers[0]
             )
+            layers = layers[1:]
+        else:
+            x_in, out_indices, *As = x
+
+            # Currently we require the batch dimension to be one for full-batch methods
+            batch_dim, n_nodes, _ = K.int_shape(x_in)
+            if batch_dim != 1:
+                raise ValueError(
+                    "Currently full-batch methods only support a batch dimension of one"
+                )
 
         # Convert input indices & values to a sparse matrix
         if self.use_sparse:
@@ -395,7 +412,7 @@ class GCN:
         if self.method == "none":
             # For GCN, if no preprocessing has been done, we apply the preprocessing layer to perform that.
             Ainput = [self.graph_norm_layer(Ainput[0])]
-        for layer in self._layers:
+        for layer in layers:
             if isinstance(layer, GraphConvolution):
                 # For a GCN layer add the matrix and output indices
                 # Note that the output indices are only used if `final_layer=True`
@@ -419,7 +436,7 @@ class GCN:
         N_feat = self.generator.features.shape[1]
 
         # Inputs for features & target indices
-        x_t = Input(batch_shape=(1, N_nodes, N_feat))
+        x_t = _feature_placeholders(N_nodes, N_feat, self.sparse_features)
         out_indices_t = Input(batch_shape=(1, None), dtype="int32")
 
         # Create inputs for sparse or dense matrices
@@ -436,7 +453,7 @@ class GCN:
 
         # TODO: Support multiple matrices
 
-        x_inp = [x_t, out_indices_t] + A_placeholders
+        x_inp = x_t + [out_indices_t] + A_placeholders
         x_out = self(x_inp)
 
         # Flatten output by removing singleton batch dimension
@@ -26,7 +26,12 @@ from tensorflow.keras import activations, constraints, initializers, regularizer
 from tensorflow.keras.layers import Input, Layer, Dropout, LeakyReLU, Lambda, Reshape
 
 from ..mapper import FullBatchNodeGenerator
-from .misc import SqueezedSparseConversion
+from .misc import (
+    SqueezedSparseConversion,
+    _feature_placeholders,
+    _sparse_features,
+    _squeeze_features,
+)
 
 
 class GraphAttention(Layer):
@@ -208,11 +213,12 @@ class GraphAttention(Layer):
         """
         feature_shape, out_shape, *As_shapes = input_shapes
 
-        batch_dim = feature_shape[0]
+        # sparse features have no batch dimension
+        batch_dim = 1 if len(feature_shape) == 2 else feature_shape[0]
         if self.final_layer:
             out_dim = out_shape[1]
         else:
-            out_dim = feature_shape[1]
+            out_dim = feature_shape[-2]
 
         return batch_dim, out_dim, self.output_dim
 
@@ -309,16 +315,9 @@ class GraphAttention(Layer):
         A = inputs[2]  # Adjacency matrix (N x N)
         N = K.int_shape(A)[-1]
 
-        batch_dim, n_nodes, _ = K.int_shape(X)
-        if batch_dim != 1:
-            raise ValueError(
-                "Currently full-batch methods only support a batch dimension of one"
-            )
-
-        else:
-            # Remove singleton batch dimension
-            X = K.squeeze(X, 0)
-            out_indices = K.squeeze(out_indices, 0)
+        # Remove singleton batch dimension
+        X, n_nodes = _squeeze_features(X)
+        out_indices = K.squeeze(out_indices, 0)
 
         outputs = []
         for head in range(self.attn_heads):
@@ -394,9 +393,8 @@ class GraphAttention(Layer):
         if self.final_layer:
             output = K.gather(output, out_indices)
 
-        # Add batch dimension back if we removed it
-        if batch_dim == 1:
-            output = K.expand_dims(output, 0)
+        # Add batch dimension back
+        output = K.expand_dims(output, 0)
 
         return output
 
@@ -487,15 +485,9 @@ class GraphAttentionSparse(GraphAttention):
         # Get undirected graph edges (E x 2)
         A_indices = A_sparse.indices
 
-        batch_dim, n_nodes, _ = K.int_shape(X)
-        if batch_dim != 1:
-            raise ValueError(
-                "Currently full-batch methods only support a batch dimension of one"
-            )
-        else:
-            # Remove singleton batch dimension
-            out_indices = K.squeeze(out_indices, 0)
-            X = K.squeeze(X, 0)
+        # Remove singleton batch dimension
+        X, n_nodes = _squeeze_features(X)
+        out_indices = K.squeeze(out_indices, 0)
 
         outputs = []
         for head in range(self.attn_heads):
@@ -563,9 +555,8 @@ class GraphAttentionSparse(GraphAttention):
         if self.final_layer:
             output = K.gather(output, out_indices)
 
-        # Add batch dimension back if we removed it
-        if batch_dim == 1:
-            output = K.expand_dims(output, 0)
+        # Add batch dimension back
+        output = K.expand_dims(output, 0)
         return output
 
 
@@ -765,9 +756,11 @@ class GAT:
 
             # Check if the generator is producing a sparse matrix
             self.use_sparse = generator.use_sparse
+            self.sparse_features = generator.sparse_features
 
         else:
             self.use_sparse = False
+            self.sparse_features = False
 
         # Set the normalization layer used in the model
         if normalize == "l2":
@@ -846,15 +839,25 @@ class GAT:
         assert isinstance(inputs, list), "input must be a list, got {} instead".format(
             type(inputs)
         )
-        x_in, out_indices, *As = inputs
+        layers = self._layers
+        if self.sparse_features:
+            x_indices, x_values, out_indices, *As = inputs
+            n_nodes, n_features = self.generator.features.shape
+            # the first dropout layer is applied to the values of the sparse features
+            x_in = _sparse_features(
+                [x_indices, x_values], (n_nodes, n_features), layers[0]
+            )
+            layers = layers[1:]
+        else:
+            x_in, out_indices, *As = inputs
 
-        # Currently we require the batch dimension to be one for full-batch methods
-        batch_dim, n_nodes, _ = K.int_shape(x_in)
+            # Currently we require the batch dimension to be one for full-batch methods
+            batch_dim, n_nodes, _ = K.int_shape(x_in)
 
-        if batch_dim != 1:
-            raise ValueError(
-                "Currently full-batch methods only support a batch dimension of one"
-            )
+            if batch_dim != 1:
+                raise ValueError(
+                    "Currently full-batch methods only support a batch dimension of one"
+                )
 
         # Convert input indices & values to a sparse matrix
         if self.use_sparse:
@@ -875,9 +878,8 @@ class GAT:
                 "The GAT method currently only accepts a single matrix"
             )
 
-        # Remove singleton batch dimension
         h_layer = x_in
-        for layer in self._layers:
+        for layer in layers:
             if isinstance(layer, self._gat_layer):
                 # For a GAT layer add the matrix and output indices
                 # Note that the output indices are only used if `final_layer=True`
@@ -915,7 +917,7 @@ class GAT:
             )
 
         # Inputs for features & target indices
-        x_t = Input(batch_shape=(1, N_nodes, N_feat))
+        x_t = _feature_placeholders(N_nodes, N_feat, self.sparse_features)
         out_indices_t = Input(batch_shape=(1, None), dtype="int32")
 
         # Create inputs for sparse or dense matrices
@@ -931,7 +933,7 @@ class GAT:
             A_placeholders = [A_m]
 
         # TODO: Support multiple matrices?
-        x_inp = [x_t, out_indices_t] + A_placeholders
+        x_inp = x_t + [out_indices_t] + A_placeholders
         x_out = self(x_inp)
 
         # Flatten output by removing singleton batch dimension
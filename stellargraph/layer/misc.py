@@ -14,7 +14,8 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from tensorflow.keras.layers import Layer
+import tensorflow as tf
+from tensorflow.keras.layers import Input, Layer
 from tensorflow.keras import backend as K
 
 
@@ -93,3 +94,49 @@ class SqueezedSparseConversion(Layer):
             indices=indices, values=values, dense_shape=self.matrix_shape
         )
         return output
+
+
+def _feature_placeholders(n_nodes, n_features, sparse):
+    """
+    Create the Keras inputs for the node features of a full-batch model, matching the inputs
+    supplied by the full-batch sequences: a dense tensor of size 1 x N x F, or, for sparse
+    features, the indices (1 x nnz x 2) and values (1 x nnz) of the non-zero elements.
+    """
+    if sparse:
+        return [
+            Input(batch_shape=(1, None, 2), dtype="int64"),
+            Input(batch_shape=(1, None)),
+        ]
+
+    return [Input(batch_shape=(1, n_nodes, n_features))]
+
+
+def _sparse_features(inputs, shape, dropout):
+    """
+    Convert the indices and values inputs of sparse node features to a 2D ``SparseTensor`` of
+    size N x F (without a batch dimension), applying the ``dropout`` layer to the values first.
+    Dropping out only the stored values is equivalent to dropping out the full matrix, because
+    all the others are zero.
+    """
+    indices, values = inputs
+    return SqueezedSparseConversion(shape=shape)([indices, dropout(values)])
+
+
+def _squeeze_features(features):
+    """
+    Remove the batch dimension from the node features given to a full-batch layer, which are
+    either a dense tensor of size 1 x N x F or a ``SparseTensor`` of size N x F created by
+    :func:`_sparse_features`.
+
+    Returns:
+        A tuple of the N x F features and the number of nodes N.
+    """
+    if isinstance(features, tf.SparseTensor):
+        return features, features.shape[0]
+
+    batch_dim, n_nodes, _ = K.int_shape(features)
+    if batch_dim != 1:
+        raise ValueError(
+            "Currently full-batch methods only support a batch dimension of one"
+        )
+    return K.squeeze(features, 0), n_nodes
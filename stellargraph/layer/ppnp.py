@@ -19,7 +19,7 @@ import tensorflow.keras.backend as K
 import tensorflow as tf
 import numpy as np
 
-from .misc import SqueezedSparseConversion
+from .misc import SqueezedSparseConversion, _feature_placeholders, _sparse_features
 from ..mapper import FullBatchNodeGenerator
 from .preprocessing_layer import GraphPreProcessingLayer
 
@@ -220,6 +220,7 @@ class PPNP:
 
         # Check if the generator is producing a sparse matrix
         self.use_sparse = generator.use_sparse
+        self.sparse_features = generator.sparse_features
 
         # Initialize a stack of fully connected layers
         n_layers = len(self.layer_sizes)
@@ -256,20 +257,34 @@ class PPNP:
 
         where N is the number of nodes, F the number of input features,
               E is the number of edges, O the number of output nodes.
+        If the generator's features are sparse, the node features are replaced by
+        their indices (1, nnz, 2) and values (1, nnz).
         Args:
             x (Tensor): input tensors
         Returns:
             Output tensor
         """
-
-        x_in, out_indices, *As = x
-
-        # Currently we require the batch dimension to be one for full-batch methods
-        batch_dim, n_nodes, _ = K.int_shape(x_in)
-        if batch_dim != 1:
-            raise ValueError(
-                "Currently full-batch methods only support a batch dimension of one"
+        layers = self._layers
+        if self.sparse_features:
+            x_indices, x_values, out_indices, *As = x
+            n_nodes, n_features = self.generator.features.shape
+            # the first dropout layer is applied to the values of the sparse features, and
+            # the first dense layer multiplies them by its kernel, giving dense N x F' outputs
+            x_in = _sparse_features(
+                [x_indices, x_values], (n_nodes, n_features), layers[0]
             )
+            h_layer = Lambda(lambda h: K.expand_dims(h, 0))(layers[1](x_in))
+            layers = layers[2:]
+        else:
+            x_in, out_indices, *As = x
+            h_layer = x_in
+
+            # Currently we require the batch dimension to be one for full-batch methods
+            batch_dim, n_nodes, _ = K.int_shape(x_in)
+            if batch_dim != 1:
+                raise ValueError(
+                    "Currently full-batch methods only support a batch dimension of one"
+                )
 
         # Convert input indices & values to a sparse matrix
         if self.use_sparse:
@@ -290,8 +305,7 @@ class PPNP:
                 "The APPNP method currently only accepts a single matrix"
             )
 
-        h_layer = x_in
-        for layer in self._layers:
+        for layer in layers:
             if isinstance(layer, PPNPPropagationLayer):
                 h_layer = layer([h_layer, out_indices] + Ainput)
             else:
@@ -311,7 +325,7 @@ class PPNP:
         N_feat = self.generator.features.shape[1]
 
         # Inputs for features & target indices
-        x_t = Input(batch_shape=(1, N_nodes, N_feat))
+        x_t = _feature_placeholders(N_nodes, N_feat, self.sparse_features)
         out_indices_t = Input(batch_shape=(1, None), dtype="int32")
 
         # Create inputs for sparse or dense matrices
@@ -328,7 +342,7 @@ class PPNP:
 
         # TODO: Support multiple matrices
 
-        x_inp = [x_t, out_indices_t] + A_placeholders
+        x_inp = x_t + [out_indices_t] + A_placeholders
         x_out = self(x_inp)
 
         # Flatten output by removing singleton batch dimension
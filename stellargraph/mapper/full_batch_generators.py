@@ -38,10 +38,19 @@ from . import (
 )
 from ..core.experimental import experimental
 from ..core.graph import StellarGraph
-from ..core.utils import is_real_iterable
+from ..core.utils import dense_features, is_real_iterable
 from ..core.utils import GCN_Aadj_feats_op, PPNP_Aadj_feats_op
 
 
+def _node_indices(graph, node_ids, use_index):
+    if use_index:
+        # check the indices are valid
+        graph.index_to_ids(node_ids)
+        return np.asarray(node_ids)
+
+    return graph.ids_to_index(node_ids)
+
+
 class FullBatchNodeGenerator:
     """
     A data generator for use with full-batch models on homogeneous graphs,
@@ -57,6 +66,12 @@ class FullBatchNodeGenerator:
     adjacency matrix (the default) or a dense adjacency matrix, with the `sparse`
     argument.
 
+    If the graph stores its node features as a sparse matrix (for instance, bag-of-words
+    features), they stay sparse: the sequences supply their indices and values, and the GCN,
+    GAT, APPNP and PPNP models convert them to a sparse tensor, so that the first layer uses a
+    sparse-dense matrix multiplication. The ``sparse_features`` attribute records whether this
+    is the case.
+
     For these algorithms the adjacency matrix requires pre-processing and the
     'method' option should be specified with the correct pre-processing for
     each algorithm. The options are as follows:
@@ -199,7 +214,9 @@ class FullBatchNodeGenerator:
                 "Accepted: 'gcn' (default), 'chebyshev','sgc', and 'self_loops'."
             )
 
-    def flow(self, node_ids, targets=None):
+        self.sparse_features = sps.issparse(self.features)
+
+    def flow(self, node_ids, targets=None, use_index=False):
         """
         Creates a generator/sequence object for training or evaluation
         with the supplied node ids and numeric targets.
@@ -208,6 +225,8 @@ class FullBatchNodeGenerator:
             node_ids: and iterable of node ids for the nodes of interest
                 (e.g., training, validation, or test set nodes)
             targets: a 2D array of numeric node targets with shape `(len(node_ids), target_size)`
+            use_index (bool): If True, node_ids are node indices (see
+                ``StellarGraph.ids_to_index``) rather than node IDs.
 
         Returns:
             A NodeSequence object to use with GCN or GAT models
@@ -224,11 +243,9 @@ class FullBatchNodeGenerator:
             if len(targets) != len(node_ids):
                 raise TypeError("Targets must be the same length as node_ids")
 
-        # Dictionary to store node indices for quicker node index lookups
-        node_lookup = dict(zip(self.node_list, range(len(self.node_list))))
-
-        # The list of indices of the target nodes in self.node_list
-        node_indices = np.array([node_lookup[n] for n in node_ids], dtype="int32")
+        # The list of indices of the target nodes in self.node_list, which is in the order of the
+        # graph's node indices
+        node_indices = _node_indices(self.graph, node_ids, use_index)
 
         if self.use_sparse:
             return SparseFullBatchNodeSequence(
@@ -298,33 +315,18 @@ class RelationalFullBatchNodeGenerator:
 
         self.features = G.node_features(self.node_list)
 
-        edge_types = sorted(set(e[-1] for e in G.edges(triple=True)))
-        self.node_index = dict(zip(self.node_list, range(len(self.node_list))))
+        edge_types = sorted({et.rel for et in G.create_graph_schema().edge_types})
 
         # create a list of adjacency matrices - one adj matrix for each edge type
         # an adjacency matrix is created for each edge type from all edges of that type
         self.As = []
 
         for edge_type in edge_types:
-
-            col_index = [
-                self.node_index[n1]
-                for n1, n2, etype in G.edges(triple=True)
-                if etype == edge_type
-            ]
-            row_index = [
-                self.node_index[n2]
-                for n1, n2, etype in G.edges(triple=True)
-                if etype == edge_type
-            ]
-            data = np.ones(len(col_index), np.float64)
-
             # note that A is the transpose of the standard adjacency matrix
             # this is to aggregate features from incoming nodes
-            A = sps.coo_matrix(
-                (data, (row_index, col_index)),
-                shape=(len(self.node_list), len(self.node_list)),
-            )
+            A = G.to_adjacency_matrix(
+                edge_types=[edge_type], weighted=False, format="csr", directed=True
+            ).T
 
             if transform is None:
                 # normalize here and replace zero row sums with 1
@@ -341,9 +343,9 @@ class RelationalFullBatchNodeGenerator:
             self.As.append(A)
 
         # Get the features for the nodes
-        self.features = G.node_features(self.node_list)
+        self.features = dense_features(G.node_features(self.node_list))
 
-    def flow(self, node_ids, targets=None):
+    def flow(self, node_ids, targets=None, use_index=False):
         """
         Creates a generator/sequence object for training or evaluation
         with the supplied node ids and numeric targets.
@@ -352,6 +354,8 @@ class RelationalFullBatchNodeGenerator:
             node_ids: and iterable of node ids for the nodes of interest
                 (e.g., training, validation, or test set nodes)
             targets: a 2D array of numeric node targets with shape `(len(node_ids), target_size)`
+            use_index (bool): If True, node_ids are node indices (see
+                ``StellarGraph.ids_to_index``) rather than node IDs.
 
         Returns:
             A NodeSequence object to use with RGCN models
@@ -368,9 +372,9 @@ class RelationalFullBatchNodeGenerator:
             if len(targets) != len(node_ids):
                 raise TypeError("Targets must be the same length as node_ids")
 
-        # The list of indices of the target nodes in self.node_list
-        # use dictionary for faster index look-up time
-        node_indices = np.array([self.node_index[n] for n in node_ids])
+        # The list of indices of the target nodes in self.node_list, which is in the order of the
+        # graph's node indices
+        node_indices = _node_indices(self.graph, node_ids, use_index)
 
         return RelationalFullBatchNodeSequence(
             self.features, self.As, self.use_sparse, targets, node_indices
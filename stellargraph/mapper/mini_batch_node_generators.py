@@ -28,7 +28,7 @@ from tensorflow.keras.utils import Sequence
 
 from scipy import sparse
 from ..core.graph import StellarGraph
-from ..core.utils import is_real_iterable
+from ..core.utils import dense_features, is_real_iterable
 
 
 class ClusterNodeGenerator:
@@ -329,7 +329,7 @@ class ClusterNodeSequence(Sequence):
             cluster_targets = self.targets[cluster_target_indices]
             cluster_targets = cluster_targets.reshape((1,) + cluster_targets.shape)
 
-        features = self.graph.node_features(g_node_list)
+        features = dense_features(self.graph.node_features(g_node_list))
 
         features = np.reshape(features, (1,) + features.shape)
         adj_cluster = adj_cluster.reshape((1,) + adj_cluster.shape)
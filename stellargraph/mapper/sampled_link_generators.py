@@ -39,7 +39,7 @@ from ..data import (
     UniformRandomWalk,
     UnsupervisedSampler,
 )
-from ..core.utils import is_real_iterable
+from ..core.utils import dense_features, is_real_iterable
 from . import LinkSequence, OnDemandLinkSequence
 
 
@@ -294,7 +294,7 @@ class GraphSAGELinkGenerator(BatchedLinkGenerator):
             # Get features for the sampled nodes
             batch_feats.append(
                 [
-                    self.graph.node_features(layer_nodes, node_type)
+                    dense_features(self.graph.node_features(layer_nodes, node_type))
                     for layer_nodes in nodes_per_hop
                 ]
             )
@@ -392,7 +392,7 @@ class HinSAGELinkGenerator(BatchedLinkGenerator):
         # Resize features to (batch_size, n_neighbours, feature_size)
         # for each node type (note that we can have different feature size for each node type)
         batch_feats = [
-            self.graph.node_features(layer_nodes, nt)
+            dense_features(self.graph.node_features(layer_nodes, nt))
             for nt, layer_nodes in node_samples
         ]
 
@@ -501,7 +501,7 @@ class Attri2VecLinkGenerator(BatchedLinkGenerator):
 
         target_ids = [head_link[0] for head_link in head_links]
         context_ids = [head_link[1] for head_link in head_links]
-        target_feats = self.graph.node_features(target_ids)
+        target_feats = dense_features(self.graph.node_features(target_ids))
         context_feats = self.graph._get_index_for_nodes(context_ids)
         batch_feats = [target_feats, np.array(context_feats)]
 
@@ -44,7 +44,7 @@ from ..data import (
     DirectedBreadthFirstNeighbours,
 )
 from ..core.graph import StellarGraph, GraphSchema
-from ..core.utils import is_real_iterable
+from ..core.utils import dense_features, is_real_iterable
 from . import NodeSequence
 
 
@@ -95,7 +95,7 @@ class BatchedNodeGenerator(abc.ABC):
     def sample_features(self, head_nodes):
         pass
 
-    def flow(self, node_ids, targets=None, shuffle=False):
+    def flow(self, node_ids, targets=None, shuffle=False, use_index=False):
         """
         Creates a generator/sequence object for training or evaluation
         with the supplied node ids and numeric targets.
@@ -119,6 +119,8 @@ class BatchedNodeGenerator(abc.ABC):
                 `(len(node_ids), target_size)`
             shuffle (bool): If True the node_ids will be shuffled at each
                 epoch, if False the node_ids will be processed in order.
+            use_index (bool): If True, node_ids are node indices (see
+                ``StellarGraph.ids_to_index``) rather than node IDs.
 
         Returns:
             A NodeSequence object to use with with StellarGraph models
@@ -126,6 +128,9 @@ class BatchedNodeGenerator(abc.ABC):
             and ``predict_generator``
 
         """
+        if use_index:
+            node_ids = self.graph.index_to_ids(node_ids)
+
         if self.head_node_types is not None:
             expected_node_type = self.head_node_types[0]
         else:
@@ -247,7 +252,7 @@ class GraphSAGENodeGenerator(BatchedNodeGenerator):
 
         # Get features for sampled nodes
         batch_feats = [
-            self.graph.node_features(layer_nodes, node_type)
+            dense_features(self.graph.node_features(layer_nodes, node_type))
             for layer_nodes in nodes_per_hop
         ]
 
@@ -343,7 +348,9 @@ class DirectedGraphSAGENodeGenerator(BatchedNodeGenerator):
 
         for slot in range(max_slots):
             nodes_in_slot = list(it.chain(*[sample[slot] for sample in node_samples]))
-            features_for_slot = self.graph.node_features(nodes_in_slot, node_type)
+            features_for_slot = dense_features(
+                self.graph.node_features(nodes_in_slot, node_type)
+            )
             resize = -1 if np.size(features_for_slot) > 0 else 0
             features[slot] = np.reshape(
                 features_for_slot, (len(head_nodes), resize, features_for_slot.shape[1])
@@ -453,7 +460,7 @@ class HinSAGENodeGenerator(BatchedNodeGenerator):
 
         # Get features
         batch_feats = [
-            self.graph.node_features(layer_nodes, nt)
+            dense_features(self.graph.node_features(layer_nodes, nt))
             for nt, layer_nodes in nodes_by_type
         ]
 
@@ -508,7 +515,7 @@ class Attri2VecNodeGenerator(BatchedNodeGenerator):
             head node.
         """
 
-        batch_feats = self.graph.node_features(head_nodes)
+        batch_feats = dense_features(self.graph.node_features(head_nodes))
         return batch_feats
 
     def flow(self, node_ids):
@@ -340,6 +340,24 @@ def _full_batch_array_and_reshape(array, propagate_none=False):
     return np.reshape(as_np, (1,) + as_np.shape)
 
 
+def _full_batch_features(features):
+    """
+    Args:
+        features: a dense array or SciPy sparse matrix of node features
+    Returns:
+        a list of the inputs for the features, each with a batch dimension of 1: the array
+        itself, or the indices and values of the non-zero elements of a sparse matrix
+    """
+    if not sps.issparse(features):
+        return [_full_batch_array_and_reshape(features)]
+
+    features = features.tocoo()
+    indices = np.expand_dims(
+        np.hstack((features.row[:, None], features.col[:, None])), 0
+    ).astype("int64")
+    return [indices, np.expand_dims(features.data, 0)]
+
+
 class FullBatchNodeSequence(Sequence):
     """
     Keras-compatible data generator for for node inference models
@@ -352,8 +370,9 @@ class FullBatchNodeSequence(Sequence):
     :class:`FullBatchNodeGenerator`.
 
     Args:
-        features (np.ndarray): An array of node features of size (N x F),
-            where N is the number of nodes in the graph, F is the node feature size
+        features (np.ndarray or sparse matrix): An array of node features of size (N x F),
+            where N is the number of nodes in the graph, F is the node feature size. A sparse
+            matrix is supplied as two inputs, its indices (1 x nnz x 2) and values (1 x nnz).
         A (np.ndarray or sparse matrix): An adjacency matrix of the graph of size (N x N).
         targets (np.ndarray, optional): An optional array of node targets of size (N x C),
             where C is the target size (e.g., number of classes for one-hot class targets)
@@ -370,10 +389,6 @@ class FullBatchNodeSequence(Sequence):
                 "When passed together targets and indices should be the same length."
             )
 
-        # Store features and targets as np.ndarray
-        self.features = np.asanyarray(features)
-        self.target_indices = np.asanyarray(indices)
-
         # Convert sparse matrix to dense:
         if sps.issparse(A) and hasattr(A, "toarray"):
             self.A_dense = _full_batch_array_and_reshape(A.toarray())
@@ -385,9 +400,9 @@ class FullBatchNodeSequence(Sequence):
             )
 
         # Reshape all inputs to have batch dimension of 1
-        self.features = _full_batch_array_and_reshape(features)
+        self.features = _full_batch_features(features)
         self.target_indices = _full_batch_array_and_reshape(indices)
-        self.inputs = [self.features, self.target_indices, self.A_dense]
+        self.inputs = self.features + [self.target_indices, self.A_dense]
 
         self.targets = _full_batch_array_and_reshape(targets, propagate_none=True)
 
@@ -414,8 +429,9 @@ class SparseFullBatchNodeSequence(Sequence):
     :class:`FullBatchNodeGenerator`.
 
     Args:
-        features (np.ndarray): An array of node features of size (N x F),
-            where N is the number of nodes in the graph, F is the node feature size
+        features (np.ndarray or sparse matrix): An array of node features of size (N x F),
+            where N is the number of nodes in the graph, F is the node feature size. A sparse
+            matrix is supplied as two inputs, its indices (1 x nnz x 2) and values (1 x nnz).
         A (sparse matrix): An adjacency matrix of the graph of size (N x N).
         targets (np.ndarray, optional): An optional array of node targets of size (N x C),
             where C is the target size (e.g., number of classes for one-hot class targets)
@@ -447,9 +463,8 @@ class SparseFullBatchNodeSequence(Sequence):
 
         # Reshape all inputs to have batch dimension of 1
         self.target_indices = _full_batch_array_and_reshape(indices)
-        self.features = _full_batch_array_and_reshape(features)
-        self.inputs = [
-            self.features,
+        self.features = _full_batch_features(features)
+        self.inputs = self.features + [
             self.target_indices,
             self.A_indices,
             self.A_values,
@@ -0,0 +1,285 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright 2020 Data61, CSIRO
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import numpy as np
+import pytest
+
+from stellargraph.core.element_data import (
+    ExternalIdIndex,
+    EdgeData,
+    NodeData,
+    gather_rows,
+    _csr_index,
+    _csr_merge,
+    _group_ranks,
+)
+
+
+def test_external_id_index_round_trip():
+    idx = ExternalIdIndex(["a", 1, "1", (2, 3)])
+    assert len(idx) == 4
+
+    ilocs = idx.to_iloc([(2, 3), "1", 1, "a"])
+    np.testing.assert_array_equal(ilocs, [3, 2, 1, 0])
+    assert list(idx.from_iloc(ilocs)) == [(2, 3), "1", 1, "a"]
+
+    assert idx.to_single_iloc("1") == 2
+    assert idx.to_single_iloc("missing") == -1
+    assert idx.contains_external(1)
+    assert not idx.contains_external(None)
+
+
+def test_external_id_index_missing():
+    idx = ExternalIdIndex([10, 20, 30])
+    np.testing.assert_array_equal(idx.to_iloc([30, 40, None]), [2, -1, -1])
+
+    with pytest.raises(KeyError, match=r"unknown IDs: \[40\]"):
+        idx.to_iloc([30, 40], strict=True)
+
+    assert idx.to_iloc([]).shape == (0,)
+
+
+def test_external_id_index_duplicates():
+    with pytest.raises(ValueError, match=r"found some that appeared more: \['a'\]"):
+        ExternalIdIndex(["a", "b", "a"])
+
+
+def test_edge_data_csr_index():
+    # 0 -> 1, 2 -> 0, 0 -> 2, 1 -> 1
+    edges = EdgeData(
+        sources=[0, 2, 0, 1],
+        targets=[1, 0, 2, 1],
+        type_codes=[0, 0, 1, 0],
+        types=["x", "y"],
+        weights=None,
+        number_of_nodes=4,
+    )
+
+    assert len(edges) == 4
+    np.testing.assert_array_equal(edges.out_offsets, [0, 2, 3, 4, 4])
+    np.testing.assert_array_equal(edges.out_edge_ilocs(0), [0, 2])
+    np.testing.assert_array_equal(edges.out_edge_ilocs(3), [])
+    np.testing.assert_array_equal(edges.in_edge_ilocs(1), [0, 3])
+    np.testing.assert_array_equal(edges.in_edge_ilocs(2), [2])
+
+    assert edges.type_code("y") == 1
+    assert edges.type_code("z") is None
+    np.testing.assert_array_equal(edges.weights_or_ones(), [1, 1, 1, 1])
+
+
+def test_edge_data_typed_index():
+    edges = EdgeData(
+        sources=[0, 0, 1, 0, 0],
+        targets=[1, 2, 0, 3, 1],
+        type_codes=[1, 0, 1, 1, 2],
+        types=["x", "y", "z"],
+        weights=None,
+        number_of_nodes=4,
+    )
+
+    assert edges.type_codes_of(["z", "x", "missing"]) == [0, 2]
+    np.testing.assert_array_equal(edges.out_edge_ilocs(0, [1]), [0, 3])
+    np.testing.assert_array_equal(edges.out_edge_ilocs(0, [0, 2]), [1, 4])
+    np.testing.assert_array_equal(edges.out_edge_ilocs(0, []), [])
+    np.testing.assert_array_equal(edges.in_edge_ilocs(1, [2]), [4])
+    np.testing.assert_array_equal(edges.in_edge_ilocs(3, [0]), [])
+    # several types are in the same order as without filtering
+    np.testing.assert_array_equal(
+        edges.out_edge_ilocs(0, [0, 1, 2]), edges.out_edge_ilocs(0)
+    )
+
+
+def test_edge_data_typed_index_size():
+    # many edge types, but few edges
+    rs = np.random.RandomState(0)
+    number_of_nodes, number_of_edges, number_of_types = 2000, 4000, 500
+    sources = rs.randint(number_of_nodes, size=number_of_edges)
+    targets = rs.randint(number_of_nodes, size=number_of_edges)
+    type_codes = rs.randint(number_of_types, size=number_of_edges)
+    edges = EdgeData(
+        sources,
+        targets,
+        type_codes,
+        types=list(range(number_of_types)),
+        weights=None,
+        number_of_nodes=number_of_nodes,
+    )
+
+    for node in range(0, number_of_nodes, 50):
+        for codes in [[7], [3, 250, 499]]:
+            expected = np.flatnonzero((sources == node) & np.isin(type_codes, codes))
+            np.testing.assert_array_equal(edges.out_edge_ilocs(node, codes), expected)
+            expected = np.flatnonzero((targets == node) & np.isin(type_codes, codes))
+            np.testing.assert_array_equal(edges.in_edge_ilocs(node, codes), expected)
+
+    # the index is bounded by the number of edges, not nodes * types
+    for index in edges._typed_indices.values():
+        assert sum(len(array) for array in index) == 2 * number_of_edges
+
+
+def test_gather_rows():
+    features = np.arange(6).reshape(3, 2)
+    np.testing.assert_array_equal(gather_rows(features, [2, 0]), [[4, 5], [0, 1]])
+    np.testing.assert_array_equal(gather_rows(features, [3, 1]), [[0, 0], [2, 3]])
+    assert gather_rows(features, []).shape == (0, 2)
+
+    # the original isn't modified when the None row is filled
+    np.testing.assert_array_equal(features, np.arange(6).reshape(3, 2))
+
+    empty = np.zeros((0, 4))
+    np.testing.assert_array_equal(gather_rows(empty, [0, 0]), np.zeros((2, 4)))
+
+
+def _assert_same_csr(actual, expected):
+    np.testing.assert_array_equal(actual.sources, expected.sources)
+    np.testing.assert_array_equal(actual.targets, expected.targets)
+    np.testing.assert_array_equal(actual.out_offsets, expected.out_offsets)
+    np.testing.assert_array_equal(actual.out_edges, expected.out_edges)
+    np.testing.assert_array_equal(actual.in_offsets, expected.in_offsets)
+    np.testing.assert_array_equal(actual.in_edges, expected.in_edges)
+
+
+def test_edge_data_append():
+    edges = EdgeData(
+        sources=[0, 2, 0],
+        targets=[1, 0, 2],
+        type_codes=[0, 0, 0],
+        types=["y"],
+        weights=[1.0, 2.0, 3.0],
+        number_of_nodes=3,
+    )
+    appended = edges.append(
+        sources=[3, 0, 2],
+        targets=[0, 3, 2],
+        type_values=["x", None, "y"],
+        weights=None,
+        number_of_nodes=4,
+        default_type="z",
+    )
+
+    # the new types are sorted in with the existing ones
+    assert appended.types == ["x", "y", "z"]
+    np.testing.assert_array_equal(appended.type_codes, [1, 1, 1, 0, 2, 1])
+    np.testing.assert_array_equal(
+        appended.weights, [1.0, 2.0, 3.0, np.nan, np.nan, np.nan]
+    )
+
+    expected = EdgeData(
+        sources=[0, 2, 0, 3, 0, 2],
+        targets=[1, 0, 2, 0, 3, 2],
+        type_codes=[1, 1, 1, 0, 2, 1],
+        types=["x", "y", "z"],
+        weights=None,
+        number_of_nodes=4,
+    )
+    _assert_same_csr(appended, expected)
+    np.testing.assert_array_equal(appended.out_edge_ilocs(0, [2]), [4])
+
+    # the original is unchanged
+    assert len(edges) == 3
+    assert edges.types == ["y"]
+
+
+def test_edge_data_remove():
+    edges = EdgeData(
+        sources=[0, 2, 0, 1, 0],
+        targets=[1, 0, 2, 1, 1],
+        type_codes=[0, 1, 0, 1, 1],
+        types=["x", "y"],
+        weights=[1.0, 2.0, 3.0, 4.0, 5.0],
+        number_of_nodes=3,
+    )
+    removed = edges.remove(np.array([True, False, True, True, False]))
+
+    np.testing.assert_array_equal(removed.type_codes, [0, 0, 1])
+    np.testing.assert_array_equal(removed.weights, [1.0, 3.0, 4.0])
+    expected = EdgeData(
+        sources=[0, 0, 1],
+        targets=[1, 2, 1],
+        type_codes=[0, 0, 1],
+        types=["x", "y"],
+        weights=None,
+        number_of_nodes=3,
+    )
+    _assert_same_csr(removed, expected)
+
+
+def test_edge_data_induced_edges():
+    edges = EdgeData(
+        sources=[0, 2, 0, 1, 0, 3],
+        targets=[1, 0, 2, 1, 3, 2],
+        type_codes=[0, 0, 0, 0, 0, 0],
+        types=["x"],
+        weights=None,
+        number_of_nodes=4,
+    )
+    edge_ilocs, sources, targets = edges.induced_edges([1, 0])
+    # the edges 0 -> 1 and 1 -> 1, with the nodes renumbered by position in the selection
+    assert sorted(zip(edge_ilocs, sources, targets)) == [(0, 1, 0), (3, 0, 0)]
+
+    edge_ilocs, sources, targets = edges.induced_edges([2, 3, 0])
+    assert sorted(zip(edge_ilocs, sources, targets)) == [
+        (1, 0, 2),
+        (2, 2, 0),
+        (4, 2, 1),
+        (5, 1, 0),
+    ]
+
+    assert len(edges.induced_edges([])[0]) == 0
+
+    with pytest.raises(ValueError, match="expected unique nodes"):
+        edges.induced_edges([0, 0])
+
+
+def test_csr_merge_matches_csr_index():
+    keys = np.random.RandomState(0).randint(5, size=30)
+    expected_offsets, expected_edges = _csr_index(keys, 6)
+
+    np.testing.assert_array_equal(_group_ranks([2, 0, 2, 2, 0]), [0, 0, 1, 2, 1])
+
+    # the ranks only depend on which elements share a key, so they can be computed on codes that
+    # are relabelled later
+    blocks = []
+    for chunk in np.split(keys, [7, 7, 20]):
+        codes, uniques = np.unique(chunk, return_inverse=True)[1], np.unique(chunk)
+        blocks.append((uniques[codes], _group_ranks(codes)))
+
+    offsets, edges = _csr_merge(blocks, 6)
+    np.testing.assert_array_equal(offsets, expected_offsets)
+    np.testing.assert_array_equal(edges, expected_edges)
+    assert edges.dtype == expected_edges.dtype
+
+
+def test_node_data_type_ranges():
+    ids = ExternalIdIndex(list("abcdef"))
+    features = {"x": np.zeros((2, 1)), "z": np.zeros((3, 1))}
+    nodes = NodeData(
+        ids, [0, 0, 2, 2, 2, 2], ["x", "y", "z"], features, [0, 1, -1, 0, 1, 2]
+    )
+
+    np.testing.assert_array_equal(nodes.type_ranges(), [0, 2, 2, 6])
+    assert nodes.feature_row_offset(0) == 0
+    # not every node of type z has features
+    assert nodes.feature_row_offset(2) is None
+    assert nodes.feature_row_offset(1) is None
+
+    np.testing.assert_array_equal(nodes.codes_of_ilocs([5, 2, 3]), [2])
+    np.testing.assert_array_equal(nodes.codes_of_ilocs([1, 2]), [0, 2])
+
+    interleaved = NodeData(ids, [0, 2, 0, 2, 2, 2], ["x", "y", "z"], {}, [-1] * 6)
+    assert interleaved.type_ranges() is None
+    assert interleaved.feature_row_offset(0) is None
+    np.testing.assert_array_equal(interleaved.codes_of_ilocs([0, 2]), [0])
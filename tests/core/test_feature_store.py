@@ -0,0 +1,85 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright 2020 Data61, CSIRO
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import networkx as nx
+import numpy as np
+import pandas as pd
+import pytest
+
+from stellargraph import StellarGraph, IndexedArray
+from stellargraph.core.feature_store import save_node_features, load_node_features
+from stellargraph.mapper import FullBatchNodeGenerator
+from ..test_utils.graphs import example_hin_1_nx
+
+
+def test_indexed_array():
+    values = np.arange(6).reshape(3, 2)
+    arr = IndexedArray(values)
+    assert arr.values is values
+    assert list(arr.index) == [0, 1, 2]
+    assert len(arr) == 3
+
+    with pytest.raises(ValueError, match="expected one ID for each of the 3 rows"):
+        IndexedArray(values, index=["a", "b"])
+
+    with pytest.raises(ValueError, match="expected a 2D array"):
+        IndexedArray(np.zeros(3))
+
+    with pytest.raises(TypeError, match="expected a NumPy array"):
+        IndexedArray([[1, 2]])
+
+
+@pytest.mark.parametrize("backend", ["networkx", "csr"])
+def test_save_load_node_features(tmpdir, backend):
+    graph = example_hin_1_nx(feature_name="feature", feature_sizes={"A": 4, "B": 2})
+    sg = StellarGraph(graph, node_features="feature", backend=backend)
+
+    save_node_features(sg, str(tmpdir), chunk_size=3)
+    loaded = load_node_features(str(tmpdir))
+
+    assert loaded.keys() == {"A", "B"}
+    assert isinstance(loaded["A"].values, np.memmap)
+    assert list(loaded["B"].index) == sg.nodes_of_type("B")
+
+    for node_type, arr in loaded.items():
+        np.testing.assert_array_equal(
+            arr.values, sg.node_features(list(arr.index), node_type)
+        )
+
+    # the loaded features can be used directly, without copying them into memory
+    new_sg = StellarGraph(graph, node_features=loaded, backend=backend)
+    np.testing.assert_array_equal(
+        new_sg.node_features([6, None, 4], "B"), sg.node_features([6, None, 4], "B")
+    )
+
+
+def test_memory_mapped_features_not_copied(tmpdir):
+    path = str(tmpdir.join("features.npy"))
+    np.save(path, np.arange(20, dtype=np.float32).reshape(10, 2))
+    features = np.load(path, mmap_mode="r")
+
+    ids = [f"n{i}" for i in range(10)]
+    edges = pd.DataFrame({"source": ids[:-1], "target": ids[1:]})
+    sg = StellarGraph(nodes=IndexedArray(features, index=ids), edges=edges)
+
+    # gathering some rows only reads those rows
+    np.testing.assert_array_equal(sg.node_features(["n3", None]), [[6, 7], [0, 0]])
+
+    # gathering every row is the memory-mapped array itself
+    assert sg.node_features(ids) is features
+
+    generator = FullBatchNodeGenerator(sg, method="gat")
+    assert generator.features is features
@@ -0,0 +1,795 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright 2020 Data61, CSIRO
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import networkx as nx
+import numpy as np
+import pandas as pd
+import pytest
+
+from stellargraph.core.graph import StellarGraph, StellarDiGraph
+from stellargraph.core.graph_csr import CSRStellarGraph
+from stellargraph.core.graph_networkx import NeighbourWithWeight
+from stellargraph.data.explorer import (
+    UniformRandomWalk,
+    SampledBreadthFirstWalk,
+    SampledHeterogeneousBreadthFirstWalk,
+)
+from stellargraph.mapper import GraphSAGENodeGenerator, FullBatchNodeGenerator
+from ..test_utils.alloc import snapshot, allocation_benchmark
+from ..test_utils.graphs import create_test_graph_nx, example_hin_1_nx
+from .test_stellargraph import example_benchmark_graph
+
+
+def both_backends(nx_graph, is_directed=False, **kwargs):
+    cls = StellarDiGraph if is_directed else StellarGraph
+    return (
+        cls(nx_graph, backend="networkx", **kwargs),
+        cls(nx_graph, backend="csr", **kwargs),
+    )
+
+
+def sorted_str(values):
+    # the test graphs mix str and int IDs, which can't be compared directly
+    return sorted(values, key=str)
+
+
+def weighted_multigraph(is_directed):
+    graph = nx.MultiDiGraph() if is_directed else nx.MultiGraph()
+    graph.add_nodes_from([0, 1], label="A")
+    graph.add_nodes_from([2, 3], label="B")
+    graph.add_weighted_edges_from([(0, 1, 0.0), (0, 1, 1.0)], label="AA")
+    graph.add_weighted_edges_from([(1, 2, 10.0), (1, 3, 10.0)], label="AB")
+    graph.add_weighted_edges_from([(3, 3, 5.0)], label="BB")
+    return graph
+
+
+def test_backend_argument():
+    assert isinstance(StellarGraph(backend="csr")._graph, CSRStellarGraph)
+    assert isinstance(StellarDiGraph(backend="csr")._graph, CSRStellarGraph)
+
+    with pytest.raises(ValueError, match="backend: expected 'networkx' or 'csr'"):
+        StellarGraph(backend="foo")
+
+
+@pytest.mark.parametrize("is_directed", [False, True])
+def test_structure_matches_networkx(is_directed):
+    nx_sg, csr_sg = both_backends(create_test_graph_nx(is_directed), is_directed)
+
+    assert csr_sg.is_directed() == is_directed
+    assert csr_sg.number_of_nodes() == nx_sg.number_of_nodes()
+    assert csr_sg.number_of_edges() == nx_sg.number_of_edges()
+    assert list(csr_sg.nodes()) == list(nx_sg.nodes())
+    assert sorted_str(csr_sg.edges()) == sorted_str(nx_sg.edges())
+    assert sorted_str(csr_sg.edges(triple=True)) == sorted_str(nx_sg.edges(triple=True))
+
+    assert csr_sg.has_node("loner")
+    assert not csr_sg.has_node("not a node")
+
+    for node in nx_sg.nodes():
+        assert sorted_str(csr_sg.neighbors(node)) == sorted_str(nx_sg.neighbors(node))
+        assert sorted_str(csr_sg.in_nodes(node)) == sorted_str(nx_sg.in_nodes(node))
+        assert sorted_str(csr_sg.out_nodes(node)) == sorted_str(nx_sg.out_nodes(node))
+
+    assert csr_sg.node_degrees() == dict(nx_sg.node_degrees())
+
+
+@pytest.mark.parametrize("is_directed", [False, True])
+def test_weights_and_types_match_networkx(is_directed):
+    graph = weighted_multigraph(is_directed)
+    graph.add_edge(2, 0, label="BA")  # no weight
+    nx_sg, csr_sg = both_backends(graph, is_directed)
+
+    # a missing weight is None (not NaN), like with NetworkX
+    assert csr_sg._edge_weights(2, 0) == nx_sg._edge_weights(2, 0) == [None]
+    assert csr_sg.out_nodes(2, include_edge_weight=True, edge_types=["BA"]) == [
+        NeighbourWithWeight(0, None)
+    ]
+
+    def by_repr(values):
+        return sorted(values, key=repr)
+
+    for node in nx_sg.nodes():
+        for edge_types in [None, ["AA"], ["AB", "BB"], ["BA"], ["missing"]]:
+            kwargs = dict(include_edge_weight=True, edge_types=edge_types)
+            assert by_repr(csr_sg.neighbors(node, **kwargs)) == by_repr(
+                nx_sg.neighbors(node, **kwargs)
+            )
+            assert by_repr(csr_sg.in_nodes(node, **kwargs)) == by_repr(
+                nx_sg.in_nodes(node, **kwargs)
+            )
+            assert by_repr(csr_sg.out_nodes(node, **kwargs)) == by_repr(
+                nx_sg.out_nodes(node, **kwargs)
+            )
+
+        for other in nx_sg.out_nodes(node):
+            assert by_repr(csr_sg._edge_weights(node, other)) == by_repr(
+                nx_sg._edge_weights(node, other)
+            )
+
+    nx_adj = nx_sg.to_adjacency_matrix()
+    csr_adj = csr_sg.to_adjacency_matrix()
+    np.testing.assert_array_equal(csr_adj.toarray(), nx_adj.toarray())
+
+    # a subgraph is ordered by the nodes as given
+    sub = csr_sg.to_adjacency_matrix([3, 1, 2])
+    expected = np.array([[5, 0, 0], [10, 0, 10], [0, 0, 0]])
+    if not is_directed:
+        expected = np.maximum(expected, expected.T)
+    np.testing.assert_array_equal(sub.toarray(), expected)
+
+
+@pytest.mark.parametrize("is_directed", [False, True])
+def test_node_degrees(is_directed):
+    graph = weighted_multigraph(is_directed)
+    graph.add_edge(2, 0, label="BA")  # no weight
+    for sg in both_backends(graph, is_directed):
+        degrees = sg.node_degrees(as_array=True)
+        np.testing.assert_array_equal(degrees, [3, 4, 2, 3])
+        assert sg.node_degrees(as_array=True) is degrees
+        assert not degrees.flags.writeable
+
+        # the default is a map, like before
+        assert dict(sg.node_degrees()) == {0: 3, 1: 4, 2: 2, 3: 3}
+        assert sg.node_degrees(weighted=True) == {0: 2.0, 1: 21.0, 2: 11.0, 3: 20.0}
+
+        in_degrees = sg.node_degrees(as_array=True, direction="in")
+        out_degrees = sg.node_degrees(as_array=True, direction="out")
+        if is_directed:
+            np.testing.assert_array_equal(in_degrees, [1, 2, 1, 2])
+            np.testing.assert_array_equal(out_degrees, [2, 2, 1, 1])
+        else:
+            np.testing.assert_array_equal(in_degrees, degrees)
+            np.testing.assert_array_equal(out_degrees, degrees)
+
+        np.testing.assert_array_equal(
+            sg.node_degrees(as_array=True, edge_types=["AB", "BB"]), [0, 2, 1, 3]
+        )
+        np.testing.assert_array_equal(
+            sg.node_degrees(as_array=True, edge_types=["AA"], weighted=True),
+            [1.0, 1.0, 0.0, 0.0],
+        )
+
+        with pytest.raises(ValueError, match="direction: expected 'in', 'out'"):
+            sg.node_degrees(direction="sideways")
+
+
+@pytest.mark.parametrize("is_directed", [False, True])
+def test_to_adjacency_matrix(is_directed):
+    graph = weighted_multigraph(is_directed)
+    graph.add_edge(2, 0, label="BA")  # no weight
+
+    def symmetric(expected):
+        expected = np.array(expected)
+        if is_directed:
+            return expected
+        return expected + np.triu(expected, 1).T + np.tril(expected, -1).T
+
+    for sg in both_backends(graph, is_directed):
+        adj = sg.to_adjacency_matrix()
+        assert adj.format == "csr"
+        np.testing.assert_array_equal(
+            adj.toarray(),
+            symmetric([[0, 1, 0, 0], [0, 0, 10, 10], [1, 0, 0, 0], [0, 0, 0, 5]]),
+        )
+
+        unweighted = sg.to_adjacency_matrix(weighted=False, format="coo")
+        assert unweighted.format == "coo"
+        np.testing.assert_array_equal(
+            unweighted.toarray(),
+            symmetric([[0, 2, 0, 0], [0, 0, 1, 1], [1, 0, 0, 0], [0, 0, 0, 1]]),
+        )
+
+        typed = sg.to_adjacency_matrix(edge_types=["AB", "BB"], directed=True)
+        np.testing.assert_array_equal(
+            typed.toarray(), [[0, 0, 0, 0], [0, 0, 10, 10], [0, 0, 0, 0], [0, 0, 0, 5]]
+        )
+
+        sub = sg.to_adjacency_matrix([3, 1], edge_types=["AB"])
+        np.testing.assert_array_equal(sub.toarray(), symmetric([[0, 0], [10, 0]]))
+
+        assert sg.to_adjacency_matrix([]).shape == (0, 0)
+
+        with pytest.raises(ValueError, match="expected unique nodes"):
+            sg.to_adjacency_matrix([1, 2, 1])
+
+
+@pytest.mark.parametrize("is_directed", [False, True])
+def test_neighbour_arrays_match_neighbors(is_directed):
+    for sg in both_backends(weighted_multigraph(is_directed), is_directed):
+        offsets, neighbours = sg._neighbour_arrays()
+        assert len(offsets) == sg.number_of_nodes() + 1
+        for index in range(sg.number_of_nodes()):
+            assert sorted(neighbours[offsets[index] : offsets[index + 1]]) == sorted(
+                sg.neighbors(index, use_index=True)
+            )
+
+
+def test_unweighted_neighbours():
+    graph = nx.MultiGraph()
+    graph.add_edges_from([(0, 1), (0, 1), (1, 2)])
+    sg = StellarGraph(graph, backend="csr")
+
+    assert sorted(sg.neighbors(1, include_edge_weight=True)) == [
+        (0, None),
+        (0, None),
+        (2, None),
+    ]
+    assert sg._edge_weights(0, 1) == [None, None]
+
+
+@pytest.mark.parametrize("is_directed", [False, True])
+def test_schema_matches_networkx(is_directed):
+    nx_sg, csr_sg = both_backends(weighted_multigraph(is_directed), is_directed)
+
+    for nodes in [None, [0, 3], [1, 2]]:
+        nx_schema = nx_sg.create_graph_schema(nodes=nodes)
+        csr_schema = csr_sg.create_graph_schema(nodes=nodes)
+
+        assert csr_schema.is_directed() == nx_schema.is_directed()
+        assert csr_schema.node_types == nx_schema.node_types
+        assert csr_schema.edge_types == nx_schema.edge_types
+        assert csr_schema.schema == nx_schema.schema
+
+    schema = nx_sg.create_graph_schema()
+    nx_adj = nx_sg._adjacency_types(schema)
+    csr_adj = csr_sg._adjacency_types(schema)
+    assert csr_adj.keys() == nx_adj.keys()
+    for et in schema.edge_types:
+        for node in list(nx_sg.nodes()) + ["missing"]:
+            assert csr_adj[et][node] == nx_adj[et][node]
+
+
+def test_types_and_features_match_networkx():
+    graph = example_hin_1_nx(feature_name="feature", feature_sizes={"A": 4, "B": 2})
+    nx_sg, csr_sg = both_backends(graph, node_features="feature")
+
+    assert csr_sg.node_types == nx_sg.node_types == {"A", "B"}
+    assert csr_sg.node_type(4) == "B"
+    assert csr_sg.nodes_of_type("A") == nx_sg.nodes_of_type("A")
+    assert csr_sg.node_feature_sizes() == nx_sg.node_feature_sizes()
+
+    for nodes, node_type in [
+        ([0, 1, 2, 3], "A"),
+        ([4, None, 6], "B"),
+        ([None, 5], None),
+        (5, None),
+        ([], "A"),
+    ]:
+        np.testing.assert_array_equal(
+            csr_sg.node_features(nodes, node_type),
+            nx_sg.node_features(nodes, node_type),
+        )
+        if nodes:
+            assert csr_sg._get_index_for_nodes(
+                nodes, node_type
+            ) == nx_sg._get_index_for_nodes(nodes, node_type)
+
+    with pytest.raises(ValueError, match="All nodes must be of the same type"):
+        csr_sg.node_features([1, 5])
+
+    with pytest.raises(
+        ValueError, match=r"Could not find features for nodes with IDs \[4\]"
+    ):
+        csr_sg.node_features([4, 0], "A")
+
+    with pytest.raises(ValueError, match="At least one node must be given"):
+        csr_sg.node_features([None, None])
+
+    with pytest.raises(ValueError, match="Features not found for node type 'C'"):
+        csr_sg.node_features([0], "C")
+
+
+def test_nodes_grouped_by_type():
+    graph = nx.Graph()
+    # the types are interleaved in the NetworkX order
+    for node in range(6):
+        graph.add_node(node, label="AB"[node % 2], feature=[node, -node])
+    graph.add_edges_from([(0, 1), (2, 3), (4, 5)])
+    nx_sg, csr_sg = both_backends(graph, node_features="feature")
+
+    nodes = csr_sg._graph._nodes
+    assert list(csr_sg.nodes()) == [0, 2, 4, 1, 3, 5]
+    np.testing.assert_array_equal(nodes.type_ranges(), [0, 3, 6])
+    assert nodes.feature_row_offset(0) == 0
+    assert nodes.feature_row_offset(1) == 3
+
+    def assert_matches_networkx():
+        for node_type in ["A", "B"]:
+            assert csr_sg.nodes_of_type(node_type) == nx_sg.nodes_of_type(node_type)
+        for query in [[4, None, 0], [5, 1], [None, 3]]:
+            np.testing.assert_array_equal(
+                csr_sg.node_features(query), nx_sg.node_features(query)
+            )
+
+        with pytest.raises(ValueError, match="All nodes must be of the same type"):
+            csr_sg.node_features([0, 1])
+        with pytest.raises(ValueError, match=r"Could not find features .* \[1\]"):
+            csr_sg.node_features([1], "A")
+
+    assert_matches_networkx()
+
+    # the networkx backend's internal CSR copy keeps its node order, so the indices agree
+    assert list(nx_sg.subgraph([1, 2], use_index=True).nodes()) == [1, 2]
+
+    # adding a node of the first type means the nodes are no longer grouped, and so the type
+    # codes are used instead
+    new_nodes = pd.DataFrame([[6, -6]], index=[6])
+    csr_sg.add_nodes({"A": new_nodes})
+    nx_sg.add_nodes({"A": new_nodes})
+    assert csr_sg._graph._nodes.type_ranges() is None
+    assert_matches_networkx()
+
+
+@pytest.mark.parametrize("is_directed", [False, True])
+def test_node_index_round_trip(is_directed):
+    graph = example_hin_1_nx(feature_name="feature", feature_sizes={"A": 4, "B": 2})
+    for sg in both_backends(graph, is_directed, node_features="feature"):
+        ids = list(sg.nodes())
+        indices = sg.nodes(use_index=True)
+        np.testing.assert_array_equal(indices, np.arange(len(ids)))
+
+        np.testing.assert_array_equal(sg.ids_to_index(ids), indices)
+        assert list(sg.index_to_ids(indices)) == ids
+        np.testing.assert_array_equal(sg.ids_to_index(ids[::-1]), indices[::-1])
+
+        for node, index in zip(ids, indices):
+            for method in [sg.neighbors, sg.in_nodes, sg.out_nodes]:
+                expected = method(node, include_edge_weight=True)
+                actual = method(index, include_edge_weight=True, use_index=True)
+                assert [n.weight for n in actual] == [n.weight for n in expected]
+                assert list(sg.index_to_ids([n.node for n in actual])) == [
+                    n.node for n in expected
+                ]
+
+            assert sg.neighbors(index, edge_types=["R"], use_index=True) == list(
+                sg.ids_to_index(sg.neighbors(node, edge_types=["R"]))
+            )
+
+        np.testing.assert_array_equal(
+            sg.node_features(sg.ids_to_index([4, 6]).tolist() + [None], use_index=True),
+            sg.node_features([4, 6, None]),
+        )
+        np.testing.assert_array_equal(
+            sg.node_features(sg.ids_to_index([0, 3]), "A", use_index=True),
+            sg.node_features([0, 3], "A"),
+        )
+
+        with pytest.raises(KeyError, match=r"unknown IDs: \['x'\]"):
+            sg.ids_to_index([0, "x"])
+
+        with pytest.raises(IndexError, match=r"found: \[7\]"):
+            sg.index_to_ids([0, 7])
+
+        with pytest.raises(IndexError, match=r"found: \[-1\]"):
+            sg.neighbors(-1, use_index=True)
+
+        with pytest.raises(IndexError, match=r"found: \[7\]"):
+            sg.node_features([7], "A", use_index=True)
+
+        with pytest.raises(ValueError, match="Could not find features for nodes"):
+            sg.node_features(sg.ids_to_index([4]), "A", use_index=True)
+
+
+def test_features_from_dataframes():
+    graph = example_hin_1_nx()
+    features = {
+        "A": pd.DataFrame(np.arange(8).reshape(4, 2), index=[3, 2, 1, 0]),
+        "B": pd.DataFrame(np.ones((2, 3)), index=[5, 4]),
+    }
+    sg = StellarGraph(graph, node_features=features, backend="csr")
+
+    np.testing.assert_array_equal(
+        sg.node_features([0, 3, None], "A"), [[6, 7], [0, 1], [0, 0]]
+    )
+    assert sg.node_feature_sizes() == {"A": 2, "B": 3}
+
+    # node 6 has no features
+    with pytest.raises(ValueError, match=r"IDs \[6\]"):
+        sg.node_features([4, 6])
+
+
+@pytest.mark.parametrize("in_nodes", [False, True])
+def test_to_networkx_round_trip(in_nodes):
+    g, node_features = example_benchmark_graph(
+        feature_size=5, features_in_nodes=in_nodes
+    )
+    nx_sg, csr_sg = both_backends(g, node_features=node_features)
+
+    new_nx = csr_sg.to_networkx()
+    expected = nx_sg.to_networkx()
+
+    assert sorted(new_nx.nodes()) == sorted(expected.nodes())
+    for node, data in expected.nodes(data=True):
+        new_data = new_nx.nodes[node]
+        assert new_data["label"] == data["label"]
+        np.testing.assert_array_equal(new_data["feature"], data["feature"])
+
+    assert sorted(new_nx.edges(data="label")) == sorted(expected.edges(data="label"))
+
+
+def test_info():
+    graph = example_hin_1_nx(feature_name="feature")
+    sg = StellarGraph(graph, node_features="feature", backend="csr")
+    info = sg.info()
+
+    assert "Nodes: 7, Edges: 6" in info
+    assert "A: [4]" in info
+    assert "A-R->B: [5]" in info
+    assert "length 10" in info
+
+
+def test_algorithms_run_unchanged():
+    graph = example_hin_1_nx(feature_name="feature", feature_sizes={"A": 4, "B": 4})
+    sg = StellarGraph(graph, node_features="feature", backend="csr")
+
+    walks = UniformRandomWalk(sg).run(nodes=[0, 4], n=2, length=5, seed=1)
+    assert len(walks) == 4
+    for walk in walks:
+        for src, dst in zip(walk, walk[1:]):
+            assert dst in sg.neighbors(src)
+
+    walks = SampledHeterogeneousBreadthFirstWalk(sg).run(
+        nodes=[0], n=1, n_size=[2, 2], seed=1
+    )
+    assert len(walks) == 1
+
+    homogeneous = StellarGraph(
+        nx.karate_club_graph(), node_features=pd.DataFrame(np.eye(34)), backend="csr"
+    )
+
+    gen = GraphSAGENodeGenerator(homogeneous, batch_size=2, num_samples=[2])
+    batch = gen.flow([4, 5])[0]
+    assert batch[0][0].shape == (2, 1, 34)
+    assert batch[0][1].shape == (2, 2, 34)
+
+    full_batch = FullBatchNodeGenerator(homogeneous)
+    assert full_batch.features.shape == (34, 34)
+    assert full_batch.Aadj.shape == (34, 34)
+
+
+def test_algorithms_use_index():
+    graph = example_hin_1_nx(feature_name="feature", feature_sizes={"A": 4, "B": 4})
+    for sg in both_backends(graph, node_features="feature"):
+        roots = [0, 4]
+        walker = UniformRandomWalk(sg)
+        id_walks = walker.run(nodes=roots, n=2, length=5, seed=1)
+        index_walks = walker.run(
+            nodes=sg.ids_to_index(roots), n=2, length=5, seed=1, use_index=True
+        )
+        assert [list(sg.index_to_ids(w)) for w in index_walks] == id_walks
+
+        walker = SampledBreadthFirstWalk(sg)
+        id_walks = walker.run(nodes=roots, n=1, n_size=[2, 3], seed=1)
+        index_walks = walker.run(
+            nodes=sg.ids_to_index(roots), n=1, n_size=[2, 3], seed=1, use_index=True
+        )
+        assert len(index_walks) == len(id_walks)
+        for index_walk, id_walk in zip(index_walks, id_walks):
+            assert [
+                None if i is None else sg.index_to_ids([i])[0] for i in index_walk
+            ] == id_walk
+
+    homogeneous = StellarGraph(
+        nx.karate_club_graph(), node_features=pd.DataFrame(np.eye(34)), backend="csr"
+    )
+    indices = homogeneous.ids_to_index([4, 5])
+
+    gen = GraphSAGENodeGenerator(homogeneous, batch_size=2, num_samples=[2], seed=1)
+    expected = gen.flow([4, 5])[0]
+    gen = GraphSAGENodeGenerator(homogeneous, batch_size=2, num_samples=[2], seed=1)
+    actual = gen.flow(indices, use_index=True)[0]
+    for a, e in zip(actual[0], expected[0]):
+        np.testing.assert_array_equal(a, e)
+
+    full_batch = FullBatchNodeGenerator(homogeneous, method="none")
+    expected = full_batch.flow([4, 5])[0]
+    actual = full_batch.flow(indices, use_index=True)[0]
+    for a, e in zip(actual[0], expected[0]):
+        np.testing.assert_array_equal(a, e)
+
+    with pytest.raises(IndexError):
+        full_batch.flow([34], use_index=True)
+
+
+def example_edge_features():
+    return {
+        "R": pd.DataFrame(
+            {"source": [0, 1, 2], "target": [1, 2, 0], "f": [1, 2, 3], "g": [4, 5, 6]}
+        ),
+        "S": pd.DataFrame({"source": [0], "target": [2], "weight": [0.5], "h": [7]}),
+        "T": pd.DataFrame({"source": [1], "target": [1]}),
+    }
+
+
+def test_edge_features(tmpdir):
+    sg = StellarGraph(edges=example_edge_features())
+
+    assert sg.edge_feature_sizes() == {"R": 2, "S": 1}
+    assert sg.edge_feature_sizes(["S", "T"]) == {"S": 1}
+    # the weight isn't a feature
+    np.testing.assert_array_equal(sg.edge_features([3]), [[7]])
+    features = sg.edge_features([2, 0, 0], "R")
+    assert features.dtype == np.float32
+    np.testing.assert_array_equal(features, [[3, 6], [1, 4], [1, 4]])
+
+    with pytest.raises(ValueError, match="edge_type: expected a type"):
+        sg.edge_features([0, 3])
+    with pytest.raises(ValueError, match="Features not found for edge type 'T'"):
+        sg.edge_features([4])
+    with pytest.raises(ValueError, match=r"for edges with indices \[3\]"):
+        sg.edge_features([0, 3], "R")
+    with pytest.raises(IndexError, match="expected edge indices"):
+        sg.edge_features([5])
+
+    # the features follow the edges through updates
+    sg.add_edges(
+        pd.DataFrame({"source": [2], "target": [2], "label": ["R"], "f": [8], "g": [9]})
+    )
+    sg.add_edges(pd.DataFrame({"source": [1], "target": [0], "label": ["R"]}))
+    np.testing.assert_array_equal(sg.edge_features([5, 1], "R"), [[8, 9], [2, 5]])
+    with pytest.raises(ValueError, match="Could not find features"):
+        sg.edge_features([6], "R")
+
+    sg.remove_edges([(0, 1)])
+    assert sg.edges(triple=True)[0] == (1, 2, "R")
+    np.testing.assert_array_equal(sg.edge_features([0, 4], "R"), [[2, 5], [8, 9]])
+
+    sub = sg.subgraph([2, 0])
+    assert sorted(sub.edges(triple=True)) == [(0, 2, "S"), (2, 0, "R"), (2, 2, "R")]
+    all_edges = sg.edges(triple=True)
+    for i, edge in enumerate(sub.edges(triple=True)):
+        np.testing.assert_array_equal(
+            sub.edge_features([i]), sg.edge_features([all_edges.index(edge)])
+        )
+
+    path = str(tmpdir)
+    sg.save(path)
+    loaded = StellarGraph.load(path)
+    assert loaded.edge_feature_sizes() == sg.edge_feature_sizes()
+    np.testing.assert_array_equal(
+        loaded.edge_features([0, 1, 4], "R"), sg.edge_features([0, 1, 4], "R")
+    )
+
+    with pytest.raises(ValueError, match="same size for every element of type 'R'"):
+        StellarGraph(
+            edges={
+                "R": pd.DataFrame({"source": [0], "target": [1], "f": [1]}),
+                "S": pd.DataFrame(
+                    {"source": [0], "target": [1], "label": ["R"], "f": [1], "g": [2]}
+                ),
+            }
+        )
+
+    nx_sg = StellarGraph(sg.to_networkx(), backend="networkx")
+    assert nx_sg.edge_feature_sizes() == {}
+    with pytest.raises(ValueError, match="only supported by the 'csr' backend"):
+        nx_sg.edge_features([0])
+
+
+@pytest.mark.benchmark(group="StellarGraph creation", timer=snapshot)
+@pytest.mark.parametrize("num_nodes,num_edges", [(0, 0), (100, 200), (1000, 5000)])
+@pytest.mark.parametrize("feature_size", [None, 100])
+def test_allocation_benchmark_creation_csr_from_networkx(
+    allocation_benchmark, feature_size, num_nodes, num_edges
+):
+    g, node_features = example_benchmark_graph(
+        feature_size, num_nodes, num_edges, features_in_nodes=True
+    )
+
+    def f():
+        return StellarGraph(g, node_features=node_features, backend="csr")
+
+    allocation_benchmark(f)
+
+
+def example_pandas_graph(is_directed=False):
+    nodes = {
+        "A": pd.DataFrame({"x": [1.0, 2.0], "y": [3.0, 4.0]}, index=[0, 1]),
+        "B": pd.DataFrame(index=[2, 3]),
+    }
+    edges = pd.DataFrame(
+        {
+            "source": [0, 0, 1, 1, 3],
+            "target": [1, 1, 2, 3, 3],
+            "label": ["AA", "AA", "AB", "AB", "BB"],
+            "weight": [0.0, 1.0, 10.0, 10.0, 5.0],
+        }
+    )
+    cls = StellarDiGraph if is_directed else StellarGraph
+    return cls(nodes=nodes, edges=edges)
+
+
+@pytest.mark.parametrize("is_directed", [False, True])
+def test_from_pandas_matches_networkx(is_directed):
+    sg = example_pandas_graph(is_directed)
+    nx_sg = StellarGraph(
+        weighted_multigraph(is_directed), is_directed=is_directed, backend="networkx"
+    )
+
+    assert isinstance(sg._graph, CSRStellarGraph)
+    assert sg.is_directed() == is_directed
+    assert list(sg.nodes()) == [0, 1, 2, 3]
+    assert sorted(sg.edges(triple=True)) == sorted(nx_sg.edges(triple=True))
+
+    for node in nx_sg.nodes():
+        assert sg.node_type(node) == nx_sg.node_type(node)
+        assert sorted(sg.neighbors(node, include_edge_weight=True)) == sorted(
+            nx_sg.neighbors(node, include_edge_weight=True)
+        )
+
+    assert sg.create_graph_schema().schema == nx_sg.create_graph_schema().schema
+    np.testing.assert_array_equal(
+        sg.to_adjacency_matrix().toarray(), nx_sg.to_adjacency_matrix().toarray()
+    )
+
+    # only type A has feature columns
+    assert sg.node_feature_sizes(["A"]) == {"A": 2}
+    np.testing.assert_array_equal(
+        sg.node_features([1, None, 0], "A"), [[2, 4], [0, 0], [1, 3]]
+    )
+
+
+def test_from_pandas_edge_dict_and_defaults():
+    edges = {
+        "R": pd.DataFrame({"src": ["a", "b"], "dst": ["b", "c"]}),
+        "S": pd.DataFrame({"src": ["c"], "dst": ["a"], "w": [2.5]}),
+    }
+    sg = StellarGraph(
+        edges=edges, source_column="src", target_column="dst", edge_weight_label="w"
+    )
+
+    # nodes are inferred from the edges, in order of appearance
+    assert list(sg.nodes()) == ["a", "b", "c"]
+    assert sg.node_types == {"default"}
+    assert sorted(sg.edges(triple=True)) == [
+        ("a", "b", "R"),
+        ("b", "c", "R"),
+        ("c", "a", "S"),
+    ]
+
+    weights = sg.out_nodes("a", include_edge_weight=True)
+    assert len(weights) == 2
+    assert ("c", 2.5) in weights
+    # an edge without a weight has None, like the NetworkX backend
+    assert ("b", None) in weights
+
+    empty = StellarGraph(nodes=pd.DataFrame(index=[1, 2]))
+    assert empty.number_of_nodes() == 2
+    assert empty.number_of_edges() == 0
+
+
+def test_from_pandas_errors():
+    edges = pd.DataFrame({"source": [0], "target": [1]})
+
+    with pytest.raises(ValueError, match=r"found some missing: \[1\]"):
+        StellarGraph(nodes=pd.DataFrame(index=[0]), edges=edges)
+
+    with pytest.raises(ValueError, match="expected 'source' and 'target' columns"):
+        StellarGraph(edges=pd.DataFrame({"source": [0]}))
+
+    with pytest.raises(ValueError, match="graph: expected no NetworkX graph"):
+        StellarGraph(nx.Graph(), edges=edges)
+
+    with pytest.raises(ValueError, match="backend: expected 'csr'"):
+        StellarGraph(edges=edges, backend="networkx")
+
+    with pytest.raises(ValueError, match="expected IDs to appear once"):
+        StellarGraph(nodes={"A": pd.DataFrame(index=[0]), "B": pd.DataFrame(index=[0])})
+
+    with pytest.raises(
+        TypeError, match=r"nodes\['A'\]: expected DataFrame or IndexedArray"
+    ):
+        StellarGraph(nodes={"A": [0, 1]})
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+@pytest.mark.parametrize("is_directed", [False, True])
+def test_from_edge_chunks_matches_pandas(is_directed, workers):
+    rs = np.random.RandomState(0)
+    edges = pd.DataFrame(
+        {
+            "source": rs.randint(20, size=100),
+            "target": rs.randint(20, size=100),
+            "label": rs.choice(["X", "Y", None], size=100),
+            "feature": rs.random_sample(100),
+        }
+    )
+    # only some chunks have weights
+    edges.loc[:49, "weight"] = rs.random_sample(50)
+    chunks = [edges.iloc[start : start + 30] for start in range(0, 100, 30)]
+
+    sg = StellarGraph.from_edge_chunks(
+        iter(chunks), is_directed=is_directed, workers=workers
+    )
+    assert isinstance(sg._graph, CSRStellarGraph)
+    assert sg.is_directed() == is_directed
+
+    # nodes are inferred from the chunks in the same order as the constructor
+    cls = StellarDiGraph if is_directed else StellarGraph
+    expected = cls(edges=pd.concat(chunks), backend="csr")
+    assert list(sg.nodes()) == list(expected.nodes())
+
+    actual_edges = sg._graph._edge_data
+    expected_edges = expected._graph._edge_data
+    assert actual_edges.types == expected_edges.types == ["X", "Y", "default"]
+    for name in [
+        "sources",
+        "targets",
+        "type_codes",
+        "weights",
+        "out_offsets",
+        "out_edges",
+        "in_offsets",
+        "in_edges",
+        "feature_rows",
+    ]:
+        np.testing.assert_array_equal(
+            getattr(actual_edges, name), getattr(expected_edges, name)
+        )
+
+    for edge_type in ["X", "Y", "default"]:
+        np.testing.assert_array_equal(
+            actual_edges.features[edge_type], expected_edges.features[edge_type]
+        )
+
+    # explicit nodes, with features
+    nodes = pd.DataFrame({"a": np.arange(20)}, index=np.arange(20)[::-1])
+    sg = StellarGraph.from_edge_chunks(chunks, nodes=nodes, workers=workers)
+    assert list(sg.nodes()) == list(nodes.index)
+    np.testing.assert_array_equal(sg.node_features([19, 0]), [[0], [19]])
+    assert sorted(sg.edges(triple=True)) == sorted(
+        StellarGraph(nodes=nodes, edges=edges).edges(triple=True)
+    )
+
+
+def test_from_edge_chunks_errors():
+    chunks = [pd.DataFrame({"source": [0], "target": [1]})]
+
+    with pytest.raises(ValueError, match=r"found some missing: \[1\]"):
+        StellarGraph.from_edge_chunks(chunks, nodes=pd.DataFrame(index=[0]), workers=1)
+
+    with pytest.raises(ValueError, match="workers: expected a positive integer"):
+        StellarGraph.from_edge_chunks(chunks, workers=0)
+
+    with pytest.raises(TypeError, match="expected an iterable of DataFrames"):
+        StellarGraph.from_edge_chunks([[0, 1]], workers=1)
+
+    empty = StellarGraph.from_edge_chunks([], workers=1)
+    assert empty.number_of_nodes() == 0
+    assert empty.number_of_edges() == 0
+
+
+@pytest.mark.benchmark(group="StellarGraph creation", timer=snapshot)
+@pytest.mark.parametrize("num_nodes,num_edges", [(0, 0), (100, 200), (1000, 5000)])
+@pytest.mark.parametrize("feature_size", [None, 100])
+def test_allocation_benchmark_creation_from_pandas(
+    allocation_benchmark, feature_size, num_nodes, num_edges
+):
+    rs = np.random.RandomState(0)
+    nodes = pd.DataFrame(
+        rs.random_sample((num_nodes, feature_size or 0)), index=np.arange(num_nodes)
+    )
+    edges = pd.DataFrame(
+        {
+            "source": rs.randint(num_nodes or 1, size=num_edges),
+            "target": rs.randint(num_nodes or 1, size=num_edges),
+        }
+    )
+
+    def f():
+        return StellarGraph(nodes=nodes, edges=edges)
+
+    allocation_benchmark(f)
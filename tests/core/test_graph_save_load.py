@@ -0,0 +1,141 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright 2020 Data61, CSIRO
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import gc
+import json
+import os
+import pickle
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from stellargraph.core.graph import StellarGraph, StellarDiGraph
+from stellargraph.core.graph_csr import CSRStellarGraph
+from ..test_utils.graphs import example_hin_1_nx
+from .test_graph_csr import weighted_multigraph, sorted_str
+
+
+def assert_graphs_equal(loaded, original):
+    assert loaded.is_directed() == original.is_directed()
+    assert list(loaded.nodes()) == list(original.nodes())
+    assert sorted_str(loaded.edges(triple=True)) == sorted_str(
+        original.edges(triple=True)
+    )
+    for node in original.nodes():
+        assert loaded.node_type(node) == original.node_type(node)
+        assert sorted_str(
+            loaded.neighbors(node, include_edge_weight=True)
+        ) == sorted_str(original.neighbors(node, include_edge_weight=True))
+
+    np.testing.assert_array_equal(
+        loaded.to_adjacency_matrix().toarray(), original.to_adjacency_matrix().toarray()
+    )
+    assert loaded.create_graph_schema().schema == original.create_graph_schema().schema
+
+
+@pytest.mark.parametrize("backend", ["networkx", "csr"])
+@pytest.mark.parametrize("is_directed", [False, True])
+@pytest.mark.parametrize("mmap", [False, True])
+def test_save_load_round_trip(tmpdir, backend, is_directed, mmap):
+    cls = StellarDiGraph if is_directed else StellarGraph
+    original = cls(weighted_multigraph(is_directed), backend=backend)
+
+    path = str(tmpdir.join("graph"))
+    original.save(path)
+    loaded = StellarGraph.load(path, mmap=mmap)
+
+    assert type(loaded) == cls
+    assert isinstance(loaded._graph, CSRStellarGraph)
+    assert isinstance(loaded._graph._edges.out_edges, np.memmap) == mmap
+    assert_graphs_equal(loaded, original)
+
+
+@pytest.mark.parametrize("backend", ["networkx", "csr"])
+def test_save_load_features(tmpdir, backend):
+    graph = example_hin_1_nx(feature_name="feature", feature_sizes={"A": 4, "B": 2})
+    original = StellarGraph(graph, node_features="feature", backend=backend)
+
+    path = str(tmpdir)
+    original.save(path)
+    loaded = StellarGraph.load(path)
+
+    assert_graphs_equal(loaded, original)
+    assert loaded.node_feature_sizes() == original.node_feature_sizes()
+    for nodes, node_type in [([0, 1, 2, 3], "A"), ([4, None, 6], "B")]:
+        np.testing.assert_array_equal(
+            loaded.node_features(nodes, node_type),
+            original.node_features(nodes, node_type),
+        )
+
+    # the arrays are stored natively, not pickled, so they can all be memory-mapped
+    assert not any(
+        np.load(os.path.join(path, name), allow_pickle=False).dtype == object
+        for name in os.listdir(path)
+        if name.endswith(".npy")
+    )
+
+
+def test_load_wrong_version(tmpdir):
+    path = str(tmpdir)
+    StellarGraph(weighted_multigraph(False), backend="csr").save(path)
+
+    metadata_path = os.path.join(path, "stellargraph.json")
+    with open(metadata_path) as f:
+        metadata = json.load(f)
+    metadata["format_version"] = 1000
+    with open(metadata_path, "w") as f:
+        json.dump(metadata, f)
+
+    with pytest.raises(
+        ValueError, match="expected a saved graph with format version 1"
+    ):
+        StellarGraph.load(path)
+
+
+@pytest.mark.parametrize("backend", ["networkx", "csr"])
+def test_share_pickles_as_handle(tmpdir, backend):
+    graph = example_hin_1_nx(feature_name="feature", feature_sizes={"A": 100, "B": 100})
+    original = StellarGraph(graph, node_features="feature", backend=backend)
+    shared = original.share(str(tmpdir))
+
+    assert isinstance(shared._graph, CSRStellarGraph)
+    assert_graphs_equal(shared, original)
+
+    # only the path is pickled, not the arrays
+    pickled = pickle.dumps(shared)
+    assert len(pickled) < 1000
+    unpickled = pickle.loads(pickled)
+    assert_graphs_equal(unpickled, original)
+    assert isinstance(unpickled._graph._edges.out_edges, np.memmap)
+    np.testing.assert_array_equal(
+        unpickled.node_features([0, 1], "A"), original.node_features([0, 1], "A")
+    )
+
+    # once changed, the graph no longer matches the files, and is pickled in full
+    shared.add_edges(pd.DataFrame({"source": [0], "target": [4]}))
+    changed = pickle.loads(pickle.dumps(shared))
+    assert changed.number_of_edges() == original.number_of_edges() + 1
+
+
+def test_share_temporary_directory():
+    shared = StellarGraph(weighted_multigraph(False)).share()
+    path = shared._graph._shared_path
+    assert os.path.isdir(path)
+
+    del shared
+    gc.collect()
+    assert not os.path.exists(path)
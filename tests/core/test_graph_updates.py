@@ -0,0 +1,239 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright 2020 Data61, CSIRO
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import networkx as nx
+import numpy as np
+import pandas as pd
+import pytest
+
+from stellargraph.core.graph import StellarGraph, StellarDiGraph
+from stellargraph.mapper import GraphSAGENodeGenerator
+from .test_graph_csr import sorted_str
+
+
+def example_nodes():
+    return {
+        "A": pd.DataFrame({"x": [1.0, 2.0], "y": [3.0, 4.0]}, index=[0, 1]),
+        "B": pd.DataFrame(index=[2, 3]),
+    }
+
+
+def example_edges():
+    return pd.DataFrame(
+        {
+            "source": [0, 0, 1, 1, 3],
+            "target": [1, 1, 2, 3, 3],
+            "label": ["AA", "AA", "AB", "AB", "BB"],
+            "weight": [0.0, 1.0, 10.0, 10.0, 5.0],
+        }
+    )
+
+
+def new_nodes():
+    return {
+        "A": pd.DataFrame({"x": [5.0], "y": [6.0]}, index=["a"]),
+        "C": pd.DataFrame({"z": [7.0, 8.0, 9.0]}, index=["c0", "c1", "c2"]),
+    }
+
+
+def new_edges():
+    return pd.DataFrame(
+        {
+            "source": ["a", 2, "c0", 0],
+            "target": [0, "c1", "c2", "c0"],
+            "label": ["AA", "BC", "CC", "AC"],
+            "weight": [2.0, 3.0, 4.0, 5.0],
+        }
+    )
+
+
+def graphs(is_directed, nodes, edges):
+    cls = StellarDiGraph if is_directed else StellarGraph
+    csr = cls(nodes=nodes, edges=edges)
+    # build the NetworkX version via the CSR one, so that they start identical
+    nx_graph = cls(csr.to_networkx(), node_features="feature", backend="networkx")
+    return csr, nx_graph
+
+
+def assert_graphs_equal(actual, expected):
+    assert actual.number_of_nodes() == expected.number_of_nodes()
+    assert actual.number_of_edges() == expected.number_of_edges()
+    assert sorted_str(actual.nodes()) == sorted_str(expected.nodes())
+
+    def edges(g):
+        if g.is_directed():
+            return sorted_str(g.edges(triple=True))
+        # the orientation of undirected edges isn't meaningful
+        return sorted_str(
+            (*sorted_str([src, tgt]), edge_type)
+            for src, tgt, edge_type in g.edges(triple=True)
+        )
+
+    assert edges(actual) == edges(expected)
+    assert actual.node_feature_sizes() == expected.node_feature_sizes()
+
+    for node in expected.nodes():
+        assert actual.node_type(node) == expected.node_type(node)
+        assert sorted_str(actual.neighbors(node, include_edge_weight=True)) == (
+            sorted_str(expected.neighbors(node, include_edge_weight=True))
+        )
+        assert sorted_str(actual.in_nodes(node, edge_types=["AA", "AC"])) == (
+            sorted_str(expected.in_nodes(node, edge_types=["AA", "AC"]))
+        )
+
+    for node_type in expected.node_feature_sizes():
+        nodes = expected.nodes_of_type(node_type)
+        np.testing.assert_array_equal(
+            actual.node_features(nodes, node_type),
+            expected.node_features(nodes, node_type),
+        )
+
+    assert actual.node_types == expected.node_types
+    for node_type in expected.node_types:
+        assert sorted_str(actual.nodes_of_type(node_type)) == sorted_str(
+            expected.nodes_of_type(node_type)
+        )
+
+    schema = expected.create_graph_schema()
+    actual_schema = actual.create_graph_schema()
+    assert actual_schema.node_types == schema.node_types
+    assert actual_schema.edge_types == schema.edge_types
+    assert actual_schema.schema == schema.schema
+    actual_adj = actual._adjacency_types(schema)
+    expected_adj = expected._adjacency_types(schema)
+    for edge_type in schema.edge_types:
+        for node in expected.nodes():
+            assert sorted_str(actual_adj[edge_type][node]) == sorted_str(
+                expected_adj[edge_type][node]
+            )
+
+
+@pytest.mark.parametrize("is_directed", [False, True])
+def test_add_nodes_and_edges(is_directed):
+    all_nodes = example_nodes()
+    for node_type, df in new_nodes().items():
+        all_nodes[node_type] = pd.concat([all_nodes.get(node_type), df])
+    expected = (StellarDiGraph if is_directed else StellarGraph)(
+        nodes=all_nodes, edges=pd.concat([example_edges(), new_edges()])
+    )
+
+    for sg in graphs(is_directed, example_nodes(), example_edges()):
+        # build the caches before the changes, to check that they're invalidated
+        sg._adjacency_types(sg.create_graph_schema())
+
+        sg.add_nodes(new_nodes())
+        edges = new_edges()
+        sg.add_edges(edges[:2])
+        sg.add_edges(edges[2:])
+
+        assert_graphs_equal(sg, expected)
+
+
+@pytest.mark.parametrize("is_directed", [False, True])
+def test_remove_edges(is_directed):
+    edges = example_edges()
+    # (1, 2) and both (0, 1) edges, and the "BB" edge
+    remaining = edges.iloc[[3]]
+    if is_directed:
+        to_remove = [(1, 2), (0, 1), (3, 3, "BB")]
+    else:
+        # undirected edges match in either direction
+        to_remove = [(2, 1), (1, 0), (3, 3, "BB")]
+
+    expected = (StellarDiGraph if is_directed else StellarGraph)(
+        nodes=example_nodes(), edges=remaining
+    )
+
+    for sg in graphs(is_directed, example_nodes(), edges):
+        sg._adjacency_types(sg.create_graph_schema())
+
+        sg.remove_edges(to_remove)
+        assert_graphs_equal(sg, expected)
+
+
+def test_add_then_remove_edges():
+    for sg in graphs(False, example_nodes(), example_edges()):
+        np.testing.assert_array_equal(sg.node_degrees(as_array=True), [2, 4, 1, 3])
+
+        sg.add_edges(pd.DataFrame({"source": [2], "target": [3], "label": ["BB"]}))
+        np.testing.assert_array_equal(sg.node_degrees(as_array=True), [2, 4, 2, 4])
+
+        sg.remove_edges([(1, 3), (2, 3, "BB")])
+        np.testing.assert_array_equal(sg.node_degrees(as_array=True), [2, 3, 1, 2])
+
+        assert sorted_str(sg.neighbors(3)) == [3]
+        assert sorted_str(sg.neighbors(2)) == [1]
+
+
+def test_update_errors():
+    for sg in graphs(False, example_nodes(), example_edges()):
+        with pytest.raises(ValueError, match=r"found some that appeared more: \[1\]"):
+            sg.add_nodes({"A": pd.DataFrame({"x": [0.0], "y": [0.0]}, index=[1])})
+
+        with pytest.raises(ValueError, match=r"expected 2 feature columns.*found 1"):
+            sg.add_nodes({"A": pd.DataFrame({"x": [0.0]}, index=["new"])})
+
+        with pytest.raises(ValueError, match=r"expected 0 feature columns.*found 1"):
+            sg.add_nodes({"B": pd.DataFrame({"x": [0.0]}, index=["new"])})
+
+        with pytest.raises(ValueError, match=r"found some missing: \['missing'\]"):
+            sg.add_edges(pd.DataFrame({"source": [0], "target": ["missing"]}))
+
+        with pytest.raises(
+            KeyError, match=r"edges not found: \[\(0, 3\), \(0, 1, 'BB'\)\]"
+        ):
+            sg.remove_edges([(0, 1), (0, 3), (0, 1, "BB")])
+
+        with pytest.raises(ValueError, match="expected .* pairs or .* triples"):
+            sg.remove_edges([(0,)])
+
+        # nothing changed
+        assert sg.number_of_nodes() == 4
+        assert sg.number_of_edges() == 5
+
+
+def test_schema_is_cached():
+    for sg in graphs(False, example_nodes(), example_edges()):
+        schema = sg.create_graph_schema()
+        assert sg.create_graph_schema() is schema
+        assert sg.nodes_of_type("B") == [2, 3]
+
+        sg.add_nodes(new_nodes())
+        sg.add_edges(new_edges())
+
+        updated = sg.create_graph_schema()
+        assert updated is not schema
+        assert updated.node_types == ["A", "B", "C"]
+        assert ("B", "BC", "C") in updated.edge_types
+        assert sorted_str(sg.nodes_of_type("C")) == ["c0", "c1", "c2"]
+
+        sg.remove_edges([(2, "c1")])
+        assert ("B", "BC", "C") not in sg.create_graph_schema().edge_types
+
+
+def test_generator_sees_updates():
+    sg = StellarGraph(
+        nodes=pd.DataFrame(np.eye(3), index=[0, 1, 2]),
+        edges=pd.DataFrame({"source": [0], "target": [1]}),
+    )
+    gen = GraphSAGENodeGenerator(sg, batch_size=1, num_samples=[2])
+
+    sg.add_nodes(pd.DataFrame(np.ones((1, 3)), index=[3]))
+    sg.add_edges(pd.DataFrame({"source": [3], "target": [2]}))
+
+    features = gen.flow([3])[0][0]
+    np.testing.assert_array_equal(features[0], [[[1, 1, 1]]])
+    np.testing.assert_array_equal(features[1], [[[0, 0, 1], [0, 0, 1]]])
@@ -0,0 +1,130 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright 2020 Data61, CSIRO
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from stellargraph import QuantisedArray
+from stellargraph.core.graph import StellarGraph
+from .test_graph_updates import example_nodes, example_edges, graphs
+
+
+def example_features():
+    return np.array([[0.5, -3.0, 0.0], [1.5, 2.0, 0.0], [-0.25, 4.0, 0.0]], "float32")
+
+
+@pytest.mark.parametrize("storage", ["float16", "int8"])
+def test_quantised_array(storage):
+    features = example_features()
+    arr = QuantisedArray.from_array(features, storage)
+
+    assert arr.storage == storage
+    assert arr.shape == (3, 3)
+    assert len(arr) == 3
+    assert arr.values.nbytes < features.nbytes
+
+    rows = arr[[2, 0]]
+    assert rows.dtype == np.float32
+    np.testing.assert_allclose(rows, features[[2, 0]], atol=0.02)
+    # zero is exact
+    np.testing.assert_array_equal(arr[:][:, 2], 0)
+
+    sub = arr.select([1])
+    assert sub.storage == storage
+    np.testing.assert_array_equal(sub[:], arr[[1]])
+
+    appended = arr.append([np.array([[1.0, 1.0, 0.0]])])
+    assert appended.storage == storage
+    assert len(appended) == 4
+    np.testing.assert_array_equal(appended[:3], arr[:])
+    np.testing.assert_allclose(appended[3], [1, 1, 0], atol=0.02)
+
+    with pytest.raises(ValueError, match="expected arrays with 3 columns, found 2"):
+        arr.append([np.zeros((1, 2))])
+
+
+def test_quantised_array_int8_range():
+    features = example_features()
+    arr = QuantisedArray.from_array(features, "int8")
+    # each column uses (close to) the whole range, with half a step of error at most
+    assert (np.abs(arr[:] - features) <= arr.scale / 2 + 1e-6).all()
+
+    # values inside the range keep the scale and zero point, and the existing values
+    within = arr.append([features[:1]])
+    np.testing.assert_array_equal(within.scale, arr.scale)
+    np.testing.assert_array_equal(within.values[:3], arr.values)
+
+    # values outside the original range widen it, rather than being clipped or wrapping around
+    appended = arr.append([np.array([[100.0, -100.0, 0.0]])])
+    assert appended.storage == "int8"
+    assert (appended.scale[:2] > arr.scale[:2]).all()
+    assert (
+        np.abs(appended[:] - np.concatenate([arr[:], [[100, -100, 0]]]))
+        <= appended.scale / 2 + 1e-4
+    ).all()
+
+
+def test_quantised_array_errors():
+    with pytest.raises(ValueError, match="expected 'float16' or 'int8'"):
+        QuantisedArray.from_array(example_features(), "int4")
+    with pytest.raises(ValueError, match="expected float16 or int8 values"):
+        QuantisedArray(example_features())
+    with pytest.raises(ValueError, match="expected a 2D array"):
+        QuantisedArray(np.zeros(3, dtype=np.float16))
+    with pytest.raises(ValueError, match="scale, zero_point"):
+        QuantisedArray(np.zeros((3, 2), dtype=np.int8))
+
+
+@pytest.mark.parametrize("storage", ["float16", "int8"])
+def test_compress_node_features(tmpdir, storage):
+    for sg in graphs(False, example_nodes(), example_edges()):
+        expected = sg.node_features([1, 0, None], "A")
+        sg.compress_node_features(storage)
+
+        features = sg.node_features([1, 0, None], "A")
+        assert features.dtype == expected.dtype
+        np.testing.assert_allclose(features, expected, atol=0.02)
+        assert sg.node_feature_sizes() == {"A": 2}
+
+        # new nodes are quantised in the same way
+        sg.add_nodes({"A": pd.DataFrame({"x": [1.5], "y": [3.5]}, index=["a"])})
+        np.testing.assert_allclose(
+            sg.node_features(["a"], "A"), [[1.5, 3.5]], atol=0.02
+        )
+
+        # values outside the range of the existing ones aren't clipped
+        before = sg.node_features([1, 0, "a"], "A")
+        sg.add_nodes({"A": pd.DataFrame({"x": [100.0], "y": [-50.0]}, index=["z"])})
+        # with int8, the error is at most half of 150 / 255 for each value
+        np.testing.assert_allclose(sg.node_features(["z"], "A"), [[100, -50]], atol=0.3)
+        np.testing.assert_allclose(sg.node_features([1, 0, "a"], "A"), before, atol=0.3)
+
+        sub = sg.subgraph([1, "a", "z"])
+        np.testing.assert_array_equal(
+            sub.node_features([1, "a", "z"], "A"), sg.node_features([1, "a", "z"], "A")
+        )
+
+        path = str(tmpdir.join(f"{type(sg._graph).__name__}"))
+        sg.save(path)
+        loaded = StellarGraph.load(path)
+        assert isinstance(loaded._graph._nodes.features["A"], QuantisedArray)
+        np.testing.assert_array_equal(
+            loaded.node_features([0, 1, "a"], "A"), sg.node_features([0, 1, "a"], "A")
+        )
+
+    with pytest.raises(ValueError, match=r"found some without: \['B'\]"):
+        sg.compress_node_features(storage, ["B"])
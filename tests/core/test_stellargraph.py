@@ -18,8 +18,11 @@ import networkx as nx
 import numpy as np
 import pandas as pd
 import pytest
+import scipy.sparse as sps
 import random
 from stellargraph.core.graph import *
+from stellargraph.core.indexed_array import IndexedArray
+from stellargraph.core.schema import EdgeType
 from ..test_utils.alloc import snapshot, allocation_benchmark
 from ..test_utils.graphs import (
     example_graph_1_nx,
@@ -102,7 +105,69 @@ def test_info():
     sg = create_graph_1()
     info_str = sg.info()
     info_str = sg.info(show_attributes=False)
-    # How can we check this?
+
+    assert "Nodes: 6, Edges: 5" in info_str
+    assert "Degrees: min 1, mean 1.67, max 3" in info_str
+    assert "movie: [4]" in info_str
+    assert "user: [2]" in info_str
+    assert "movie-rating->user: [5]" in info_str
+
+
+def test_info_sampled_attributes():
+    g = create_graph_1(return_nx=True)
+    g.nodes[0]["title"] = "x"
+    g.edges[4, 0, 0]["timestamp"] = 1
+    sg = StellarGraph(g)
+
+    assert "Attributes" not in sg.info()
+
+    info_str = sg.info(sample=6)
+    assert "Attributes: {'title'}" in info_str
+    assert "Attributes: {'timestamp'}" in info_str
+    assert "Attributes" not in sg.info(show_attributes=False, sample=6)
+
+
+@pytest.mark.parametrize("backend", ["networkx", "csr"])
+def test_sparse_node_features(tmpdir, backend):
+    features = sps.random(4, 3, density=0.5, format="csr", random_state=0)
+    dense = features.toarray()
+    edges = pd.DataFrame({"source": [0, 1, 2], "target": [1, 2, 3]})
+
+    if backend == "csr":
+        sg = StellarGraph(nodes=IndexedArray(features), edges=edges)
+    else:
+        g = nx.Graph()
+        g.add_edges_from([(0, 1), (1, 2), (2, 3)])
+        sg = StellarGraph(g, node_features=IndexedArray(features))
+
+    node_features = sg.node_features([3, None, 0])
+    assert sps.isspmatrix_csr(node_features)
+    np.testing.assert_array_equal(
+        node_features.toarray(), [dense[3], np.zeros(3), dense[0]]
+    )
+    assert sg.node_feature_sizes() == {"default": 3}
+
+    # a DataFrame of sparse columns is also stored sparsely
+    sg.add_nodes(pd.DataFrame.sparse.from_spmatrix(features[[1]], index=[9]))
+    np.testing.assert_array_equal(sg.node_features([9]).toarray(), dense[[1]])
+    sg.add_nodes(pd.DataFrame([[1.0, 0.0, 2.0]], index=[10]))
+    np.testing.assert_array_equal(sg.node_features([10]).toarray(), [[1, 0, 2]])
+
+    sub = sg.subgraph([10, 0])
+    np.testing.assert_array_equal(
+        sub.node_features([10, 0]).toarray(), [[1, 0, 2], dense[0]]
+    )
+
+    path = str(tmpdir)
+    sg.save(path)
+    loaded = StellarGraph.load(path)
+    np.testing.assert_array_equal(
+        loaded.node_features([0, 10, 9]).toarray(),
+        sg.node_features([0, 10, 9]).toarray(),
+    )
+
+    with pytest.raises(ValueError, match="found some with sparse features"):
+        sg.compress_node_features()
 
 
 def test_graph_from_nx():
@@ -204,6 +269,27 @@ def test_get_index_for_nodes():
         aa = sg._get_index_for_nodes([1, 2, 5])
 
 
+def test_node_features_by_index():
+    sg = example_hin_1(feature_name="feature", feature_sizes={"A": 4, "B": 2})
+    indices = sg._get_index_for_nodes([6, None, 4], "B")
+
+    np.testing.assert_array_equal(
+        sg.node_features_by_index(np.array(indices), "B"),
+        sg.node_features([6, None, 4], "B"),
+    )
+    assert sg.node_features_by_index([], "A").shape == (0, 4)
+
+    with pytest.raises(ValueError, match="Features not found for node type 'C'"):
+        sg.node_features_by_index([0], "C")
+
+
+def test_node_features_duplicate_ids():
+    # like a dictionary, the last features for a repeated ID win
+    features = pd.DataFrame([[1], [2], [3]], index=[0, 1, 0])
+    sg = StellarGraph(nx.path_graph(2), node_features=features)
+    np.testing.assert_array_equal(sg.node_features([0, 1, None]), [[3], [2], [0]])
+
+
 def test_feature_conversion_from_nodes():
     sg = example_graph_2(feature_name="feature", feature_size=8)
     aa = sg.node_features([1, 2, 3, 4])
@@ -531,6 +617,23 @@ def test_benchmark_get_neighbours(benchmark):
     benchmark(f)
 
 
+@pytest.mark.benchmark(group="StellarGraph neighbours")
+@pytest.mark.parametrize("backend", ["networkx", "csr"])
+def test_benchmark_get_neighbours_by_edge_type(benchmark, backend):
+    g, node_features = example_benchmark_graph()
+    for i, (src, dst) in enumerate(g.edges()):
+        g.edges[src, dst]["label"] = i % 3
+    num_nodes = g.number_of_nodes()
+    sg = StellarGraph(g, node_features=node_features, backend=backend)
+
+    # get the neigbours of every node in the graph, along two of the three edge types
+    def f():
+        for i in range(num_nodes):
+            sg.neighbors(i, edge_types=[0, 2])
+
+    benchmark(f)
+
+
 @pytest.mark.benchmark(group="StellarGraph node features")
 @pytest.mark.parametrize("num_types", [1, 4])
 @pytest.mark.parametrize("type_arg", ["infer", "specify"])
@@ -614,6 +717,74 @@ def test_neighbors_weighted_hin(is_directed):
     )
 
 
+@pytest.mark.parametrize("is_directed", [True, False])
+def test_adjacency_types(is_directed):
+    graph = example_weighted_hin(is_directed=is_directed)
+    schema = graph.create_graph_schema()
+    adj = graph._adjacency_types(schema)
+
+    aa = EdgeType("A", "AA", "A")
+    ab = EdgeType("A", "AB", "B")
+    assert adj[aa][0] == [1, 1]
+    assert adj[ab][1] == [2, 3]
+    # nodes without neighbours (or that aren't in the graph) give a placeholder
+    assert adj[ab][0] == [None]
+    assert adj[ab]["missing"] == [None]
+
+    if is_directed:
+        assert adj[aa][1] == [None]
+    else:
+        assert adj[aa][1] == [0, 0]
+        assert adj[EdgeType("B", "AB", "A")][3] == [1]
+
+    # built once, and shared between callers
+    other = graph._adjacency_types(graph.create_graph_schema())
+    assert other[aa] is adj[aa]
+
+
+@pytest.mark.parametrize("backend", ["networkx", "csr"])
+@pytest.mark.parametrize("is_directed", [False, True])
+def test_neighbors_edge_types_order(backend, is_directed):
+    rs = np.random.RandomState(0)
+    g = nx.MultiDiGraph() if is_directed else nx.MultiGraph()
+    g.add_nodes_from(range(30), label="n")
+    # the weights are unique, and so identify each edge
+    labels = {}
+    for src, tgt, label in zip(
+        rs.randint(30, size=150), rs.randint(30, size=150), rs.choice(list("abc"), 150)
+    ):
+        weight = rs.random_sample()
+        labels[weight] = label
+        g.add_edge(src, tgt, label=label, weight=weight)
+
+    sg = StellarGraph(g, backend=backend)
+    for node in range(30):
+        for method in [sg.neighbors, sg.in_nodes, sg.out_nodes]:
+            unfiltered = method(node, include_edge_weight=True)
+            # filtering by every type keeps the neighbours in the same order
+            assert method(node, edge_types=["a", "b", "c"]) == method(node)
+            assert (
+                method(node, include_edge_weight=True, edge_types=["c", "a", "b"])
+                == unfiltered
+            )
+
+            # filtering by some types keeps the order of the remaining neighbours
+            assert method(node, include_edge_weight=True, edge_types=["c", "a"]) == [
+                neighbour for neighbour in unfiltered if labels[neighbour.weight] != "b"
+            ]
+
+
+def test_neighbors_edge_types_cache_invalidation():
+    graph = example_weighted_hin(is_directed=False)
+    assert_items_equal(graph.neighbors(1, edge_types=["AB"]), [2, 3])
+
+    # the typed index is built from the NetworkX graph and must be reset if it changes
+    graph._graph._graph.add_edge(1, 0, label="AB")
+    assert_items_equal(graph.neighbors(1, edge_types=["AB"]), [2, 3])
+    graph._graph._invalidate_caches()
+    assert_items_equal(graph.neighbors(1, edge_types=["AB"]), [0, 2, 3])
+
+
 def assert_items_equal(l1, l2):
     assert sorted(l1) == sorted(l2)
 
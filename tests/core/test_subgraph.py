@@ -0,0 +1,90 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright 2020 Data61, CSIRO
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import numpy as np
+import pytest
+
+from stellargraph.core.graph import StellarGraph, StellarDiGraph
+from stellargraph.core.graph_csr import CSRStellarGraph
+from .test_graph_csr import sorted_str
+from .test_graph_updates import example_nodes, example_edges, graphs
+
+
+@pytest.mark.parametrize("is_directed", [False, True])
+def test_subgraph(is_directed):
+    for sg in graphs(is_directed, example_nodes(), example_edges()):
+        sub = sg.subgraph([3, 1])
+
+        assert type(sub) == type(sg)
+        assert isinstance(sub._graph, CSRStellarGraph)
+        assert list(sub.nodes()) == [3, 1]
+        assert sub.node_type(3) == "B"
+        assert sorted_str(sub.edges(triple=True)) == [(1, 3, "AB"), (3, 3, "BB")]
+        assert sub.node_degrees(weighted=True) == {3: 20.0, 1: 10.0}
+
+        # only the features of the subgraph's nodes are kept
+        assert sub._graph._nodes.features["A"].shape == (1, 2)
+        np.testing.assert_array_equal(sub.node_features([1], "A"), [[2, 4]])
+        assert sub.node_feature_sizes() == sg.node_feature_sizes()
+
+        # local and global indices
+        np.testing.assert_array_equal(sub.ids_to_index([1, 3]), [1, 0])
+        np.testing.assert_array_equal(sg.ids_to_index(sub.nodes()), [3, 1])
+
+        by_index = sg.subgraph([3, 1], use_index=True)
+        assert list(by_index.nodes()) == [3, 1]
+
+        assert sg.subgraph([]).number_of_nodes() == 0
+
+        with pytest.raises(ValueError, match="appear once"):
+            sg.subgraph([1, 3, 1])
+        with pytest.raises(KeyError):
+            sg.subgraph([1, "x"])
+        with pytest.raises(IndexError):
+            sg.subgraph([1, 10], use_index=True)
+
+
+@pytest.mark.parametrize("is_directed", [False, True])
+def test_k_hop_subgraph(is_directed):
+    for sg in graphs(is_directed, example_nodes(), example_edges()):
+        zero = sg.k_hop_subgraph([2, 2], 0)
+        assert list(zero.nodes()) == [2]
+        assert zero.number_of_edges() == 0
+
+        one = sg.k_hop_subgraph([2], 1)
+        assert list(one.nodes()) == [2, 1]
+        assert sorted_str(one.edges(triple=True)) == [(1, 2, "AB")]
+
+        # the seeds come first, then nodes by the hop they were reached
+        two = sg.k_hop_subgraph([2], 2)
+        assert list(two.nodes())[:2] == [2, 1]
+        assert sorted(two.nodes()) == [0, 1, 2, 3]
+        assert two.number_of_edges() == sg.number_of_edges()
+
+        assert list(sg.k_hop_subgraph([2], 1, use_index=True).nodes()) == [2, 1]
+
+        # node 1 has neighbours 0 (twice), 2 and 3, but only one edge is followed
+        sampled = sg.k_hop_subgraph([1], 1, max_neighbours=1, seed=0)
+        assert sampled.number_of_nodes() == 2
+        assert list(sg.k_hop_subgraph([1], 1, max_neighbours=1, seed=0).nodes()) == (
+            list(sampled.nodes())
+        )
+        assert sg.k_hop_subgraph([1], 1, max_neighbours=4).number_of_nodes() == 4
+
+        with pytest.raises(ValueError, match="k: expected a non-negative integer"):
+            sg.k_hop_subgraph([1], -1)
+        with pytest.raises(ValueError, match="max_neighbours: expected a positive"):
+            sg.k_hop_subgraph([1], 1, max_neighbours=0)
@@ -17,7 +17,7 @@
 import numpy as np
 import pytest
 import networkx as nx
-from stellargraph.data.explorer import BiasedRandomWalk
+from stellargraph.data.explorer import BiasedRandomWalk, GraphWalk
 from stellargraph.core.graph import StellarGraph
 from ..test_utils.graphs import create_test_graph
 
@@ -552,6 +552,141 @@ class TestBiasedRandomWalk(object):
             (0, 3, 4, 2),
         }
 
+    @pytest.mark.parametrize("memory_budget", [2 ** 20, 0])
+    def test_walk_biases_batched(self, memory_budget):
+        graph = nx.Graph()
+        graph.add_edges_from([(0, 1), (0, 2), (0, 3), (1, 2), (2, 4), (3, 4)])
+        graph = StellarGraph(graph)
+        biasedrw = BiasedRandomWalk(graph)
+
+        always = 1e-100
+        never = 1e100
+
+        def walks(p, q):
+            result = biasedrw.run(
+                nodes=[0],
+                n=1000,
+                p=p,
+                q=q,
+                length=4,
+                seed=0,
+                batched=True,
+                memory_budget=memory_budget,
+            )
+            assert result.shape == (1000, 4)
+            return {tuple(graph.index_to_ids(walk)) for walk in result}
+
+        # the same as test_walk_biases, with the tables (or with rejection sampling, for a
+        # memory budget of 0)
+        assert walks(always, never) == {(0, 1, 0, 1), (0, 2, 0, 2), (0, 3, 0, 3)}
+        assert walks(never, always) == {(0, 2, 4, 3), (0, 3, 4, 2), (0, 1, 2, 4)}
+        assert walks(never, never) == {
+            (0, 1, 2, 0),
+            (0, 2, 1, 0),
+            (0, 3, 0, 1),
+            (0, 3, 0, 2),
+            (0, 3, 0, 3),
+            (0, 3, 4, 3),
+            (0, 3, 4, 2),
+        }
+
+    @pytest.mark.parametrize("weighted", [False, True])
+    @pytest.mark.parametrize("memory_budget", [2 ** 20, 0])
+    def test_batched_matches_distribution(self, weighted, memory_budget):
+        graph = nx.Graph()
+        graph.add_weighted_edges_from(
+            [(0, 1, 1), (0, 2, 2), (1, 2, 1), (2, 3, 3), (1, 3, 0.5), (3, 4, 1)]
+        )
+        graph = StellarGraph(graph)
+        biasedrw = BiasedRandomWalk(graph)
+
+        def frequencies(walks):
+            paths, counts = np.unique(walks, axis=0, return_counts=True)
+            return {
+                tuple(path): count / len(walks) for path, count in zip(paths, counts)
+            }
+
+        kwargs = dict(nodes=[0] * 20000, n=1, p=0.5, q=2.0, length=4, weighted=weighted)
+        expected = frequencies(
+            graph.ids_to_index(np.ravel(biasedrw.run(seed=0, **kwargs))).reshape(-1, 4)
+        )
+        actual = frequencies(
+            biasedrw.run(seed=1, batched=True, memory_budget=memory_budget, **kwargs)
+        )
+
+        assert set(actual) == set(expected)
+        for path, frequency in expected.items():
+            assert actual[path] == pytest.approx(frequency, abs=0.015)
+
+    @pytest.mark.parametrize("batched", [False, True])
+    def test_workers(self, monkeypatch, batched):
+        # use several shards, even for this small graph
+        monkeypatch.setattr(GraphWalk, "_SHARD_SIZE", 3)
+
+        g = create_test_weighted_graph()
+        biasedrw = BiasedRandomWalk(g)
+        kwargs = dict(
+            nodes=list(g.nodes()),
+            n=2,
+            p=0.5,
+            q=2.0,
+            length=5,
+            seed=7,
+            weighted=True,
+            batched=batched,
+        )
+
+        walks = biasedrw.run(workers=1, **kwargs)
+        assert len(walks) == 2 * g.number_of_nodes()
+        if batched:
+            np.testing.assert_array_equal(biasedrw.run(workers=3, **kwargs), walks)
+        else:
+            assert biasedrw.run(workers=3, **kwargs) == walks
+
+    @pytest.mark.parametrize("batched", [False, True])
+    def test_run_iter(self, monkeypatch, batched):
+        monkeypatch.setattr(GraphWalk, "_SHARD_SIZE", 3)
+
+        g = create_test_weighted_graph()
+        biasedrw = BiasedRandomWalk(g)
+        kwargs = dict(
+            n=2, p=0.5, q=2.0, length=5, seed=7, weighted=True, batched=batched
+        )
+
+        chunks = list(biasedrw.run_iter(list(g.nodes()), chunk_size=3, **kwargs))
+        assert all(chunk.shape == (6, 5) for chunk in chunks[:-1])
+
+        walks = biasedrw.run(nodes=list(g.nodes()), workers=1, **kwargs)
+        if not batched:
+            walks = biasedrw._walks_array(walks, 5, False)
+        np.testing.assert_array_equal(np.concatenate(chunks), walks)
+
+    def test_batched_dead_ends_and_errors(self):
+        g = create_test_weighted_graph()
+        biasedrw = BiasedRandomWalk(g)
+
+        walks = biasedrw.run(
+            nodes=["loner", "self loner"], n=2, length=3, weighted=True, batched=True
+        )
+        np.testing.assert_array_equal(
+            walks[:2], np.tile([g.ids_to_index(["loner"])[0], -1, -1], (2, 1))
+        )
+        assert (walks[2:] == g.ids_to_index(["self loner"])[0]).all()
+
+        graph = nx.MultiGraph()
+        graph.add_weighted_edges_from([(1, 2, 1), (1, 2, 2), (2, 3, 1)])
+        with pytest.raises(ValueError, match="multiple edges with different weights"):
+            BiasedRandomWalk(StellarGraph(graph)).run(
+                nodes=[1], n=1, length=2, weighted=True, batched=True
+            )
+
+        graph = nx.Graph()
+        graph.add_weighted_edges_from([(1, 2, 1), (2, 3, np.nan)])
+        with pytest.raises(ValueError, match="invalid or negative edge weight"):
+            BiasedRandomWalk(StellarGraph(graph)).run(
+                nodes=[1], n=1, length=2, weighted=True, batched=True
+            )
+
     def test_benchmark_biasedrandomwalk(self, benchmark):
         g = create_test_graph()
         biasedrw = BiasedRandomWalk(g)
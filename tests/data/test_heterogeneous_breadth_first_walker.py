@@ -255,7 +255,7 @@ class TestSampledHeterogeneousBreadthFirstWalk(object):
                 [3, 3],
                 ["5", "5", "5"],
                 [2, 2, 2],
-                [4, "5", 4],
+                ["5", 4, "5"],
                 [2, 3, 3],
                 [1, "5", "5"],
                 [1, "5", "5"],
@@ -274,7 +274,7 @@ class TestSampledHeterogeneousBreadthFirstWalk(object):
                 [3, 3],
                 ["5", "5", "5"],
                 [2, 2, 2],
-                [4, "5", 4],
+                ["5", 4, "5"],
                 [2, 3, 3],
                 [1, "5", "5"],
                 [1, "5", "5"],
@@ -283,10 +283,10 @@ class TestSampledHeterogeneousBreadthFirstWalk(object):
                 ["5"],
                 [1, 1],
                 [6, 3],
-                [4, 4, "5"],
-                [3, 3, 3],
                 ["5", "5", 4],
                 [3, 3, 3],
+                [4, 4, "5"],
+                [3, 3, 3],
                 ["5", "5", "5"],
                 [1, 1, 1],
             ],
@@ -294,9 +294,9 @@ class TestSampledHeterogeneousBreadthFirstWalk(object):
                 ["5"],
                 [1, 1],
                 [3, 3],
-                ["5", 4, 4],
+                [4, "5", "5"],
                 [2, 2, 3],
-                ["5", "5", 4],
+                [4, 4, "5"],
                 [3, 2, 2],
                 ["5", "5", "5"],
                 ["5", "5", "5"],
@@ -317,7 +317,7 @@ class TestSampledHeterogeneousBreadthFirstWalk(object):
 
         subgraphs = bfw.run(nodes=nodes, n=n, n_size=n_size, seed=19893839)
         assert len(subgraphs) == n
-        assert subgraphs == [[[1], [4, 4], [4, 4], [2, 2]]]
+        assert subgraphs == [[[1], [4, 4], ["5", "5"], [2, 2]]]
 
         n_size = [2, 3]
         subgraphs = bfw.run(nodes=nodes, n=n, n_size=n_size, seed=19893839)
@@ -326,7 +326,7 @@ class TestSampledHeterogeneousBreadthFirstWalk(object):
             [
                 [1],
                 [4, 4],
-                [4, 4],
+                ["5", "5"],
                 [2, 2],
                 [1, 1, 1],
                 ["5", 1, 1],
@@ -334,12 +334,12 @@ class TestSampledHeterogeneousBreadthFirstWalk(object):
                 [1, 1, 1],
                 [1, "5", 1],
                 [2, 2, 2],
-                [1, 1, 1],
-                ["5", 1, "5"],
-                [2, 2, 2],
-                [1, 1, 1],
-                ["5", "5", 1],
-                [2, 2, 2],
+                [None, None, None],
+                [4, 1, 4],
+                [3, 6, 3],
+                [None, None, None],
+                [4, 4, 1],
+                [3, 3, 3],
                 [4, 1, 1],
                 [4, 1, 4],
             ]
@@ -357,7 +357,7 @@ class TestSampledHeterogeneousBreadthFirstWalk(object):
             [
                 [1],
                 [4, 4],
-                [4, 4],
+                ["5", "5"],
                 [2, 2],
                 [],
                 [],
@@ -377,7 +377,7 @@ class TestSampledHeterogeneousBreadthFirstWalk(object):
             [
                 [1],
                 [4, 4],
-                ["5", "5"],
+                [4, 4],
                 [2, 2],
                 [],
                 [],
@@ -447,7 +447,7 @@ class TestSampledHeterogeneousBreadthFirstWalk(object):
                 [None, None],
                 [None, None],
             ],
-            [[4], [1, 1], [2, 2], [4, "5"], [3, 2], ["5", 4], [2, 2], [4, 4], [1, 4]],
+            [[4], [1, "5"], [2, 2], [4, "5"], [2, 2], [4, 4], [3, 6], [1, 4], [4, 4]],
         ]
         for a, b in zip(subgraphs, valid_result):
             assert a == b
@@ -460,12 +460,12 @@ class TestSampledHeterogeneousBreadthFirstWalk(object):
         valid_result = [
             [
                 [1],
-                ["5", 4],
+                [4, "5"],
                 [3, 3],
-                [1, 1, 4],
-                [3, 6, 6],
-                [1, "5", 1],
+                [1, 1, "5"],
                 [2, 2, 2],
+                [1, 4, 1],
+                [3, 6, 6],
                 [1, "5", "5"],
                 [1, "5", 1],
             ],
@@ -490,7 +490,7 @@ class TestSampledHeterogeneousBreadthFirstWalk(object):
 
         subgraphs = bfw.run(nodes=nodes, n=n, n_size=n_size, seed=999)
         assert len(subgraphs) == n * len(nodes)
-        valid_result = [[[1], [4, 4], ["5", "5"], [2, 2]], [[6], ["5", "5"]]]
+        valid_result = [[[1], [4, 4], [4, 4], [2, 2]], [[6], ["5", "5"]]]
         assert subgraphs == valid_result
 
         n = 1
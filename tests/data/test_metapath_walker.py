@@ -14,9 +14,10 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import numpy as np
 import pytest
 import networkx as nx
-from stellargraph.data.explorer import UniformRandomMetaPathWalk
+from stellargraph.data.explorer import GraphWalk, UniformRandomMetaPathWalk
 from stellargraph.core.graph import StellarGraph
 
 
@@ -300,6 +301,44 @@ class TestMetaPathWalk(object):
         for walk in walks:
             assert len(walk) <= length  # test against maximum walk length
 
+    def test_workers(self, monkeypatch):
+        # use several shards, even for this small graph
+        monkeypatch.setattr(GraphWalk, "_SHARD_SIZE", 2)
+
+        g = create_test_graph()
+        mrw = UniformRandomMetaPathWalk(g)
+
+        nodes = ["0", "5", 1, 6, 2]
+        metapaths = [["s", "n", "n", "s"], ["n", "s", "n"], ["n", "n"]]
+        kwargs = dict(nodes=nodes, n=3, length=6, metapaths=metapaths, seed=42)
+
+        walks = mrw.run(workers=1, **kwargs)
+        # walks are in the order of the root nodes, like without workers
+        assert len(walks) == len(mrw.run(**kwargs))
+        assert [walk[0] for walk in walks] == [walk[0] for walk in mrw.run(**kwargs)]
+
+        assert mrw.run(workers=2, **kwargs) == walks
+
+    def test_run_iter(self):
+        g = create_test_graph()
+        mrw = UniformRandomMetaPathWalk(g)
+
+        nodes = ["0", "5", 1, 6, 2]
+        metapaths = [["s", "n", "n", "s"], ["n", "s", "n"], ["n", "n"]]
+        walks = mrw.run_iter(
+            nodes, n=3, length=6, metapaths=metapaths, chunk_size=2, seed=42
+        )
+
+        chunks = list(walks)
+        assert len(chunks) == 3
+        assert all(chunk.shape[1] == 6 for chunk in chunks)
+        # the walks are padded after a dead end
+        sentences = list(walks.sentences())
+        assert sum(len(chunk) for chunk in chunks) == len(sentences)
+        assert [len(walk) for walk in sentences] == list(
+            (np.concatenate(chunks) >= 0).sum(axis=1)
+        )
+
     def test_benchmark_uniformrandommetapathwalk(self, benchmark):
 
         g = create_test_graph()
@@ -14,9 +14,11 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import numpy as np
 import pytest
-from stellargraph.data.explorer import UniformRandomWalk
-from ..test_utils.graphs import create_test_graph
+from stellargraph.data.explorer import GraphWalk, UniformRandomWalk
+from stellargraph.core.graph import StellarGraph
+from ..test_utils.graphs import create_test_graph, create_test_graph_nx
 
 
 class TestUniformRandomWalk(object):
@@ -222,6 +224,117 @@ class TestUniformRandomWalk(object):
             for node in subgraph:
                 assert node == "self loner"  # all nodes should be the same node
 
+    @pytest.mark.parametrize("backend", ["networkx", "csr"])
+    def test_walk_generation_batched(self, backend):
+        g = StellarGraph(create_test_graph_nx(), backend=backend)
+        urw = UniformRandomWalk(g)
+
+        nodes = ["0", "loner", "self loner", 5]
+        walks = urw.run(nodes=nodes, n=3, length=6, seed=42, batched=True)
+
+        assert walks.shape == (12, 6)
+        np.testing.assert_array_equal(walks[:, 0], np.repeat(g.ids_to_index(nodes), 3))
+
+        # the loner has no neighbours, so the walk stops and is padded
+        assert (walks[3:6, 1:] == -1).all()
+        # the self loner can only walk to itself
+        assert (walks[6:9] == g.ids_to_index(["self loner"])).all()
+
+        for walk in walks:
+            for current, following in zip(walk[:-1], walk[1:]):
+                if following != -1:
+                    assert following in g.neighbors(current, use_index=True)
+
+        # the same seed gives the same walks, and the roots can be given as indices
+        roots = g.ids_to_index(nodes)
+        np.testing.assert_array_equal(
+            urw.run(nodes=roots, n=3, length=6, seed=42, use_index=True, batched=True),
+            walks,
+        )
+
+        with pytest.raises(ValueError, match=r"unknown IDs: \['unknown'\]"):
+            urw.run(nodes=["unknown"], n=1, length=2, batched=True)
+
+    @pytest.mark.parametrize("backend", ["networkx", "csr"])
+    @pytest.mark.parametrize("batched", [False, True])
+    def test_workers(self, monkeypatch, backend, batched):
+        # use several shards, even for this small graph
+        monkeypatch.setattr(GraphWalk, "_SHARD_SIZE", 3)
+
+        g = StellarGraph(create_test_graph_nx(), backend=backend)
+        urw = UniformRandomWalk(g)
+        nodes = list(g.nodes())
+        kwargs = dict(nodes=nodes, n=2, length=5, seed=1, batched=batched)
+
+        walks = urw.run(workers=1, **kwargs)
+        assert len(walks) == 2 * len(nodes)
+        if batched:
+            np.testing.assert_array_equal(urw.run(workers=2, **kwargs), walks)
+        else:
+            assert [walk[0] for walk in walks] == [
+                node for node in nodes for _ in range(2)
+            ]
+            assert urw.run(workers=2, **kwargs) == walks
+
+        with pytest.raises(ValueError, match="workers, should be a positive integer"):
+            urw.run(nodes=nodes, n=1, length=2, workers=0)
+
+    @pytest.mark.parametrize("batched", [False, True])
+    def test_run_iter(self, monkeypatch, batched):
+        monkeypatch.setattr(GraphWalk, "_SHARD_SIZE", 3)
+
+        g = create_test_graph()
+        urw = UniformRandomWalk(g)
+        nodes = list(g.nodes())
+        walks = urw.run_iter(
+            nodes, n=2, length=5, chunk_size=3, seed=1, batched=batched
+        )
+
+        chunks = list(walks)
+        assert [len(chunk) for chunk in chunks] == [6, 6, 6, 6, 2]
+        # every pass yields the same walks, which are those of `run` with workers
+        for chunk, again in zip(chunks, walks):
+            np.testing.assert_array_equal(chunk, again)
+
+        expected = urw.run(
+            nodes=nodes, n=2, length=5, seed=1, workers=1, batched=batched
+        )
+        if batched:
+            np.testing.assert_array_equal(np.concatenate(chunks), expected)
+        else:
+            assert list(walks.sentences()) == [
+                [str(node) for node in walk] for walk in expected
+            ]
+
+        for chunk in urw.run_iter(nodes[:8], n=1, length=2, chunk_size=2, workers=2):
+            assert chunk.shape == (2, 2)
+
+        with pytest.raises(
+            ValueError, match="chunk_size, should be a positive integer"
+        ):
+            urw.run_iter(nodes, n=1, length=2, chunk_size=0)
+
+    def test_run_iter_word2vec(self):
+        from gensim.models import Word2Vec
+
+        g = create_test_graph()
+        walks = UniformRandomWalk(g).run_iter(g.nodes(), n=5, length=4, chunk_size=2)
+        model = Word2Vec(walks.sentences(), min_count=1, window=2)
+        # nodes without neighbours still start walks
+        assert set(model.wv.index_to_key) == {str(node) for node in g.nodes()}
+
+    def test_batched_uniform_distribution(self):
+        g = create_test_graph()
+        urw = UniformRandomWalk(g)
+
+        # "0" has neighbours 1, 2 and itself
+        walks = urw.run(nodes=["0"], n=3000, length=2, seed=0, batched=True)
+        next_nodes, counts = np.unique(walks[:, 1], return_counts=True)
+        np.testing.assert_array_equal(
+            np.sort(next_nodes), np.sort(g.ids_to_index(["0", 1, 2]))
+        )
+        assert (np.abs(counts / 3000 - 1 / 3) < 0.05).all()
+
     def test_benchmark_uniformrandomwalk(self, benchmark):
 
         g = create_test_graph()
@@ -0,0 +1,88 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright 2020 Data61, CSIRO
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import numpy as np
+import pytest
+
+from stellargraph.data import (
+    BiasedRandomWalk,
+    UniformRandomMetaPathWalk,
+    WalkCorpus,
+    load_walks,
+    save_walks,
+)
+from ..test_utils.graphs import create_test_graph, example_hin_1
+
+
+@pytest.mark.parametrize("mmap", [False, True])
+def test_save_load_biased(tmpdir, mmap):
+    g = create_test_graph()
+    walks = BiasedRandomWalk(g).run_iter(
+        g.nodes(), n=2, length=4, p=0.5, q=2.0, chunk_size=4, seed=1, batched=True
+    )
+    save_walks(walks, str(tmpdir))
+
+    corpus = load_walks(str(tmpdir), mmap=mmap)
+    assert isinstance(corpus.nodes, np.memmap) == mmap
+    assert corpus.nodes.dtype == np.int32
+
+    expected = list(walks.sentences())
+    assert len(corpus) == len(expected)
+    assert [
+        [str(node) for node in corpus.index_to_ids(walk)] for walk in corpus
+    ] == expected
+    assert list(corpus.sentences()) == expected
+
+    # each shuffled pass has every walk once, in a different order
+    sentences = corpus.sentences(shuffle=True, seed=0)
+    first = list(sentences)
+    second = list(sentences)
+    assert sorted(first) == sorted(second) == sorted(expected)
+    assert first != second
+    assert list(corpus.sentences(shuffle=True, seed=0)) == first
+
+
+def test_save_load_metapath(tmpdir):
+    g = example_hin_1()
+    metapaths = [["A", "B", "A"], ["B", "A", "B"]]
+    walks = UniformRandomMetaPathWalk(g).run_iter(
+        list(g.nodes()), n=3, length=6, metapaths=metapaths, chunk_size=2
+    )
+    save_walks(walks, str(tmpdir))
+
+    corpus = load_walks(str(tmpdir))
+    assert list(corpus.sentences()) == list(walks.sentences())
+    # walks are stored without padding
+    assert len(corpus.nodes) == sum(len(walk) for walk in corpus)
+
+
+def test_save_array(tmpdir):
+    g = create_test_graph()
+    walks = np.array([[0, 1, -1], [2, 2, 2]])
+    with pytest.raises(ValueError, match="graph: expected the graph that was walked"):
+        save_walks(walks, str(tmpdir))
+
+    save_walks(walks, str(tmpdir), graph=g)
+    corpus = load_walks(str(tmpdir))
+    np.testing.assert_array_equal(corpus[0], [0, 1])
+    np.testing.assert_array_equal(corpus[-1], [2, 2, 2])
+    with pytest.raises(IndexError):
+        corpus[2]
+
+
+def test_walk_corpus_invalid():
+    with pytest.raises(ValueError, match="offsets: expected an array starting at 0"):
+        WalkCorpus(np.arange(3), np.array([0, 2]), np.array(["a", "b", "c"]))
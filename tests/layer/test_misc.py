@@ -22,9 +22,13 @@ GCN tests
 import tensorflow as tf
 from tensorflow import keras
 import numpy as np
+import pandas as pd
 import scipy.sparse as sps
 import pytest
 from stellargraph.layer.misc import *
+from stellargraph import StellarGraph, IndexedArray
+from stellargraph.layer import GCN, GAT, APPNP, PPNP
+from stellargraph.mapper import FullBatchNodeGenerator
 
 
 def sparse_matrix_example(N=10, density=0.1):
@@ -105,3 +109,45 @@ def test_squeezedsparseconversion_axis():
     z = model.predict([A_indices, A_values])
 
     assert np.allclose(z, A.sum(axis=1), atol=1e-7)
+
+
+@pytest.mark.parametrize(
+    "model_and_method",
+    [("gcn", "gcn"), ("gat", "gat"), ("appnp", "gcn"), ("ppnp", "ppnp")],
+)
+def test_sparse_node_features(model_and_method):
+    model_name, method = model_and_method
+    features = sps.random(5, 4, density=0.3, format="csr", random_state=0)
+    edges = pd.DataFrame({"source": [0, 1, 2, 3], "target": [1, 2, 3, 4]})
+
+    def build(node_features):
+        G = StellarGraph(nodes=IndexedArray(node_features), edges=edges)
+        generator = FullBatchNodeGenerator(G, method=method, sparse=method != "ppnp")
+        if model_name == "gcn":
+            model = GCN([3], generator)
+        elif model_name == "gat":
+            model = GAT([3], generator, attn_heads=1)
+        elif model_name == "appnp":
+            model = APPNP([3], ["relu"], generator)
+        else:
+            model = PPNP([3], ["relu"], generator)
+        x_in, x_out = model.node_model()
+        return generator, keras.Model(inputs=x_in, outputs=x_out)
+
+    sparse_gen, sparse_model = build(features)
+    dense_gen, dense_model = build(features.toarray())
+    assert sparse_gen.sparse_features
+    assert not dense_gen.sparse_features
+    sparse_model.set_weights(dense_model.get_weights())
+
+    # the feature indices and values replace the dense features
+    sparse_inputs, _ = sparse_gen.flow([0, 3])[0]
+    dense_inputs, _ = dense_gen.flow([0, 3])[0]
+    assert len(sparse_inputs) == len(dense_inputs) + 1
+    for sparse_input, dense_input in zip(sparse_inputs[2:], dense_inputs[1:]):
+        np.testing.assert_array_equal(sparse_input, dense_input)
+
+    # call the models directly, to run them on exactly these inputs
+    np.testing.assert_allclose(
+        sparse_model(sparse_inputs), dense_model(dense_inputs), rtol=1e-5
+    )
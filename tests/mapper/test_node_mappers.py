@@ -21,6 +21,7 @@ Mapper tests:
 """
 from stellargraph.core.graph import *
 from stellargraph.core.graph_networkx import NetworkXStellarGraph
+from stellargraph.core.indexed_array import IndexedArray
 from stellargraph.mapper import *
 
 import networkx as nx
@@ -188,6 +189,20 @@ def test_nodemapper_1():
         GraphSAGENodeGenerator(G1, batch_size=2, num_samples=[2, 2]).flow(["A", "B"])
 
 
+def test_nodemapper_sparse_features():
+    features = sps.random(4, 3, density=0.5, format="csr", random_state=0)
+    G = StellarGraph(
+        nodes=IndexedArray(features),
+        edges=pd.DataFrame({"source": [0, 1, 2], "target": [1, 2, 3]}),
+    )
+
+    # the sampled features are small, and so are converted to dense arrays
+    nf, _ = GraphSAGENodeGenerator(G, batch_size=2, num_samples=[2]).flow([3, 0])[0]
+    assert isinstance(nf[0], np.ndarray)
+    np.testing.assert_array_equal(nf[0][:, 0, :], features[[3, 0]].toarray())
+    assert nf[1].shape == (2, 2, 3)
+
+
 def test_nodemapper_shuffle():
     n_feat = 1
     n_batch = 2
@@ -845,6 +860,27 @@ class Test_FullBatchNodeGenerator:
         A = G.to_adjacency_matrix().toarray()
         assert np.array_equal(A.dot(A), generator.Aadj.toarray())
 
+    def test_generator_sparse_features(self):
+        features = sps.random(3, 4, density=0.4, format="csr", random_state=0)
+        G = StellarGraph(
+            nodes=IndexedArray(features, index=["a", "b", "c"]),
+            edges=pd.DataFrame({"source": ["a", "b"], "target": ["b", "c"]}),
+        )
+        generator = FullBatchNodeGenerator(G, method="gcn")
+        assert generator.sparse_features
+        assert sps.issparse(generator.features)
+
+        # the features are supplied as indices and values, before the other inputs
+        [X_ind, X_val, tind, A_ind, A_val], _ = generator.flow(["c", "a"])[0]
+        X = sps.coo_matrix((X_val[0], (X_ind[0, :, 0], X_ind[0, :, 1])), shape=(3, 4))
+        np.testing.assert_array_equal(X.toarray(), features.toarray())
+        np.testing.assert_array_equal(tind, [[2, 0]])
+
+        [X_ind, X_val, tind, A], _ = FullBatchNodeGenerator(
+            G, method="gcn", sparse=False
+        ).flow(["b"])[0]
+        assert A.shape == (1, 3, 3)
+
     def test_generator_methods(self):
         node_ids = list(self.G.nodes())
         Aadj = self.G.to_adjacency_matrix().toarray()